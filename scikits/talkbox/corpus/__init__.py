@@ -0,0 +1,9 @@
+__all__ = []
+
+import store
+from store import FeatureStore
+__all__ += ['FeatureStore']
+
+import extract
+from extract import extract_corpus, compute_features
+__all__ += ['extract_corpus', 'compute_features']
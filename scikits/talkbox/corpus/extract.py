@@ -0,0 +1,201 @@
+"""Feature extraction over a corpus of audio files, with a process pool."""
+
+import warnings
+import multiprocessing
+
+import numpy as np
+from scipy.io import wavfile
+from scipy.signal import get_window
+
+from scikits.talkbox.tools import segment_axis
+from scikits.talkbox.tools.fftutils import rfft_power
+from scikits.talkbox.tools.dtypes import floating_dtype
+from scikits.talkbox.features.mfcc import mfcc
+from scikits.talkbox.linpred.levinson_lpc import lpc_frames
+
+from store import FeatureStore
+
+__all__ = ['extract_corpus', 'compute_features']
+
+def _frames(x, spec):
+    nwin = spec.get('nwin', 256)
+    hop = spec.get('hop', nwin / 2)
+    w = get_window(spec.get('window', 'hamming'), nwin)
+    return segment_axis(x, nwin, nwin - hop) * w
+
+def _mfcc_features(x, fs, spec):
+    return mfcc(x, nwin=spec.get('nwin', 256), nfft=spec.get('nfft', 512),
+                fs=fs, nceps=spec.get('nceps', 13), outputs='ceps',
+                dtype=spec.get('dtype'))
+
+def _lpc_features(x, fs, spec):
+    # Same frames as _frames, without storing the windowed frames
+    nwin = spec.get('nwin', 256)
+    return lpc_frames(x, nwin, spec.get('hop', nwin / 2),
+                      spec.get('order', 12),
+                      window=spec.get('window', 'hamming'),
+                      dtype=spec.get('dtype'))[0]
+
+def _periodogram_features(x, fs, spec):
+    framed = _frames(x, spec)
+    nfft = spec.get('nfft', framed.shape[-1])
+    # Same normalization as spectral.basic.periodogram, for each frame
+    pxx = rfft_power(framed, nfft)
+    pxx /= framed.shape[-1] * fs
+    return pxx
+
+_FEATURES = {'mfcc': _mfcc_features, 'lpc': _lpc_features,
+             'periodogram': _periodogram_features}
+
+# Number of features per frame of each kind, and their dtype
+_SIZES = {'mfcc': lambda spec: spec.get('nceps', 13),
+          'lpc': lambda spec: spec.get('order', 12) + 1,
+          'periodogram': lambda spec: spec.get('nfft',
+                                               spec.get('nwin', 256)) / 2 + 1}
+_DTYPES = {'mfcc': lambda spec: floating_dtype(spec.get('dtype')),
+           'lpc': lambda spec: floating_dtype(spec.get('dtype')),
+           'periodogram': lambda spec: np.dtype(np.float64)}
+
+def compute_features(x, fs, spec):
+    """Compute the features of a signal from a feature specification.
+
+    Parameters
+    ----------
+    x : ndarray
+        signal (rank 1).
+    fs : float
+        sampling rate.
+    spec : dict
+        feature specification. spec['kind'] is one of 'mfcc', 'lpc' or
+        'periodogram', and the other items are the parameters:
+
+            - mfcc: nwin, nfft, nceps, dtype (see features.mfcc).
+            - lpc: nwin, hop, window, order, dtype. Returns the order + 1
+              LPC coefficients of each frame.
+            - periodogram: nwin, hop, window, nfft. Returns the one-sided
+              periodogram of each frame.
+
+        Missing parameters take the default values of the corresponding
+        function; the default hop is half a window, and the default window
+        a hamming window.
+
+    Returns
+    -------
+    features : ndarray
+        the features, one frame per row. Only complete frames are analysed:
+        a signal shorter than nwin has no frame, and gives a (0, nfeatures)
+        array."""
+    try:
+        func = _FEATURES[spec['kind']]
+    except KeyError:
+        raise ValueError("feature kind %s not understood" % spec.get('kind'))
+    if x.size < spec.get('nwin', 256):
+        return np.empty((0, _SIZES[spec['kind']](spec)),
+                        _DTYPES[spec['kind']](spec))
+    return func(x, fs, spec)
+
+def _normalize_spec(spec):
+    """Return spec with python literals only as values, to be saved in a
+    FeatureStore: arrays and numpy scalars as python objects, and the dtype as
+    its name."""
+    normalized = {}
+    for k, v in spec.items():
+        if k == 'dtype' and v is not None:
+            v = np.dtype(v).name
+        elif isinstance(v, (np.ndarray, np.generic)):
+            v = v.tolist()
+        normalized[k] = v
+    return normalized
+
+def _read_wav(filename):
+    """Read a wav file as a float signal in [-1, 1], averaging the channels
+    of multi-channel files."""
+    fs, x = wavfile.read(filename)
+    if x.dtype.kind in 'iu':
+        scale = 2. ** (8 * x.dtype.itemsize - 1)
+        if x.dtype.kind == 'u':
+            x = (x - scale) / scale
+        else:
+            x = x / scale
+    if x.ndim > 1:
+        x = np.mean(x, axis=-1)
+    return fs, x
+
+def _extract_one(args):
+    """Return the features of one file, or None and the error message if
+    they cannot be computed (unreadable file, ...)."""
+    filename, spec = args
+    try:
+        fs, x = _read_wav(filename)
+        return filename, compute_features(x, fs, spec), None
+    except Exception, e:
+        return filename, None, "%s: %s" % (e.__class__.__name__, e)
+
+def _append(store, filename, features, error):
+    if error is None:
+        store.append(filename, features)
+    else:
+        warnings.warn("Could not extract the features of %s (%s), skipping "
+                      "it" % (filename, error))
+
+def extract_corpus(filenames, path, spec, n_jobs=None, chunksize=1):
+    """Extract features from a list of wav files into a feature store.
+
+    Parameters
+    ----------
+    filenames : sequence
+        paths of the wav files. They are used as keys in the store.
+    path : str
+        directory of the feature store (see FeatureStore).
+    spec : dict
+        feature specification (see compute_features).
+    n_jobs : int or None
+        number of worker processes. None means one per cpu, and 1 extracts
+        the features in the calling process.
+    chunksize : int
+        number of files sent to a worker at once.
+
+    Returns
+    -------
+    store : FeatureStore
+        the feature store.
+
+    Notes
+    -----
+    Only the calling process writes into the store, in completion order. The
+    extraction is resumable: files already in the store are skipped, so that
+    calling extract_corpus again with the same arguments after a crash only
+    processes the remaining files. The spec is saved in the store, and
+    resuming with a different spec raises a ValueError.
+
+    A file whose features cannot be computed (e.g. an invalid wav file) is
+    skipped with a warning, and not added to the store: the other files are
+    still processed."""
+    if not spec.get('kind') in _FEATURES:
+        raise ValueError("feature kind %s not understood" % spec.get('kind'))
+    store = FeatureStore(path, spec=_normalize_spec(spec))
+    todo = []
+    seen = set()
+    for f in filenames:
+        if not (f in store or f in seen):
+            todo.append((f, spec))
+            seen.add(f)
+    if not todo:
+        return store
+
+    if n_jobs == 1:
+        for args in todo:
+            _append(store, *_extract_one(args))
+    else:
+        pool = multiprocessing.Pool(n_jobs)
+        try:
+            for res in pool.imap_unordered(_extract_one, todo, chunksize):
+                _append(store, *res)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    return store
@@ -0,0 +1,244 @@
+"""Append-only, memory-mapped feature store.
+
+A store is a directory with three files:
+
+    - header: the number of features per frame and their dtype, and the
+      optional specification of the features (see FeatureStore).
+    - data: the features of every item, as one raw (nframes, nfeatures)
+      array, in C order.
+    - index: one line 'nframes<TAB>key' per item, in the order of data.
+
+Items are only ever appended: the data are written and synced first, and the
+index line last, so that an item is in the index only if its data are
+complete. When a store is opened after a crash, anything beyond the last
+complete index entry is discarded, and appending can resume from there."""
+
+import os
+from ast import literal_eval
+
+import numpy as np
+
+__all__ = ['FeatureStore']
+
+def _is_literal(value):
+    """Whether value is saved and read back unchanged through its repr."""
+    try:
+        return literal_eval(repr(value)) == value
+    except (ValueError, SyntaxError):
+        return False
+
+class FeatureStore(object):
+    """Append-only feature store, with memory-mapped access to the data.
+
+    Parameters
+    ----------
+    path : str
+        directory of the store. It is created if it does not exist, and
+        reopened (for reading and appending) otherwise.
+    sync : bool
+        if True (default), data and index are synced to disk after each
+        append, so that a crash cannot lose an item which is in the index.
+    spec : dict, optional
+        description of the features (e.g. the parameters of their
+        extraction), made of python literals only. It is saved in the header
+        of a new store, and must be the same as the saved one when an existing
+        store is reopened, to prevent appending incompatible features: a
+        ValueError is raised otherwise. None (default) skips the check; the
+        saved spec is available as the spec attribute.
+
+    Examples
+    --------
+    >>> store = FeatureStore('features')
+    >>> store.append('a.wav', ceps)
+    >>> 'a.wav' in store
+    True
+    >>> store['a.wav']          # memory-mapped (nframes, nfeatures) array
+    >>> store.data              # every frame of the store"""
+    def __init__(self, path, sync=True, spec=None):
+        self.path = path
+        self.sync = sync
+
+        if spec is not None and not _is_literal(spec):
+            raise ValueError("spec should only contain python literals")
+
+        self.nfeatures = None
+        self.dtype = None
+        self.spec = None
+        self._keys = []
+        self._nframes = []
+        self._positions = {}
+        self._offsets = None
+        self._map = None
+
+        if not os.path.exists(path):
+            os.makedirs(path)
+        self._header = os.path.join(path, 'header')
+        self._data = os.path.join(path, 'data')
+        self._index = os.path.join(path, 'index')
+
+        if os.path.exists(self._header):
+            self._read_header()
+            self._recover()
+
+        if spec is not None and spec != self.spec:
+            if self.spec is not None or len(self) > 0:
+                raise ValueError("Store %s was created with the spec %r, not "
+                                 "%r" % (path, self.spec, spec))
+            self.spec = spec
+            if self.nfeatures is not None:
+                self._write_header()
+
+    def _read_header(self):
+        f = open(self._header)
+        try:
+            lines = f.read().split('\n')
+        finally:
+            f.close()
+        nfeatures, dtype = lines[0].split()
+        self.nfeatures = int(nfeatures)
+        self.dtype = np.dtype(dtype)
+        if len(lines) > 1 and lines[1]:
+            self.spec = literal_eval(lines[1])
+
+    def _write_header(self):
+        f = open(self._header, 'w')
+        try:
+            f.write("%d %s\n" % (self.nfeatures, self.dtype.str))
+            if self.spec is not None:
+                f.write("%r\n" % (self.spec,))
+        finally:
+            f.close()
+
+    def _recover(self):
+        """Load the index, and discard whatever was written after its last
+        complete entry."""
+        if os.path.exists(self._index):
+            f = open(self._index, 'rb')
+            try:
+                content = f.read()
+            finally:
+                f.close()
+        else:
+            content = ''
+
+        # An interrupted append may leave an incomplete last line
+        end = content.rfind('\n') + 1
+        # Only '\n' terminates the entries: keys may contain '\r' and other
+        # line boundaries of splitlines
+        for line in content[:end].split('\n')[:-1]:
+            nframes, key = line.split('\t', 1)
+            self._add_entry(key, int(nframes))
+        if end < len(content):
+            f = open(self._index, 'r+b')
+            try:
+                f.truncate(end)
+            finally:
+                f.close()
+
+        size = self.nframes * self._rowbytes
+        if os.path.exists(self._data):
+            datasize = os.path.getsize(self._data)
+        else:
+            datasize = 0
+        if datasize < size:
+            raise IOError("Data file of store %s is shorter than its index"
+                          % self.path)
+        elif datasize > size:
+            f = open(self._data, 'r+b')
+            try:
+                f.truncate(size)
+            finally:
+                f.close()
+
+    def _add_entry(self, key, nframes):
+        self._positions[key] = len(self._keys)
+        self._keys.append(key)
+        self._nframes.append(nframes)
+        self._offsets = None
+        self._map = None
+
+    @property
+    def _rowbytes(self):
+        return self.nfeatures * self.dtype.itemsize
+
+    @property
+    def nframes(self):
+        """Total number of frames in the store."""
+        return sum(self._nframes)
+
+    @property
+    def offsets(self):
+        """Frame offsets of the items: the frames of the i-th item are
+        data[offsets[i]:offsets[i+1]]."""
+        if self._offsets is None:
+            self._offsets = np.zeros(len(self._nframes) + 1, np.intp)
+            np.cumsum(self._nframes, out=self._offsets[1:])
+        return self._offsets
+
+    @property
+    def data(self):
+        """Memory-mapped (nframes, nfeatures) array of every frame."""
+        if self._map is None:
+            if self.nfeatures is None or self.nframes == 0:
+                return np.empty((0, self.nfeatures or 0), self.dtype)
+            self._map = np.memmap(self._data, self.dtype, 'r',
+                                  shape=(self.nframes, self.nfeatures))
+        return self._map
+
+    def keys(self):
+        """Return the list of keys, in the order they were appended."""
+        return list(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __getitem__(self, key):
+        i = self._positions[key]
+        return self.data[self.offsets[i]:self.offsets[i+1]]
+
+    def append(self, key, features):
+        """Append the features of a new item.
+
+        Parameters
+        ----------
+        key : str
+            name of the item (typically the path of the audio file). It must
+            not be in the store already, and cannot contain newlines.
+        features : ndarray
+            features of the item, of shape (nframes, nfeatures). The first
+            appended item sets nfeatures and the dtype of the store."""
+        if key in self._positions:
+            raise ValueError("Key %s already in the store" % key)
+        if '\n' in key:
+            raise ValueError("Keys cannot contain newlines")
+
+        features = np.atleast_2d(features)
+        if features.ndim != 2:
+            raise ValueError("Features should be of rank 2")
+        if self.nfeatures is None:
+            self.nfeatures = features.shape[1]
+            self.dtype = features.dtype
+            self._write_header()
+        elif features.shape[1] != self.nfeatures:
+            raise ValueError("Expected %d features per frame, got %d" %
+                             (self.nfeatures, features.shape[1]))
+        features = np.ascontiguousarray(features, self.dtype)
+
+        # Data first, index last: an item is in the index only if its data
+        # are complete
+        self._write(self._data, features.tostring())
+        self._write(self._index, "%d\t%s\n" % (features.shape[0], key))
+        self._add_entry(key, features.shape[0])
+
+    def _write(self, filename, content):
+        f = open(filename, 'ab')
+        try:
+            f.write(content)
+            f.flush()
+            if self.sync:
+                os.fsync(f.fileno())
+        finally:
+            f.close()
@@ -0,0 +1,122 @@
+import os
+import shutil
+import warnings
+import tempfile
+
+import numpy as np
+from numpy.testing import TestCase, assert_array_equal, \
+                          assert_array_almost_equal
+
+from scipy.io import wavfile
+
+from scikits.talkbox.features.mfcc import mfcc
+from scikits.talkbox.linpred.levinson_lpc import lpc
+from scikits.talkbox.tools import segment_axis
+from scikits.talkbox.corpus.extract import extract_corpus, compute_features
+from scikits.talkbox.corpus.store import FeatureStore
+
+class TestExtractCorpus(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        np.random.seed(0)
+        self.signals = []
+        self.filenames = []
+        for i, n in enumerate([4000, 1000, 8000]):
+            x = (np.random.randn(n) * 3000).astype(np.int16)
+            filename = os.path.join(self.path, '%d.wav' % i)
+            wavfile.write(filename, 16000, x)
+            self.signals.append(x / 32768.)
+            self.filenames.append(filename)
+        self.store = os.path.join(self.path, 'store')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _check(self, store, spec):
+        assert store.keys() == self.filenames
+        for filename, x in zip(self.filenames, self.signals):
+            assert_array_almost_equal(store[filename],
+                                      compute_features(x, 16000, spec))
+
+    def test_mfcc(self):
+        spec = {'kind': 'mfcc', 'nceps': 13}
+        store = extract_corpus(self.filenames, self.store, spec, n_jobs=1)
+        self._check(store, spec)
+        assert_array_almost_equal(store[self.filenames[0]],
+                                  mfcc(self.signals[0])[0])
+
+    def test_pool(self):
+        spec = {'kind': 'lpc', 'nwin': 400, 'hop': 160, 'order': 12}
+        store = extract_corpus(self.filenames, self.store, spec, n_jobs=2)
+        assert sorted(store.keys()) == sorted(self.filenames)
+        for filename, x in zip(self.filenames, self.signals):
+            frames = segment_axis(x, 400, 240) * np.hamming(401)[:-1]
+            assert_array_almost_equal(store[filename], lpc(frames, 12)[0])
+
+    def test_resume(self):
+        spec = {'kind': 'periodogram', 'nwin': 256, 'nfft': 512}
+        extract_corpus(self.filenames[:2], self.store, spec, n_jobs=1)
+        store = extract_corpus(self.filenames, self.store, spec, n_jobs=1)
+        self._check(store, spec)
+
+    def test_bad_spec(self):
+        self.assertRaises(ValueError, compute_features, self.signals[0],
+                          16000, {'kind': 'plp'})
+
+    def test_resume_spec(self):
+        """Test resuming with another spec of the same width fails."""
+        spec = {'kind': 'mfcc', 'nceps': 13, 'dtype': np.float64}
+        extract_corpus(self.filenames[:2], self.store, spec, n_jobs=1)
+        self.assertRaises(ValueError, extract_corpus, self.filenames,
+                          self.store, {'kind': 'lpc', 'order': 12}, n_jobs=1)
+        self.assertRaises(ValueError, extract_corpus, self.filenames,
+                          self.store, {'kind': 'mfcc', 'nceps': 13,
+                                       'dtype': np.float32}, n_jobs=1)
+        assert FeatureStore(self.store).keys() == self.filenames[:2]
+
+        spec['dtype'] = 'float64'
+        store = extract_corpus(self.filenames, self.store, spec, n_jobs=1)
+        self._check(store, spec)
+
+    def test_short(self):
+        """Test files shorter than a frame give no frame."""
+        x = (np.random.randn(100) * 3000).astype(np.int16)
+        short = os.path.join(self.path, 'short.wav')
+        wavfile.write(short, 16000, x)
+        self.filenames.insert(1, short)
+        self.signals.insert(1, x / 32768.)
+        for spec, n in [({'kind': 'mfcc', 'nceps': 13}, 13),
+                        ({'kind': 'periodogram', 'nwin': 256}, 129),
+                        ({'kind': 'lpc', 'order': 12}, 13)]:
+            assert compute_features(x / 32768., 16000, spec).shape == (0, n)
+            for n_jobs in [1, 2]:
+                path = os.path.join(self.path, '%s%d' % (spec['kind'],
+                                                         n_jobs))
+                store = extract_corpus(self.filenames, path, spec,
+                                       n_jobs=n_jobs)
+                assert sorted(store.keys()) == sorted(self.filenames)
+                assert store[short].shape == (0, n)
+                assert_array_almost_equal(store[self.filenames[0]],
+                        compute_features(self.signals[0], 16000, spec))
+
+    def test_bad_file(self):
+        """Test an unreadable file is skipped with a warning."""
+        bad = os.path.join(self.path, 'bad.wav')
+        f = open(bad, 'wb')
+        f.write('not a wav file')
+        f.close()
+        spec = {'kind': 'mfcc', 'nceps': 13}
+        for n_jobs in [1, 2]:
+            path = os.path.join(self.path, 'store%d' % n_jobs)
+            w = warnings.catch_warnings(record=True)
+            log = w.__enter__()
+            try:
+                warnings.simplefilter('always')
+                store = extract_corpus([bad] + self.filenames, path, spec,
+                                       n_jobs=n_jobs)
+            finally:
+                w.__exit__()
+            assert len(log) == 1 and bad in str(log[0].message)
+            assert sorted(store.keys()) == sorted(self.filenames)
+        self.assertRaises(ValueError, extract_corpus, self.filenames,
+                          self.store, {'kind': 'plp'})
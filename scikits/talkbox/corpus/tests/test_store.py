@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import TestCase, assert_array_equal
+
+from scikits.talkbox.corpus.store import FeatureStore
+
+class TestFeatureStore(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        np.random.seed(0)
+        self.items = [('a', np.random.randn(10, 3)),
+                      ('b', np.random.randn(0, 3)),
+                      ('c', np.random.randn(4, 3))]
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _fill(self, store):
+        for key, features in self.items:
+            store.append(key, features)
+
+    def test_simple(self):
+        store = FeatureStore(self.path)
+        self._fill(store)
+        assert len(store) == 3
+        assert store.keys() == ['a', 'b', 'c']
+        assert store.nframes == 14
+        assert_array_equal(store.offsets, [0, 10, 10, 14])
+        for key, features in self.items:
+            assert key in store
+            assert_array_equal(store[key], features)
+        assert_array_equal(store.data,
+                           np.concatenate([f for k, f in self.items]))
+
+    def test_reopen(self):
+        self._fill(FeatureStore(self.path))
+        store = FeatureStore(self.path)
+        assert store.keys() == ['a', 'b', 'c']
+        assert store.dtype == np.float64
+        assert_array_equal(store['c'], self.items[2][1])
+
+        store.append('d', np.ones((2, 3)))
+        assert_array_equal(FeatureStore(self.path)['d'], np.ones((2, 3)))
+
+    def test_spec(self):
+        """Test the spec is saved, and checked when the store is reopened."""
+        spec = {'kind': 'mfcc', 'nceps': 3, 'window': ('kaiser', 4.)}
+        store = FeatureStore(self.path, spec=spec)
+        assert store.spec == spec
+        self._fill(store)
+        assert FeatureStore(self.path).spec == spec
+        store = FeatureStore(self.path, spec=dict(spec))
+        assert store.keys() == ['a', 'b', 'c']
+        self.assertRaises(ValueError, FeatureStore, self.path,
+                          spec={'kind': 'lpc', 'order': 2})
+
+        # A store without spec cannot be checked
+        path = os.path.join(self.path, 'nospec')
+        self._fill(FeatureStore(path))
+        assert FeatureStore(path).spec is None
+        self.assertRaises(ValueError, FeatureStore, path, spec=spec)
+
+        self.assertRaises(ValueError, FeatureStore, path,
+                          spec={'window': np.ones(3)})
+        self.assertRaises(ValueError, FeatureStore, path,
+                          spec={'window': np.hamming})
+
+    def test_special_keys(self):
+        """Test keys with line boundaries other than newline are reloaded."""
+        keys = ['dir\\file.wav\r', 'a\x0bb', 'c\x1cd', 'e\x85f']
+        store = FeatureStore(self.path)
+        for i, key in enumerate(keys):
+            store.append(key, i * np.ones((2, 3)))
+        store = FeatureStore(self.path)
+        assert store.keys() == keys
+        for i, key in enumerate(keys):
+            assert_array_equal(store[key], i * np.ones((2, 3)))
+
+    def test_bad_append(self):
+        store = FeatureStore(self.path)
+        self._fill(store)
+        self.assertRaises(ValueError, store.append, 'a', np.ones((2, 3)))
+        self.assertRaises(ValueError, store.append, 'd', np.ones((2, 4)))
+
+    def test_recover(self):
+        """Test a store interrupted in the middle of an append is usable."""
+        self._fill(FeatureStore(self.path))
+
+        # Simulate a crash while appending item d: partial data and index
+        f = open(os.path.join(self.path, 'data'), 'ab')
+        f.write(np.ones((2, 3)).tostring()[:30])
+        f.close()
+        f = open(os.path.join(self.path, 'index'), 'ab')
+        f.write('2\td')
+        f.close()
+
+        store = FeatureStore(self.path)
+        assert store.keys() == ['a', 'b', 'c']
+        assert not 'd' in store
+        store.append('d', np.ones((2, 3)))
+
+        store = FeatureStore(self.path)
+        assert store.keys() == ['a', 'b', 'c', 'd']
+        assert_array_equal(store['c'], self.items[2][1])
+        assert_array_equal(store['d'], np.ones((2, 3)))
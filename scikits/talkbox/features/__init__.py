@@ -1,5 +1,9 @@
 from scikits.talkbox.features.mel import mel2hz, hz2mel
 __all__  = ['mel2hz', 'hz2mel']
 
-from scikits.talkbox.features.mfcc import mfcc
-__all__ += ['mfcc']
+from scikits.talkbox.features.mfcc import mfcc, mfcc_batch, MFCCExtractor, \
+        StreamingMFCC
+__all__ += ['mfcc', 'mfcc_batch', 'MFCCExtractor', 'StreamingMFCC']
+
+from scikits.talkbox.features.deltas import deltas, StreamingDeltas
+__all__ += ['deltas', 'StreamingDeltas']
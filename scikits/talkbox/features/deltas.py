@@ -0,0 +1,201 @@
+"""Regression (delta) coefficients of cepstral features."""
+
+import numpy as np
+
+__all__ = ['deltas', 'StreamingDeltas']
+
+def _regression(padded, width, out, tmp):
+    """Compute the regression coefficients of padded (whose width first and
+    last rows are the context) into out, using tmp as scratch space.
+
+    out and tmp must be of shape (padded.shape[0] - 2 * width, ncoeffs)."""
+    n = out.shape[0]
+    np.subtract(padded[width+1:width+1+n], padded[width-1:width-1+n], out)
+    for theta in range(2, width + 1):
+        np.subtract(padded[width+theta:width+theta+n],
+                    padded[width-theta:width-theta+n], tmp)
+        tmp *= theta
+        out += tmp
+    out /= 2. * np.sum(np.arange(1, width + 1) ** 2)
+
+def deltas(ceps, width=2, order=2, out=None):
+    """Compute the static, delta and delta-delta coefficients of a sequence of
+    feature vectors.
+
+    Parameters
+    ----------
+    ceps : ndarray
+        features (typically the output of mfcc), of shape (nframes, nceps).
+    width : int
+        number of frames on each side of the regression window.
+    order : int
+        highest order of the regression coefficients: 1 for deltas only, 2
+        for deltas and delta-deltas, etc...
+    out : ndarray
+        if given, the (nframes, (order + 1) * nceps) array in which the result
+        is written.
+
+    Returns
+    -------
+    feats : ndarray
+        array of shape (nframes, (order + 1) * nceps): the static features,
+        followed by the deltas, the delta-deltas, etc... of each frame.
+
+    Notes
+    -----
+    The coefficients of order k are computed from the ones of order k - 1 as
+
+        d[t] = sum_i i * (c[t+i] - c[t-i]) / (2 * sum_i i ** 2)
+
+    where the sums are over i = 1, ..., width, and the first and last frames
+    are replicated at the edges, as in HTK. Every order is computed in place
+    in the output array, with a single padded buffer reused across orders."""
+    ceps = np.asarray(ceps)
+    if ceps.ndim != 2:
+        raise ValueError("Features should be of rank 2")
+    if width < 1:
+        raise ValueError("width should be at least 1")
+    if order < 0:
+        raise ValueError("order should be positive")
+
+    n, nceps = ceps.shape
+    dtype = np.result_type(ceps.dtype, np.float32)
+    shape = (n, (order + 1) * nceps)
+    if out is None:
+        out = np.empty(shape, dtype)
+    elif out.shape != shape:
+        raise ValueError("out should be of shape %s, got %s" %
+                         (shape, out.shape))
+    out[:, :nceps] = ceps
+    if n == 0 or order == 0:
+        return out
+
+    padded = np.empty((n + 2 * width, nceps), dtype)
+    tmp = np.empty((n, nceps), dtype)
+    for k in range(order):
+        padded[width:width+n] = out[:, k*nceps:(k+1)*nceps]
+        padded[:width] = padded[width]
+        padded[width+n:] = padded[width+n-1]
+        _regression(padded, width, out[:, (k+1)*nceps:(k+2)*nceps], tmp)
+    return out
+
+class _RegressionStage(object):
+    """Regression coefficients of one order, for frames received by chunks.
+
+    The outputs lag the inputs by width frames: the coefficients of a frame are
+    returned once the width following frames have been received."""
+    def __init__(self, width):
+        self.width = width
+        self._buffer = None
+
+    def push(self, frames, last=False):
+        w = self.width
+        if self._buffer is None:
+            if frames.shape[0] == 0:
+                return frames
+            # Replicate the first frame on the left edge
+            self._buffer = np.repeat(frames[:1], w, axis=0)
+        buffer = np.concatenate((self._buffer, frames))
+        if last:
+            # Replicate the last frame on the right edge
+            buffer = np.concatenate((buffer,
+                                     np.repeat(buffer[-1:], w, axis=0)))
+
+        n = buffer.shape[0] - 2 * w
+        self._buffer = buffer[max(n, 0):]
+        if n <= 0:
+            return buffer[:0]
+        out = np.empty((n, buffer.shape[1]), buffer.dtype)
+        _regression(buffer, w, out, np.empty_like(out))
+        return out
+
+class StreamingDeltas(object):
+    """Regression coefficients for features received by chunks.
+
+    Feeding features chunk by chunk to push, and calling flush at the end of
+    the sequence, gives exactly the same result as deltas on the whole
+    sequence.
+
+    Parameters
+    ----------
+    width : int
+        number of frames on each side of the regression window.
+    order : int
+        highest order of the regression coefficients.
+
+    Examples
+    --------
+    >>> stream = StreamingDeltas(width=2, order=2)
+    >>> for ceps in chunks:
+    ...     feats = stream.push(ceps)
+    >>> feats = stream.flush()
+
+    Notes
+    -----
+    Only the context frames are kept between calls: the output lags the input
+    by order * width frames."""
+    def __init__(self, width=2, order=2):
+        if width < 1:
+            raise ValueError("width should be at least 1")
+        if order < 0:
+            raise ValueError("order should be positive")
+        self.width = width
+        self.order = order
+        self.reset()
+
+    def reset(self):
+        """Reset the state, to start processing a new sequence."""
+        self._stages = [_RegressionStage(self.width)
+                        for k in range(self.order)]
+        # Coefficients of each order not returned yet, because the higher
+        # orders of the same frames are not available yet
+        self._pending = [None] * self.order
+        self._empty = None
+
+    def push(self, ceps):
+        """Process the next frames of features.
+
+        Parameters
+        ----------
+        ceps : ndarray
+            the next frames, of shape (nframes, nceps).
+
+        Returns
+        -------
+        feats : ndarray
+            the frames whose regression coefficients are complete, of shape
+            (nframes, (order + 1) * nceps). nframes may be 0."""
+        ceps = np.atleast_2d(ceps)
+        ceps = ceps.astype(np.result_type(ceps.dtype, np.float32), copy=False)
+        if self._empty is None:
+            self._empty = ceps[:0]
+        return self._push(ceps, False)
+
+    def flush(self):
+        """Return the last frames of the sequence, and reset the state.
+
+        Returns
+        -------
+        feats : ndarray
+            the remaining frames, with the last frame replicated as right
+            context, of shape (nframes, (order + 1) * nceps)."""
+        if self._empty is None:
+            out = np.empty((0, 0))
+        else:
+            out = self._push(self._empty, True)
+        self.reset()
+        return out
+
+    def _push(self, ceps, last):
+        levels = [ceps]
+        for stage in self._stages:
+            levels.append(stage.push(levels[-1], last))
+
+        # Frames are ready once their highest order is available
+        for k in range(self.order):
+            if self._pending[k] is not None:
+                levels[k] = np.concatenate((self._pending[k], levels[k]))
+        n = levels[-1].shape[0]
+        for k in range(self.order):
+            self._pending[k] = levels[k][n:]
+        return np.concatenate([level[:n] for level in levels], axis=1)
@@ -1,16 +1,46 @@
+from collections import OrderedDict
+
 import numpy as np
 
+from scipy import sparse
 from scipy.io import loadmat
 from scipy.signal import lfilter, hamming
-from scipy.fftpack import fft
 from scipy.fftpack.realtransforms import dct
 
 from scikits.talkbox import segment_axis
+from scikits.talkbox.tools.fftutils import onesided_size, rfft_magnitude
+from scikits.talkbox.tools.dtypes import floating_dtype
 
 from mel import hz2mel
+from deltas import deltas, StreamingDeltas
+
+def trfbank(fs, nfft, lowfreq, linsc, logsc, nlinfilt, nlogfilt,
+            compact=False):
+    """Compute triangular filterbank for MFCC computation.
+
+    Parameters
+    ----------
+    compact : bool
+        if True, the filterbank is returned as a sparse CSR matrix of shape
+        (nfilt, nfft/2 + 1) which only stores the non zero weights, and acts on
+        the one-sided spectrum (weights above Nyquist are folded back on their
+        mirror bin). Otherwise, a dense (nfilt, nfft) array is returned.
 
-def trfbank(fs, nfft, lowfreq, linsc, logsc, nlinfilt, nlogfilt):
-    """Compute triangular filterbank for MFCC computation."""
+    Returns
+    -------
+    fbank : ndarray or sparse matrix
+        the filterbank, one filter per row.
+    freqs : ndarray
+        start/middle/end points of the triangular filters, in Hz.
+
+    Raises
+    ------
+    ValueError
+        if the last filters extend above the sampling rate (nfft bins).
+
+    Notes
+    -----
+    Use apply_fbank to filter a set of spectra with either representation."""
     # Total number of filters
     nfilt = nlinfilt + nlogfilt
 
@@ -24,33 +54,421 @@ def trfbank(fs, nfft, lowfreq, linsc, logsc, nlinfilt, nlogfilt):
     freqs[nlinfilt:] = freqs[nlinfilt-1] * logsc ** np.arange(1, nlogfilt + 3)
     heights = 2./(freqs[2:] - freqs[0:-2])
 
-    # Compute filterbank coeff (in fft domain, in bins)
-    fbank = np.zeros((nfilt, nfft))
-    # FFT bins (in Hz)
-    nfreqs = np.arange(nfft) / (1. * nfft) * fs
-    for i in range(nfilt):
-        low = freqs[i]
-        cen = freqs[i+1]
-        hi = freqs[i+2]
-
-        lid = np.arange(np.floor(low * nfft / fs) + 1,
-                        np.floor(cen * nfft / fs) + 1, dtype=np.int)
-        lslope = heights[i] / (cen - low)
-        rid = np.arange(np.floor(cen * nfft / fs) + 1,
-                        np.floor(hi * nfft / fs) + 1, dtype=np.int)
-        rslope = heights[i] / (hi - cen)
-        fbank[i][lid] = lslope * (nfreqs[lid] - low)
-        fbank[i][rid] = rslope * (hi - nfreqs[rid])
+    # Start/middle/end points and slopes of every filter
+    low = freqs[:-2, np.newaxis]
+    cen = freqs[1:-1, np.newaxis]
+    hi = freqs[2:, np.newaxis]
+    lslope = heights[:, np.newaxis] / (cen - low)
+    rslope = heights[:, np.newaxis] / (hi - cen)
+    # First bin of the left side, of the right side, and last bin + 1 of each
+    # filter
+    lbin = np.floor(low * nfft / fs).astype(np.int) + 1
+    cbin = np.floor(cen * nfft / fs).astype(np.int) + 1
+    hbin = np.floor(hi * nfft / fs).astype(np.int) + 1
+    if np.any(hbin > nfft):
+        raise ValueError("The filters extend above the sampling rate: nfft "
+                         "is too small for lowfreq, linsc, logsc and the "
+                         "number of filters")
+
+    if compact:
+        # Only compute the weights inside each filter: the bins of filter i
+        # are lbin[i], ..., hbin[i] - 1
+        counts = np.maximum(hbin - lbin, 0).ravel()
+        rows = np.repeat(np.arange(nfilt), counts)
+        starts = np.cumsum(counts) - counts
+        bins = lbin.ravel()[rows] + np.arange(counts.sum()) - starts[rows]
+        nfreqs = bins / (1. * nfft) * fs
+        weights = np.where(bins < cbin.ravel()[rows],
+                           lslope.ravel()[rows] * (nfreqs - low.ravel()[rows]),
+                           rslope.ravel()[rows] * (hi.ravel()[rows] - nfreqs))
+
+        # The magnitude spectrum of a real signal is symmetric: bins above
+        # Nyquist are equivalent to their mirror bin in the one-sided spectrum
+        nbins = nfft / 2 + 1
+        bins = np.where(bins < nbins, bins, nfft - bins)
+        fbank = sparse.coo_matrix((weights, (rows, bins)),
+                                  shape=(nfilt, nbins)).tocsr()
+    else:
+        # Compute filterbank coeff (in fft domain, in bins), by broadcasting
+        # the filters against the grid of FFT bins
+        bins = np.arange(nfft)
+        # FFT bins (in Hz)
+        nfreqs = bins / (1. * nfft) * fs
+        left = (bins >= lbin) & (bins < cbin)
+        right = (bins >= cbin) & (bins < hbin)
+        fbank = np.zeros((nfilt, nfft))
+        fbank[left] = (lslope * (nfreqs - low))[left]
+        fbank[right] = (rslope * (hi - nfreqs))[right]
 
     return fbank, freqs
 
-def mfcc(input, nwin=256, nfft=512, fs=16000, nceps=13):
+def apply_fbank(spec, fbank):
+    """Filter a set of spectra through a filterbank.
+
+    Parameters
+    ----------
+    spec : ndarray
+        spectrum magnitude, one frame per row. Must be the one-sided spectrum
+        (nfft/2 + 1 bins) for a compact filterbank, and the full spectrum (nfft
+        bins) for a dense one.
+    fbank : ndarray or sparse matrix
+        filterbank as returned by trfbank.
+
+    Returns
+    -------
+    fspec : ndarray
+        filterbank energies, of shape (nframes, nfilt).
+
+    Notes
+    -----
+    For a compact filterbank, the cost is proportional to the number of non
+    zero weights instead of nfilt * nfft."""
+    if sparse.issparse(fbank):
+        return fbank.dot(spec.T).T
+    else:
+        return np.dot(spec, fbank.T)
+
+# Maximum number of MFCCExtractor instances kept alive by mfcc
+_MAX_EXTRACTORS = 16
+_extractors = OrderedDict()
+
+def _cached_extractor(nwin, nfft, fs, nceps, dtype=None, with_deltas=False):
+    """Return a MFCCExtractor for the given parameters, building it only if it
+    is not in the cache already. The least recently used extractor is evicted
+    once the cache holds _MAX_EXTRACTORS items."""
+    args = (nwin, nfft, fs, nceps, floating_dtype(dtype), bool(with_deltas))
+    try:
+        extractor = _extractors.pop(args)
+    except KeyError:
+        extractor = MFCCExtractor(nwin, nfft, fs, nceps, dtype=args[-2],
+                                  with_deltas=args[-1])
+        while len(_extractors) >= _MAX_EXTRACTORS:
+            _extractors.popitem(last=False)
+    _extractors[args] = extractor
+    return extractor
+
+class MFCCExtractor(object):
+    """Reusable MFCC front-end.
+
+    Everything which only depends on the parameters (analysis window,
+    triangular filterbank and DCT basis) is computed once at construction, so
+    that extracting features from many signals only pays for the actual
+    computation.
+
+    Parameters
+    ----------
+    nwin : int
+        size of the analysis window, in samples.
+    nfft : int
+        size of the fft.
+    fs : float
+        sampling rate.
+    nceps : int
+        number of cepstral coefficients to keep.
+    lowfreq : float
+        start frequency of the first filter, in Hz.
+    linsc : float
+        spacing between the linearly spaced filters, in Hz.
+    logsc : float
+        ratio between consecutive log-spaced filters.
+    nlinfil : int
+        number of linearly spaced filters.
+    nlogfil : int
+        number of log-spaced filters.
+    prefac : float
+        pre-emphasis factor.
+    dtype : dtype
+        precision of the computation, float64 (default) or float32. In float32,
+        every step of the computation is done in single precision, which
+        halves the memory traffic.
+    with_deltas : bool
+        if True, the cepstrum is followed by its deltas and delta-deltas (see
+        deltas), so that ceps is of shape (nframes, 3 * nceps).
+    delta_width : int
+        number of frames on each side of the regression window of the deltas.
+
+    Examples
+    --------
+    >>> extractor = MFCCExtractor(nwin=256, nfft=512, fs=16000, nceps=13)
+    >>> ceps, mspec, spec = extractor(x)
+    >>> cepstra = extractor.transform_batch([x1, x2, x3])"""
+    def __init__(self, nwin=256, nfft=512, fs=16000, nceps=13,
+                 lowfreq=133.33, linsc=200/3., logsc=1.0711703, nlinfil=13,
+                 nlogfil=27, prefac=0.97, dtype=None, with_deltas=False,
+                 delta_width=2):
+        self.nwin = nwin
+        self.nfft = nfft
+        self.fs = fs
+        self.nceps = nceps
+        self.prefac = prefac
+        self.dtype = floating_dtype(dtype)
+        self.with_deltas = with_deltas
+        self.delta_width = delta_width
+        # MFCC parameters: taken from auditory toolbox
+        self.over = nwin - 160
+
+        self.window = hamming(nwin, sym=0).astype(self.dtype)
+        self.fbank = trfbank(fs, nfft, lowfreq, linsc, logsc, nlinfil,
+                             nlogfil, compact=True)[0].astype(self.dtype)
+        # Pre-emphasis filter coefficients
+        self.preemp_b = np.array([1., -prefac], self.dtype)
+        self.preemp_a = np.ones(1, self.dtype)
+        # Orthonormal DCT-II as a matrix, restricted to the kept coefficients:
+        # dot(mspec, dctbasis) == dct(mspec, type=2, norm='ortho')[:, :nceps]
+        nfil = nlinfil + nlogfil
+        self.dctbasis = dct(np.eye(nfil), type=2, norm='ortho',
+                            axis=-1)[:, :nceps].astype(self.dtype)
+
+    def __call__(self, input, outputs=('ceps', 'mspec', 'spec')):
+        """Compute the MFCC of one signal.
+
+        Parameters
+        ----------
+        input: ndarray
+            input from which the coefficients are computed
+        outputs: str or sequence
+            name or sequence of names of the arrays to return, among 'ceps',
+            'mspec' and 'spec'. Arrays which are not requested are released
+            as soon as they are not needed anymore.
+
+        Returns
+        -------
+        ceps: ndarray
+            Mel-cepstrum coefficients
+        mspec: ndarray
+            Log-spectrum in the mel-domain.
+        spec: ndarray
+            Spectrum magnitude.
+
+        Only the requested arrays are returned, in the order given by outputs
+        (as a single array if outputs is a string)."""
+        names = _output_names(outputs)
+
+        extract = lfilter(self.preemp_b, self.preemp_a,
+                          np.asarray(input, self.dtype))
+        framed = segment_axis(extract, self.nwin, self.over) * self.window
+        del extract
+        res = self._from_frames(framed, names)
+        if self.with_deltas:
+            res['ceps'] = deltas(res['ceps'], self.delta_width)
+
+        if isinstance(outputs, basestring):
+            return res[outputs]
+        return tuple(res[name] for name in names)
+
+    def transform_batch(self, signals):
+        """Compute the MFCC of each signal in a sequence of signals.
+
+        Returns
+        -------
+        ceps: list
+            list of Mel-cepstrum coefficients, one item per signal. Each item
+            is a view of the array returned by transform_stacked."""
+        ceps, offsets = self.transform_stacked(signals)
+        return [ceps[offsets[i]:offsets[i+1]] for i in range(len(offsets) - 1)]
+
+    def transform_stacked(self, signals):
+        """Compute the MFCC of a sequence of signals in one pass.
+
+        The frames of every signal are stacked into one frame matrix, so that
+        the windowing, fft, filterbank and DCT are done once for the whole
+        sequence.
+
+        Parameters
+        ----------
+        signals : sequence
+            sequence of rank 1 signals, of arbitrary lengths.
+
+        Returns
+        -------
+        ceps: ndarray
+            Mel-cepstrum coefficients of all the frames, of shape (nframes,
+            nceps), or (nframes, 3 * nceps) with deltas.
+        offsets: ndarray
+            offsets[i]:offsets[i+1] are the frames of the i-th signal in ceps.
+        """
+        signals = [np.atleast_1d(s) for s in signals]
+        hop = self.nwin - self.over
+
+        sizes = np.array([s.size for s in signals], dtype=np.intp)
+        nframes = np.where(sizes >= self.nwin, 1 + (sizes - self.nwin) / hop, 0)
+        offsets = np.zeros(sizes.size + 1, dtype=np.intp)
+        np.cumsum(nframes, out=offsets[1:])
+        if offsets[-1] == 0:
+            return np.empty((0, self.ncoeffs), self.dtype), offsets
+
+        x = np.concatenate(signals).astype(self.dtype)
+        starts = np.cumsum(sizes) - sizes
+
+        # Pre-emphasis, restarted at the beginning of each signal
+        extract = np.empty_like(x)
+        np.multiply(x[:-1], self.preemp_b[1], extract[1:])
+        extract[1:] += x[1:]
+        extract[starts[sizes > 0]] = x[starts[sizes > 0]]
+
+        # Start of each frame in the concatenated signal
+        fstarts = np.repeat(starts - offsets[:-1] * hop, nframes)
+        fstarts += np.arange(offsets[-1]) * hop
+        framed = extract[fstarts[:, np.newaxis] + np.arange(self.nwin)]
+        framed *= self.window
+
+        ceps = self._from_frames(framed)['ceps']
+        if self.with_deltas:
+            # The regression window must not cross signal boundaries
+            full = np.empty((ceps.shape[0], self.ncoeffs), self.dtype)
+            for i in range(sizes.size):
+                deltas(ceps[offsets[i]:offsets[i+1]], self.delta_width,
+                       out=full[offsets[i]:offsets[i+1]])
+            ceps = full
+        return ceps, offsets
+
+    @property
+    def ncoeffs(self):
+        """Number of coefficients per frame of the cepstrum output."""
+        if self.with_deltas:
+            return 3 * self.nceps
+        return self.nceps
+
+    def _from_frames(self, framed, names=('ceps',)):
+        """Compute the requested outputs from windowed frames, and return them
+        in a dictionary."""
+        res = {}
+        # Compute the (one-sided) spectrum magnitude
+        spec = rfft_magnitude(framed, self.nfft)
+        # Filter the spectrum through the triangle filterbank
+        mspec = apply_fbank(spec, self.fbank)
+        if 'spec' in names:
+            res['spec'] = _twosided(spec, self.nfft)
+        del spec
+        np.log10(mspec, mspec)
+        # Use the DCT to 'compress' the coefficients (spectrum -> cepstrum
+        # domain)
+        res['ceps'] = np.dot(mspec, self.dctbasis)
+        if 'mspec' in names:
+            res['mspec'] = mspec
+
+        return res
+
+class StreamingMFCC(object):
+    """MFCC front-end for signals received by chunks.
+
+    The state of the pre-emphasis filter and the samples not yet used by a
+    complete frame are kept between calls to push, so that feeding a signal
+    chunk by chunk gives exactly the same frames as mfcc on the whole signal.
+
+    Parameters
+    ----------
+    The parameters are the same as for MFCCExtractor.
+
+    Examples
+    --------
+    >>> stream = StreamingMFCC(nwin=256, nfft=512, fs=16000, nceps=13)
+    >>> for chunk in packets:
+    ...     ceps = stream.push(chunk)
+
+    With deltas, the frames are returned 2 * delta_width frames late, once
+    the context of their delta-deltas is received: call flush at the end of
+    the signal to get the last frames.
+
+    >>> stream = StreamingMFCC(with_deltas=True)
+    >>> for chunk in packets:
+    ...     feats = stream.push(chunk)
+    >>> feats = stream.flush()
+
+    Notes
+    -----
+    The work done by push only depends on the chunk size, and a frame is
+    returned as soon as its last sample is received (plus the delta context,
+    if any)."""
+    def __init__(self, *args, **kw):
+        self.extractor = MFCCExtractor(*args, **kw)
+        self.hop = self.extractor.nwin - self.extractor.over
+        if self.extractor.with_deltas:
+            self._deltas = StreamingDeltas(self.extractor.delta_width)
+        else:
+            self._deltas = None
+        self.reset()
+
+    def reset(self):
+        """Reset the state, to start processing a new signal."""
+        # State of the pre-emphasis filter
+        self._zi = np.zeros(1, self.extractor.dtype)
+        # Pre-emphasized samples not consumed by a full frame yet
+        self._buffer = np.zeros(0, self.extractor.dtype)
+        if self._deltas is not None:
+            self._deltas.reset()
+
+    def push(self, chunk):
+        """Process a new chunk of signal.
+
+        Parameters
+        ----------
+        chunk : ndarray
+            the next samples of the signal (rank 1).
+
+        Returns
+        -------
+        ceps : ndarray
+            Mel-cepstrum coefficients of the frames completed by this chunk,
+            of shape (nframes, nceps), or (nframes, 3 * nceps) with deltas.
+            nframes may be 0."""
+        ext = self.extractor
+        extract, self._zi = lfilter(ext.preemp_b, ext.preemp_a,
+                                    np.asarray(chunk, ext.dtype), zi=self._zi)
+        buffer = np.concatenate((self._buffer, extract))
+
+        if buffer.size < ext.nwin:
+            self._buffer = buffer
+            ceps = np.empty((0, ext.nceps), ext.dtype)
+        else:
+            nframes = 1 + (buffer.size - ext.nwin) / self.hop
+            framed = segment_axis(buffer, ext.nwin, ext.over) * ext.window
+            self._buffer = buffer[nframes * self.hop:]
+            ceps = ext._from_frames(framed)['ceps']
+
+        if self._deltas is not None:
+            return self._deltas.push(ceps)
+        return ceps
+
+    def flush(self):
+        """Return the frames still waiting for their delta context, and reset
+        the state.
+
+        Returns
+        -------
+        ceps : ndarray
+            the last frames of the signal, of shape (nframes, 3 * nceps), with
+            the last frame replicated as right context. Empty without
+            deltas."""
+        ext = self.extractor
+        if self._deltas is not None:
+            ceps = self._deltas.flush()
+        else:
+            ceps = np.empty((0, ext.nceps), ext.dtype)
+        self.reset()
+        if ceps.shape[0] == 0:
+            return np.empty((0, ext.ncoeffs), ext.dtype)
+        return ceps
+
+def mfcc(input, nwin=256, nfft=512, fs=16000, nceps=13,
+         outputs=('ceps', 'mspec', 'spec'), dtype=None, with_deltas=False):
     """Compute Mel Frequency Cepstral Coefficients.
 
     Parameters
     ----------
     input: ndarray
         input from which the coefficients are computed
+    outputs: str or sequence
+        name or sequence of names of the arrays to return, among 'ceps',
+        'mspec' and 'spec'. By default, all of them are returned. The spectrum
+        is much bigger than the cepstrum: not requesting it saves a lot of
+        memory on long signals.
+    dtype: dtype
+        precision of the computation, float64 (default) or float32.
+    with_deltas: bool
+        if True, ceps also contains the deltas and delta-deltas of the
+        cepstrum, computed over +/- 2 frames (see deltas): ceps is then of
+        shape (nframes, 3 * nceps).
 
     Returns
     -------
@@ -58,6 +476,13 @@ def mfcc(input, nwin=256, nfft=512, fs=16000, nceps=13):
         Mel-cepstrum coefficients
     mspec: ndarray
         Log-spectrum in the mel-domain.
+    spec: ndarray
+        Spectrum magnitude.
+
+    Only the requested arrays are returned, in the order given by outputs (as
+    a single array if outputs is a string): for example, mfcc(x,
+    outputs='ceps') only returns the cepstrum, and mfcc(x, outputs=('ceps',
+    'mspec')) returns the cepstrum and the mel spectrum.
 
     Notes
     -----
@@ -69,47 +494,69 @@ def mfcc(input, nwin=256, nfft=512, fs=16000, nceps=13):
         mel scale, and have equal bandwith in the mel scale
         * Compute the DCT of the log-spectrum
 
+    The window, filterbank and DCT basis are cached between calls with the
+    same parameters: use MFCCExtractor directly to control their lifetime.
+
     References
     ----------
     .. [1] S.B. Davis and P. Mermelstein, "Comparison of parametric
            representations for monosyllabic word recognition in continuously
            spoken sentences", IEEE Trans. Acoustics. Speech, Signal Proc.
            ASSP-28 (4): 357-366, August 1980."""
+    extractor = _cached_extractor(nwin, nfft, fs, nceps, dtype, with_deltas)
+    return extractor(input, outputs)
 
-    # MFCC parameters: taken from auditory toolbox
-    over = nwin - 160
-    # Pre-emphasis factor (to take into account the -6dB/octave rolloff of the
-    # radiation at the lips level)
-    prefac = 0.97
+def _output_names(outputs):
+    """Check the outputs argument of mfcc, and return it as a tuple of
+    names."""
+    if isinstance(outputs, basestring):
+        names = (outputs,)
+    else:
+        names = tuple(outputs)
+    for name in names:
+        if not name in ['ceps', 'mspec', 'spec']:
+            raise ValueError("output %s not understood" % name)
+    return names
 
-    #lowfreq = 400 / 3.
-    lowfreq = 133.33
-    #highfreq = 6855.4976
-    linsc = 200/3.
-    logsc = 1.0711703
+def _twosided(spec, nfft):
+    """Rebuild the full nfft bins magnitude spectrum from the one-sided one."""
+    n = onesided_size(nfft)
+    full = np.empty(spec.shape[:-1] + (nfft,), spec.dtype)
+    full[..., :n] = spec
+    full[..., n:] = spec[..., nfft-n:0:-1]
+    return full
 
-    nlinfil = 13
-    nlogfil = 27
-    nfil = nlinfil + nlogfil
+def mfcc_batch(signals, nwin=256, nfft=512, fs=16000, nceps=13, dtype=None,
+               with_deltas=False):
+    """Compute Mel Frequency Cepstral Coefficients of a sequence of signals.
 
-    w = hamming(nwin, sym=0)
+    This is much faster than calling mfcc on each signal for many short
+    signals, as all the frames are processed at once.
 
-    fbank = trfbank(fs, nfft, lowfreq, linsc, logsc, nlinfil, nlogfil)[0]
+    Parameters
+    ----------
+    signals: sequence
+        sequence of rank 1 signals, of arbitrary lengths.
 
-    #------------------
-    # Compute the MFCC
-    #------------------
-    extract = preemp(input, prefac)
-    framed = segment_axis(extract, nwin, over) * w
+    Returns
+    -------
+    ceps: ndarray
+        Mel-cepstrum coefficients of all the frames, of shape (nframes,
+        nceps), or (nframes, 3 * nceps) with deltas. The deltas of each signal
+        are computed independently.
+    offsets: ndarray
+        offsets[i]:offsets[i+1] are the frames of the i-th signal in ceps.
 
-    # Compute the spectrum magnitude
-    spec = np.abs(fft(framed, nfft, axis=-1))
-    # Filter the spectrum through the triangle filterbank
-    mspec = np.log10(np.dot(spec, fbank.T))
-    # Use the DCT to 'compress' the coefficients (spectrum -> cepstrum domain)
-    ceps = dct(mspec, type=2, norm='ortho', axis=-1)[:, :nceps]
+    Examples
+    --------
+    >>> ceps, offsets = mfcc_batch([x1, x2, x3])
+    >>> ceps2 = ceps[offsets[1]:offsets[2]]
 
-    return ceps, mspec, spec
+    Notes
+    -----
+    See mfcc for the other parameters."""
+    extractor = _cached_extractor(nwin, nfft, fs, nceps, dtype, with_deltas)
+    return extractor.transform_stacked(signals)
 
 def preemp(input, p):
     """Pre-emphasis filter."""
@@ -4,6 +4,7 @@ import numpy as np
 def configuration(parent_package='', top_path=None):
     from numpy.distutils.misc_util import Configuration
     config = Configuration('features', parent_package, top_path)
+    config.add_data_dir('tests')
 
     return config
 
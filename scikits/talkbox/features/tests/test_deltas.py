@@ -0,0 +1,95 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_almost_equal
+
+from scikits.talkbox.features.deltas import deltas, StreamingDeltas
+
+def regression_ref(c, width):
+    """Regression coefficients computed frame by frame, used as a
+    reference."""
+    n = c.shape[0]
+    d = np.zeros(c.shape)
+    norm = 2. * np.sum(np.arange(1, width + 1) ** 2)
+    for t in range(n):
+        for i in range(1, width + 1):
+            d[t] += i * (c[min(t + i, n - 1)] - c[max(t - i, 0)])
+    return d / norm
+
+def deltas_ref(c, width, order):
+    res = [c]
+    for k in range(order):
+        res.append(regression_ref(res[-1], width))
+    return np.concatenate(res, axis=1)
+
+class TestDeltas(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.c = np.random.randn(50, 13)
+
+    def test_simple(self):
+        for width in [1, 2, 3]:
+            for order in [0, 1, 2, 3]:
+                y = deltas(self.c, width, order)
+                assert y.shape == (50, (order + 1) * 13)
+                assert_array_almost_equal(y, deltas_ref(self.c, width, order))
+
+    def test_short(self):
+        """Test sequences shorter than the regression window."""
+        for n in [0, 1, 2, 3]:
+            assert_array_almost_equal(deltas(self.c[:n], 2),
+                                      deltas_ref(self.c[:n], 2, 2))
+
+    def test_out(self):
+        out = np.empty((50, 39))
+        y = deltas(self.c, 2, out=out)
+        assert y is out
+        assert_array_almost_equal(out, deltas_ref(self.c, 2, 2))
+        self.assertRaises(ValueError, deltas, self.c, 2,
+                          out=np.empty((50, 26)))
+
+    def test_float32(self):
+        y = deltas(self.c.astype(np.float32), 2)
+        assert y.dtype == np.float32
+        assert_array_almost_equal(y, deltas_ref(self.c, 2, 2), 5)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, deltas, self.c[0], 2)
+        self.assertRaises(ValueError, deltas, self.c, 0)
+        self.assertRaises(ValueError, deltas, self.c, 2, -1)
+
+class TestStreamingDeltas(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.c = np.random.randn(50, 13)
+
+    def _push_all(self, stream, sizes):
+        bounds = np.cumsum([0] + list(sizes))
+        res = [stream.push(self.c[bounds[i]:bounds[i+1]])
+               for i in range(len(sizes))]
+        res.append(stream.flush())
+        return np.concatenate(res)
+
+    def test_chunks(self):
+        for width, order in [(1, 1), (2, 2), (3, 2), (2, 0)]:
+            ref = deltas(self.c, width, order)
+            for sizes in [[50], [1] * 50, [7, 0, 3, 20, 1, 19], [4, 46]]:
+                stream = StreamingDeltas(width, order)
+                assert_array_almost_equal(self._push_all(stream, sizes), ref)
+
+    def test_lag(self):
+        stream = StreamingDeltas(2, 2)
+        assert stream.push(self.c[:4]).shape == (0, 39)
+        assert stream.push(self.c[4:5]).shape == (1, 39)
+
+    def test_short(self):
+        for n in [1, 2, 3, 5]:
+            stream = StreamingDeltas(2, 2)
+            y = np.concatenate((stream.push(self.c[:n]), stream.flush()))
+            assert_array_almost_equal(y, deltas(self.c[:n], 2, 2))
+
+    def test_reset(self):
+        stream = StreamingDeltas(2, 2)
+        stream.push(self.c[:20])
+        assert stream.flush().shape[0] > 0
+        assert stream.flush().shape[0] == 0
+        assert_array_almost_equal(self._push_all(stream, [10, 40]),
+                                  deltas(self.c, 2, 2))
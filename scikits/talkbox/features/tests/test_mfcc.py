@@ -0,0 +1,281 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_equal, \
+                          assert_array_almost_equal
+
+from scipy.signal import lfilter, hamming
+from scipy.fftpack import fft
+from scipy.fftpack.realtransforms import dct
+
+from scikits.talkbox import segment_axis
+from scikits.talkbox.features.mfcc import mfcc, mfcc_batch, trfbank, apply_fbank, \
+        MFCCExtractor, StreamingMFCC, _extractors, _MAX_EXTRACTORS
+from scikits.talkbox.features.deltas import deltas
+
+def mfcc_ref(input, nwin=256, nfft=512, fs=16000, nceps=13):
+    """Straightforward MFCC computation, used as a reference."""
+    w = hamming(nwin, sym=0)
+    fbank = trfbank(fs, nfft, 133.33, 200/3., 1.0711703, 13, 27)[0]
+
+    extract = lfilter([1., -0.97], 1, input)
+    framed = segment_axis(extract, nwin, nwin - 160) * w
+
+    spec = np.abs(fft(framed, nfft, axis=-1))
+    mspec = np.log10(np.dot(spec, fbank.T))
+    ceps = dct(mspec, type=2, norm='ortho', axis=-1)[:, :nceps]
+
+    return ceps, mspec, spec
+
+def trfbank_ref(fs, nfft, lowfreq, linsc, logsc, nlinfilt, nlogfilt):
+    """Filterbank computed one filter at a time, used as a reference."""
+    nfilt = nlinfilt + nlogfilt
+
+    freqs = np.zeros(nfilt+2)
+    freqs[:nlinfilt] = lowfreq + np.arange(nlinfilt) * linsc
+    freqs[nlinfilt:] = freqs[nlinfilt-1] * logsc ** np.arange(1, nlogfilt + 3)
+    heights = 2./(freqs[2:] - freqs[0:-2])
+
+    fbank = np.zeros((nfilt, nfft))
+    nfreqs = np.arange(nfft) / (1. * nfft) * fs
+    for i in range(nfilt):
+        low = freqs[i]
+        cen = freqs[i+1]
+        hi = freqs[i+2]
+
+        lid = np.arange(np.floor(low * nfft / fs) + 1,
+                        np.floor(cen * nfft / fs) + 1, dtype=np.int)
+        lslope = heights[i] / (cen - low)
+        rid = np.arange(np.floor(cen * nfft / fs) + 1,
+                        np.floor(hi * nfft / fs) + 1, dtype=np.int)
+        rslope = heights[i] / (hi - cen)
+        fbank[i][lid] = lslope * (nfreqs[lid] - low)
+        fbank[i][rid] = rslope * (hi - nfreqs[rid])
+
+    return fbank, freqs
+
+class TestTrfbank(TestCase):
+    def test_dense(self):
+        """Test vectorized filterbank against reference implementation."""
+        for fs, nfft in [(16000, 512), (16000, 64), (8000, 256),
+                         (22050, 4095), (16000, 8192)]:
+            for nlin, nlog in [(13, 27), (10, 5), (20, 20)]:
+                r, rf = trfbank_ref(fs, nfft, 133.33, 200/3., 1.0711703,
+                                    nlin, nlog)
+                y, yf = trfbank(fs, nfft, 133.33, 200/3., 1.0711703, nlin,
+                                nlog)
+                assert_array_equal(y, r)
+                assert_array_equal(yf, rf)
+
+    def test_compact_dense(self):
+        """Test compact filterbank has the same weights as the dense one."""
+        for fs, nfft in [(16000, 512), (16000, 64), (22050, 4095)]:
+            r = trfbank_ref(fs, nfft, 133.33, 200/3., 1.0711703, 13, 27)[0]
+            y = trfbank(fs, nfft, 133.33, 200/3., 1.0711703, 13, 27,
+                        compact=True)[0]
+            assert_array_almost_equal(y.toarray(), r[:, :nfft / 2 + 1])
+
+    def _check_compact(self, fs, nfft):
+        np.random.seed(0)
+        fbank = trfbank(fs, nfft, 133.33, 200/3., 1.0711703, 13, 27)[0]
+        cfbank = trfbank(fs, nfft, 133.33, 200/3., 1.0711703, 13, 27,
+                         compact=True)[0]
+        assert cfbank.shape == (40, nfft / 2 + 1)
+        assert cfbank.nnz < fbank.size / 4
+
+        # Magnitude spectrum of real frames
+        spec = np.abs(fft(np.random.randn(10, nfft), axis=-1))
+        assert_array_almost_equal(apply_fbank(spec, fbank),
+                                  apply_fbank(spec[:, :nfft / 2 + 1], cfbank))
+
+    def test_compact(self):
+        """Test compact filterbank gives the same energies as dense one."""
+        self._check_compact(16000, 512)
+        self._check_compact(16000, 4096)
+
+    def test_compact_fold(self):
+        """Test compact filterbank with filters above Nyquist."""
+        self._check_compact(8000, 256)
+        self._check_compact(8000, 255)
+
+    def test_bad_params(self):
+        """Test filters above the sampling rate are rejected."""
+        # The last filters end above fs with a coarse log scale
+        for compact in [False, True]:
+            self.assertRaises(ValueError, trfbank, 8000, 256, 133.33,
+                              200/3., 1.2, 13, 27, compact)
+
+class TestMFCC(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(4000)
+
+    def test_simple(self):
+        """Test mfcc against reference implementation."""
+        for r, y in zip(mfcc_ref(self.x), mfcc(self.x)):
+            assert_array_almost_equal(r, y)
+
+    def test_params(self):
+        """Test mfcc with non default parameters."""
+        r = mfcc_ref(self.x, nwin=400, nfft=1024, fs=22050, nceps=20)
+        y = mfcc(self.x, nwin=400, nfft=1024, fs=22050, nceps=20)
+        for i in range(3):
+            assert_array_almost_equal(r[i], y[i])
+
+    def test_cache(self):
+        """Test extractors are cached and evicted in LRU order."""
+        _extractors.clear()
+        mfcc(self.x)
+        first = _extractors.values()[0]
+        mfcc(self.x)
+        assert len(_extractors) == 1
+        assert _extractors.values()[0] is first
+
+        for nceps in range(14, 14 + _MAX_EXTRACTORS):
+            mfcc(self.x, nceps=nceps)
+        assert len(_extractors) == _MAX_EXTRACTORS
+        assert not first in _extractors.values()
+
+    def test_outputs(self):
+        """Test mfcc only returns the requested outputs."""
+        ceps, mspec, spec = mfcc_ref(self.x)
+        assert_array_almost_equal(mfcc(self.x, outputs='ceps'), ceps)
+        assert_array_almost_equal(mfcc(self.x, outputs='spec'), spec)
+
+        y = mfcc(self.x, outputs=('ceps', 'mspec'))
+        assert len(y) == 2
+        assert_array_almost_equal(y[0], ceps)
+        assert_array_almost_equal(y[1], mspec)
+
+        y = mfcc(self.x, outputs=['spec', 'ceps'])
+        assert_array_almost_equal(y[0], spec)
+        assert_array_almost_equal(y[1], ceps)
+
+        self.assertRaises(ValueError, mfcc, self.x, outputs='cepstrum')
+
+    def test_float32(self):
+        """Test single precision mfcc against double precision."""
+        for r, y in zip(mfcc(self.x), mfcc(self.x, dtype=np.float32)):
+            assert y.dtype == np.float32
+            assert_array_almost_equal(y / np.abs(r).max(),
+                                      r / np.abs(r).max(), 5)
+
+        ceps, offsets = mfcc_batch([self.x, self.x[:1000]], dtype=np.float32)
+        assert ceps.dtype == np.float32
+        assert_array_almost_equal(ceps[:offsets[1]], mfcc(self.x)[0], 4)
+
+        self.assertRaises(ValueError, mfcc, self.x, dtype=np.int32)
+
+    def test_deltas(self):
+        ceps = mfcc_ref(self.x)[0]
+        y = mfcc(self.x, outputs='ceps', with_deltas=True)
+        assert y.shape == (ceps.shape[0], 39)
+        assert_array_almost_equal(y, deltas(ceps, 2, 2))
+
+class TestMFCCExtractor(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.signals = [np.random.randn(n) for n in [400, 1601, 3200]]
+
+    def test_call(self):
+        extractor = MFCCExtractor()
+        for x in self.signals:
+            for r, y in zip(mfcc_ref(x), extractor(x)):
+                assert_array_almost_equal(r, y)
+
+    def test_batch(self):
+        extractor = MFCCExtractor(nceps=20)
+        ceps = extractor.transform_batch(self.signals)
+        assert len(ceps) == len(self.signals)
+        for x, y in zip(self.signals, ceps):
+            assert_array_almost_equal(mfcc_ref(x, nceps=20)[0], y)
+
+    def test_batch_deltas(self):
+        """Test deltas are computed independently for each signal."""
+        extractor = MFCCExtractor(with_deltas=True, delta_width=3)
+        ceps = extractor.transform_batch(self.signals)
+        for x, y in zip(self.signals, ceps):
+            assert_array_almost_equal(deltas(mfcc_ref(x)[0], 3), y)
+
+class TestMFCCBatch(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.signals = [np.random.randn(n) for n in
+                        [400, 1601, 100, 0, 3200, 256, 255]]
+
+    def test_simple(self):
+        ceps, offsets = mfcc_batch(self.signals)
+        assert_array_equal(offsets, [0, 1, 10, 10, 10, 29, 30, 30])
+        for i, x in enumerate(self.signals):
+            y = ceps[offsets[i]:offsets[i+1]]
+            if x.size >= 256:
+                assert_array_almost_equal(y, mfcc(x)[0])
+            else:
+                assert y.shape == (0, 13)
+
+    def test_empty(self):
+        ceps, offsets = mfcc_batch([np.zeros(10)])
+        assert ceps.shape == (0, 13)
+        assert_array_equal(offsets, [0, 0])
+        ceps, offsets = mfcc_batch([np.zeros(10)], with_deltas=True)
+        assert ceps.shape == (0, 39)
+
+    def test_deltas(self):
+        ceps, offsets = mfcc_batch(self.signals, with_deltas=True)
+        assert ceps.shape == (30, 39)
+        for i, x in enumerate(self.signals):
+            if x.size >= 256:
+                assert_array_almost_equal(ceps[offsets[i]:offsets[i+1]],
+                                          mfcc(x, with_deltas=True)[0])
+
+class TestStreamingMFCC(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(8000)
+
+    def _push_all(self, stream, sizes):
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+        return np.concatenate([stream.push(self.x[bounds[i]:bounds[i+1]])
+                               for i in range(len(sizes))])
+
+    def test_chunks(self):
+        """Test streaming mfcc gives the same frames as batch mfcc."""
+        ref = mfcc(self.x)[0]
+        # 10 ms packets, hop size, and chunks smaller than a window
+        for size in [160, 161, 100, 1000]:
+            stream = StreamingMFCC()
+            n = self.x.size / size
+            ceps = self._push_all(stream, [size] * n)
+            assert_array_almost_equal(ceps, ref[:ceps.shape[0]])
+            self.assertEqual(ceps.shape[0],
+                             mfcc(self.x[:n * size])[0].shape[0])
+
+    def test_random_chunks(self):
+        sizes = np.random.randint(1, 400, 100)
+        sizes = sizes[np.cumsum(sizes) <= self.x.size]
+        sizes = np.concatenate((sizes, [self.x.size - np.sum(sizes)]))
+        ceps = self._push_all(StreamingMFCC(), sizes)
+        assert_array_almost_equal(ceps, mfcc(self.x)[0])
+
+    def test_float32(self):
+        stream = StreamingMFCC(dtype=np.float32)
+        ceps = np.concatenate([stream.push(self.x[i:i+100])
+                               for i in range(0, self.x.size, 100)])
+        assert ceps.dtype == np.float32
+        assert_array_almost_equal(ceps, mfcc(self.x)[0], 4)
+
+    def test_reset(self):
+        stream = StreamingMFCC()
+        first = stream.push(self.x)
+        stream.reset()
+        assert_array_almost_equal(stream.push(self.x), first)
+
+    def test_deltas(self):
+        ref = mfcc(self.x, outputs='ceps', with_deltas=True)
+        for size in [160, 1000, 8000]:
+            stream = StreamingMFCC(with_deltas=True)
+            ceps = self._push_all(stream, [size] * (self.x.size / size))
+            ceps = np.concatenate((ceps, stream.flush()))
+            assert_array_almost_equal(ceps, ref)
+
+        stream = StreamingMFCC()
+        assert stream.push(self.x[:1000]).shape[0] > 0
+        assert stream.flush().shape == (0, 13)
@@ -8,3 +8,15 @@ from levinson_lpc import *
 import levinson_lpc
 __all__ += levinson_lpc.__all__
 
+
+from burg_lpc import *
+import burg_lpc
+__all__ += burg_lpc.__all__
+
+from covariance_lpc import *
+import covariance_lpc
+__all__ += covariance_lpc.__all__
+
+from conversions import *
+import conversions
+__all__ += conversions.__all__
@@ -0,0 +1,74 @@
+"""Benchmark the direct and fft autocorrelation methods of lpc.
+
+The direct method costs ~ n * (order + 1) multiply-adds per frame, and the fft
+one ~ nfft * log2(nfft). The crossover found by bench_crossover is at a cost
+ratio n * (order + 1) / (nfft * log2(nfft)) of ~1.5 - 2, hence the (slightly
+conservative) _DIRECT_COST_RATIO threshold of 1.5 used by method='auto'.
+Typical results for speech frames (n = 400, nfft = 1024): lpc with the direct
+method is ~3x faster at order 12 and ~2x faster at order 20.
+
+bench_frames compares lpc_frames with lpc on the windowed frame matrix: it is
+slightly faster (~15 %), and does not allocate the frame matrix (~180 MB for
+10 minutes of 16 kHz audio).
+
+bench_schur compares schur with levinson when only the reflection
+coefficients are needed, for speed and for accuracy in single precision (the
+reference being levinson in double precision): from order 20 on, schur is
+~1.3x to ~2x faster depending on the order and the machine (e.g. ~1.5x at
+orders 20 and 32 and ~1.3x at order 64 on one machine, up to ~2x at order 64
+on another), with the same accuracy."""
+import numpy as np
+from numpy.testing import TestCase, measure
+
+from scipy.signal import get_window
+
+from scikits.talkbox.tools import nextpow2, segment_axis
+from scikits.talkbox.linpred.levinson_lpc import lpc, lpc_frames, \
+        levinson, schur, acorr_lpc, _acorr_method
+
+class BenchLPC(TestCase):
+    def bench_crossover(self):
+        print
+        print "    Autocorrelation method of lpc (40000 x 64 samples total)"
+        print "=============================================================="
+        print "     n | order |  fft (s) | direct (s) | ratio | auto"
+        print "--------------------------------------------------------------"
+        for n in [128, 256, 400, 1024, 4096]:
+            x = np.random.randn(40000 * 64 / n, n)
+            nfft = 2 ** nextpow2(2 * n - 1)
+            for order in [12, 20, 32, 48, 64]:
+                tf = measure("lpc(x, order, method='fft')", 5)
+                td = measure("lpc(x, order, method='direct')", 5)
+                ratio = n * (order + 1) / (nfft * np.log2(nfft))
+                print " %5d | %5d | %8.3f | %10.3f | %5.2f | %s" % \
+                      (n, order, tf, td, ratio, _acorr_method(n, order))
+
+    def bench_frames(self):
+        print
+        print "    Framewise lpc (10 minutes at 16 kHz, 400/160 frames)"
+        print "=============================================================="
+        print " order | windowed frames (s) | lpc_frames (s) | mem saved (MB)"
+        print "--------------------------------------------------------------"
+        x = np.random.randn(16000 * 600)
+        w = get_window('hamming', 400)
+        for order in [12, 20]:
+            tw = measure("lpc(segment_axis(x, 400, 240) * w, order)", 3)
+            tf = measure("lpc_frames(x, 400, 160, order)", 3)
+            saved = segment_axis(x, 400, 240).size * 8 / 2. ** 20
+            print " %5d | %19.3f | %14.3f | %14.0f" % (order, tw, tf, saved)
+
+    def bench_schur(self):
+        print
+        print "    Reflection coefficients only (20000 frames)"
+        print "=============================================================="
+        print " order | levinson (s) | schur (s) | float32 error lev. / schur"
+        print "--------------------------------------------------------------"
+        for order in [12, 20, 32, 64]:
+            r = acorr_lpc(np.random.randn(20000, 2 * order))
+            tl = measure("levinson(r, order)", 5)
+            ts = measure("schur(r, order)", 5)
+            ref = levinson(r, order)[2]
+            el = np.abs(levinson(r, order, dtype=np.float32)[2] - ref).max()
+            es = np.abs(schur(r, order, dtype=np.float32)[0] - ref).max()
+            print " %5d | %12.3f | %9.3f | %10.2e / %8.2e" % \
+                  (order, tl, ts, el, es)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from scikits.talkbox.tools.dtypes import floating_dtype
+
+from scikits.talkbox.linpred._lpc import burg as c_burg
+from scikits.talkbox.linpred.levinson_lpc import _solve_rows
+
+__all__ = ['lpc_burg']
+
+def lpc_burg(signal, order, axis=-1, dtype=None, n_jobs=1):
+    """Compute the Linear Prediction Coefficients with Burg's method.
+
+    Return the order + 1 LPC coefficients for the signal, with the same
+    conventions as lpc.
+
+    Parameters
+    ----------
+    signal: array_like
+        input signal
+    order : int
+        LPC order (the output will have order + 1 items)
+    axis : int, optional
+        axis over which the LPC are computed. -1 by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32.
+    n_jobs : int, optional
+        number of threads over which the frames are split (see levinson).
+
+    Returns
+    -------
+    a : array-like
+        the solution of the inversion.
+    e : array-like
+        the prediction error.
+    k : array-like
+        reflection coefficients.
+
+    Notes
+    -----
+    Instead of estimating the autocorrelation, Burg's method directly
+    estimates each reflection coefficient from the signal, by minimizing the
+    sum of the forward and backward prediction errors. The estimated filter is
+    always stable, and on short frames its poles are less biased than with the
+    autocorrelation method.
+
+    Every frame is processed by the same C loop (without the GIL), in O(n *
+    order) operations per frame of n samples."""
+    x = np.asarray(signal)
+    if not np.isrealobj(x):
+        raise ValueError("Complex input not supported yet")
+    n = x.shape[axis]
+    if order > n:
+        raise ValueError("Input signal must have length >= order")
+    x = x.astype(floating_dtype(dtype), copy=False)
+    return _solve_rows(c_burg, x, order, axis, n_jobs)
@@ -4,12 +4,14 @@ from scipy.signal import lfilter
 
 #from scikits.talkbox.linpred import lpc
 from scikits.talkbox.linpred.levinson_lpc import levinson, lpc
+from scikits.talkbox.linpred.burg_lpc import lpc_burg
 from scikits.talkbox.tools import slfilter
 from scikits.talkbox.tools.cacorr import acorr
 
 __all__ = ["lpcres"]
 
-def lpcres(signal, order, usefft=True):
+def lpcres(signal, order, usefft=True, method='autocorr',
+           filter_method='auto'):
     """Compute the LPC residual of a signal.
 
     The LPC residual is the 'error' signal from LPC analysis, and is defined
@@ -27,6 +29,17 @@ def lpcres(signal, order, usefft=True):
         supported.
     order : int
         LPC order
+    usefft : bool
+        if True (default), the autocorrelation is computed with a fft, for
+        the autocorrelation method.
+    method : {'autocorr', 'burg'}
+        LPC estimation method: autocorrelation method (lpc, default), or
+        Burg's method (lpc_burg).
+    filter_method : {'auto', 'direct', 'fft'}
+        how the signal is filtered by the LPC polynomial: direct filter, or
+        FFT block convolution (see tools.slfilter). 'auto' (default) uses the
+        FFT when it is expected to be faster, typically for high orders on
+        long signals.
 
     Returns
     -------
@@ -42,14 +55,27 @@ def lpcres(signal, order, usefft=True):
     In AR modelling, the residual is simply the estimated excitation of the AR
     filter.
     """
+    if not method in ['autocorr', 'burg']:
+        raise ValueError("method %s not understood" % method)
+
     if signal.ndim == 1:
-        return lfilter(lpc(signal, order)[0], 1., signal)
+        if method == 'burg':
+            cf = lpc_burg(signal, order)[0]
+        else:
+            cf = lpc(signal, order)[0]
+        if filter_method == 'direct':
+            return lfilter(cf, 1., signal)
+        return slfilter(cf[np.newaxis], np.ones((1, 1)), signal[np.newaxis],
+                        method=filter_method)[0]
     elif signal.ndim == 2:
-        if usefft:
+        if method == 'burg':
+            cf = lpc_burg(signal, order, axis=-1)[0]
+        elif usefft:
             cf = lpc(signal, order, axis=-1)[0]
         else:
             c = acorr(signal, maxlag=order, onesided=True)/signal.shape[-1]
             cf = levinson(c, order, axis=-1)[0]
-        return slfilter(cf, np.ones((cf.shape[0], 1)), signal)
+        return slfilter(cf, np.ones((cf.shape[0], 1)), signal,
+                        method=filter_method)
     else:
         raise ValueError("Input of rank > 2 not supported yet")
@@ -0,0 +1,367 @@
+"""Conversions between LPC coefficients and other representations of the LPC
+filter: reflection coefficients, log area ratios, line spectral frequencies
+and cepstrum.
+
+Every function works on the last axis, and is vectorized over the other ones:
+converting the parameters of many frames at once costs a handful of numpy
+operations per order, instead of a python loop over the frames."""
+
+import numpy as np
+
+__all__ = ['lpc_to_rc', 'rc_to_lpc', 'rc_to_lar', 'lar_to_rc', 'lpc_to_lsf',
+           'lsf_to_lpc', 'lpc_to_cepstrum', 'cepstrum_to_lpc']
+
+def _asfloat(x):
+    x = np.asarray(x)
+    return x.astype(np.result_type(x.dtype, np.float32), copy=False)
+
+def lpc_to_rc(a):
+    """Convert LPC coefficients to reflection coefficients.
+
+    Parameters
+    ----------
+    a : array-like
+        LPC coefficients (order + 1 items on the last axis), as returned by
+        lpc. They are normalized by a[..., 0].
+
+    Returns
+    -------
+    k : ndarray
+        reflection coefficients (order items on the last axis), with the
+        same convention as the ones returned by levinson.
+
+    Notes
+    -----
+    This is the step-down (backward Levinson) recursion. The filter is stable
+    if and only if every |k| < 1."""
+    a = _asfloat(a)
+    if a.ndim < 1 or a.shape[-1] < 1:
+        raise ValueError("a should have at least one coefficient")
+    a = a / a[..., :1]
+    p = a.shape[-1] - 1
+
+    k = np.empty(a.shape[:-1] + (p,), a.dtype)
+    for i in range(p, 0, -1):
+        ki = a[..., i:i+1]
+        k[..., i-1] = ki[..., 0]
+        # a^(i-1)[j] = (a[j] - k a[i-j]) / (1 - k^2), for j = 0 ... i-1
+        a = (a[..., :i] - ki * a[..., i:0:-1]) / (1 - ki ** 2)
+    return k
+
+def rc_to_lpc(k):
+    """Convert reflection coefficients to LPC coefficients.
+
+    Parameters
+    ----------
+    k : array-like
+        reflection coefficients (order items on the last axis).
+
+    Returns
+    -------
+    a : ndarray
+        LPC coefficients (order + 1 items on the last axis, a[..., 0] being
+        1).
+
+    Notes
+    -----
+    This is the step-up recursion, i.e. the update of the coefficients in the
+    Levinson-Durbin recursion."""
+    k = _asfloat(k)
+    if k.ndim < 1:
+        raise ValueError("k should be of rank >= 1")
+    p = k.shape[-1]
+
+    a = np.zeros(k.shape[:-1] + (p + 1,), k.dtype)
+    a[..., 0] = 1
+    for i in range(1, p + 1):
+        ki = k[..., i-1:i]
+        # a^(i)[j] = a^(i-1)[j] + k a^(i-1)[i-j], for j = 1 ... i
+        a[..., 1:i+1] += ki * a[..., i-1::-1][..., :i]
+    return a
+
+def rc_to_lar(k):
+    """Convert reflection coefficients to log area ratios.
+
+    The log area ratio of k is log((1 + k) / (1 - k)) = 2 arctanh(k). LAR are
+    much less sensitive to quantization than the reflection coefficients
+    close to +/- 1."""
+    k = _asfloat(k)
+    return 2 * np.arctanh(k)
+
+def lar_to_rc(g):
+    """Convert log area ratios to reflection coefficients (inverse of
+    rc_to_lar): k = tanh(g / 2)."""
+    g = _asfloat(g)
+    return np.tanh(0.5 * g)
+
+# Number of points of the grid on which the sign changes of the LSF
+# polynomials are searched, and number of bisection steps to refine the roots
+_LSF_NGRID = 256
+_LSF_NBISECT = 40
+
+def _symmetric_parts(a):
+    """Return the symmetric polynomials P' and Q' whose roots on the unit
+    circle are the LSF, as (..., 2m + 1) coefficient arrays.
+
+    P(z) = A(z) + z^-(p+1) A(1/z) and Q(z) = A(z) - z^-(p+1) A(1/z), divided
+    by their trivial roots at z = -1 and/or z = 1."""
+    p = a.shape[-1] - 1
+    ext = np.zeros(a.shape[:-1] + (p + 2,), a.dtype)
+    ext[..., :-1] = a
+    rev = ext[..., ::-1]
+    psum = ext + rev
+    pdiff = ext - rev
+
+    sign = (-1.) ** np.arange(p + 2)
+    if p % 2 == 0:
+        # P has a root at -1: divide by (1 + z^-1), ie c[n] = p[n] - c[n-1]
+        psum = sign * np.cumsum(sign * psum, axis=-1)
+        # Q has a root at 1: divide by (1 - z^-1), ie c[n] = q[n] + c[n-1]
+        pdiff = np.cumsum(pdiff, axis=-1)
+        return psum[..., :-1], pdiff[..., :-1]
+    else:
+        # Q has roots at -1 and 1: divide by (1 - z^-2)
+        q = np.empty_like(pdiff)
+        q[..., 0::2] = np.cumsum(pdiff[..., 0::2], axis=-1)
+        q[..., 1::2] = np.cumsum(pdiff[..., 1::2], axis=-1)
+        return psum, q[..., :-2]
+
+def _chebyshev(g):
+    """Coefficients c of the Chebyshev expansion of a symmetric polynomial g
+    of degree 2m on the unit circle: G(exp(jw)) = exp(-jmw) sum_i c[i]
+    T_i(cos(w))."""
+    m = (g.shape[-1] - 1) / 2
+    c = 2 * g[..., m::-1]
+    c[..., 0] *= 0.5
+    return c
+
+def _clenshaw(c, x):
+    """Evaluate the Chebyshev series c (last axis) at x (broadcast against
+    the other axes of c)."""
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+    for i in range(c.shape[-1] - 1, 0, -1):
+        b1, b2 = c[..., i] + 2 * x * b1 - b2, b1
+    return c[..., 0] + x * b1 - b2
+
+def _chebyshev_roots(c, ngrid):
+    """Find the m roots in (0, pi) of sum_i c[i] T_i(cos(w)) for every row
+    of c (2d array of shape (nframes, m + 1)), as a (nframes, m) array.
+
+    Also returns a boolean mask of the rows where the grid search found m
+    sign changes: the roots of the other rows are undefined."""
+    m = c.shape[-1] - 1
+    w = np.linspace(0, np.pi, ngrid)
+    # Values on the grid for every frame at once: T_i(cos(w)) = cos(i w)
+    vals = np.dot(c, np.cos(np.outer(np.arange(m + 1), w)))
+    change = np.signbit(vals[:, :-1]) != np.signbit(vals[:, 1:])
+    found = np.sum(change, axis=-1) == m
+
+    roots = np.empty((c.shape[0], m), c.dtype)
+    if m == 0:
+        return roots, found
+    cols = np.nonzero(change[found])[1].reshape(-1, m)
+    cf = c[found][:, np.newaxis, :]
+
+    # Bisection on every bracketed root at once
+    lo = w[cols]
+    hi = w[cols + 1]
+    flo = vals[found][np.arange(cols.shape[0])[:, np.newaxis], cols]
+    for i in range(_LSF_NBISECT):
+        mid = 0.5 * (lo + hi)
+        fmid = _clenshaw(cf, np.cos(mid))
+        left = np.signbit(fmid) == np.signbit(flo)
+        lo = np.where(left, mid, lo)
+        flo = np.where(left, fmid, flo)
+        hi = np.where(left, hi, mid)
+    roots[found] = 0.5 * (lo + hi)
+    return roots, found
+
+def lpc_to_lsf(a):
+    """Convert LPC coefficients to line spectral frequencies.
+
+    Parameters
+    ----------
+    a : array-like
+        LPC coefficients (order + 1 items on the last axis), of a minimum
+        phase filter (as returned by lpc).
+
+    Returns
+    -------
+    lsf : ndarray
+        line spectral frequencies (order items on the last axis), in radians,
+        in increasing order in (0, pi).
+
+    Notes
+    -----
+    The LSF are the angles of the roots of the polynomials
+    P(z) = A(z) + z^-(p+1) A(1/z) and Q(z) = A(z) - z^-(p+1) A(1/z), which
+    are on the unit circle and interlaced for a minimum phase A. Instead of a
+    general root finder, both polynomials are written as Chebyshev series in
+    cos(w): their sign changes are located on a grid (one matrix product for
+    every frame at once), and the roots are refined by a vectorized
+    bisection.
+
+    ValueError is raised if the roots cannot be found, typically because the
+    filter is not minimum phase."""
+    a = _asfloat(a)
+    if a.ndim < 1 or a.shape[-1] < 1:
+        raise ValueError("a should have at least one coefficient")
+    a = a / a[..., :1]
+    shape = a.shape[:-1]
+    p = a.shape[-1] - 1
+    a = a.reshape(-1, p + 1)
+
+    lsf = np.empty((a.shape[0], p), a.dtype)
+    for i, g in enumerate(_symmetric_parts(a)):
+        c = _chebyshev(g)
+        roots, found = _chebyshev_roots(c, _LSF_NGRID)
+        if not np.all(found):
+            # Roots closer than the grid step: retry on a finer grid
+            missing = ~found
+            roots[missing], found[missing] = \
+                    _chebyshev_roots(c[missing], 16 * _LSF_NGRID)
+            if not np.all(found):
+                raise ValueError("Could not find the LSF: the filter is "
+                                 "probably not minimum phase")
+        # The roots of P and Q are interlaced, starting with P
+        lsf[:, i::2] = roots
+    return lsf.reshape(shape + (p,))
+
+def _multiply_quadratics(lsf):
+    """Compute the coefficients of prod_i (1 - 2 cos(lsf[i]) z^-1 + z^-2) on
+    the last axis."""
+    m = lsf.shape[-1]
+    poly = np.zeros(lsf.shape[:-1] + (2 * m + 1,), lsf.dtype)
+    poly[..., 0] = 1
+    c = -2 * np.cos(lsf)
+    for i in range(m):
+        # Multiply the degree 2i polynomial by (1 + c z^-1 + z^-2)
+        old = poly[..., :2*i+1].copy()
+        poly[..., 1:2*i+2] += c[..., i:i+1] * old
+        poly[..., 2:2*i+3] += old
+    return poly
+
+def lsf_to_lpc(lsf):
+    """Convert line spectral frequencies to LPC coefficients (inverse of
+    lpc_to_lsf).
+
+    Parameters
+    ----------
+    lsf : array-like
+        line spectral frequencies (order items on the last axis), in radians,
+        in increasing order.
+
+    Returns
+    -------
+    a : ndarray
+        LPC coefficients (order + 1 items on the last axis, a[..., 0] being
+        1)."""
+    lsf = _asfloat(lsf)
+    if lsf.ndim < 1:
+        raise ValueError("lsf should be of rank >= 1")
+    p = lsf.shape[-1]
+
+    psym = _multiply_quadratics(lsf[..., 0::2])
+    qsym = _multiply_quadratics(lsf[..., 1::2])
+    P = np.zeros(lsf.shape[:-1] + (p + 2,), lsf.dtype)
+    Q = np.zeros(lsf.shape[:-1] + (p + 2,), lsf.dtype)
+    if p % 2 == 0:
+        # Multiply back by (1 + z^-1) and (1 - z^-1)
+        P[..., :-1] += psym
+        P[..., 1:] += psym
+        Q[..., :-1] += qsym
+        Q[..., 1:] -= qsym
+    else:
+        # Multiply back Q by (1 - z^-2)
+        P[...] = psym
+        Q[..., :-2] += qsym
+        Q[..., 2:] -= qsym
+    return 0.5 * (P + Q)[..., :-1]
+
+def lpc_to_cepstrum(a, e, ncep):
+    """Compute the cepstrum of the all-pole model sqrt(e) / A(z).
+
+    Parameters
+    ----------
+    a : array-like
+        LPC coefficients (order + 1 items on the last axis), as returned by
+        lpc. They are normalized by a[..., 0].
+    e : array-like
+        prediction error (one item per frame), as returned by lpc.
+    ncep : int
+        number of cepstral coefficients, including c[..., 0].
+
+    Returns
+    -------
+    c : ndarray
+        cepstral coefficients (ncep items on the last axis).
+
+    Notes
+    -----
+    The coefficients are computed by the recursion
+
+        c[0] = log(e) / 2
+        c[n] = -a[n] - sum_{k=1}^{n-1} (k / n) c[k] a[n-k]
+
+    (a[n] being 0 for n > order), which costs O(order * ncep) per frame,
+    without any FFT or log spectrum."""
+    a = _asfloat(a)
+    if a.ndim < 1 or a.shape[-1] < 1:
+        raise ValueError("a should have at least one coefficient")
+    if ncep < 1:
+        raise ValueError("ncep should be >= 1")
+    a = a / a[..., :1]
+    e = np.reshape(np.asarray(e, a.dtype), a.shape[:-1])
+    p = a.shape[-1] - 1
+
+    c = np.empty(a.shape[:-1] + (ncep,), a.dtype)
+    c[..., 0] = 0.5 * np.log(e)
+    for n in range(1, ncep):
+        lo = max(1, n - p)
+        w = np.arange(lo, n) / float(n)
+        acc = np.sum(w * c[..., lo:n] * a[..., n-lo:0:-1], axis=-1)
+        if n <= p:
+            acc += a[..., n]
+        c[..., n] = -acc
+    return c
+
+def cepstrum_to_lpc(c, order=None):
+    """Compute the all-pole model from its cepstrum (inverse of
+    lpc_to_cepstrum).
+
+    Parameters
+    ----------
+    c : array-like
+        cepstral coefficients (ncep items on the last axis, including
+        c[..., 0]).
+    order : int
+        order of the model. Defaults to ncep - 1; it cannot be higher.
+
+    Returns
+    -------
+    a : ndarray
+        LPC coefficients (order + 1 items on the last axis, a[..., 0] being
+        1).
+    e : ndarray
+        prediction error (one item per frame).
+
+    Notes
+    -----
+    The cepstrum of an all-pole model of order p is entirely determined by
+    its p + 1 first coefficients, which are the only ones used here."""
+    c = _asfloat(c)
+    if c.ndim < 1 or c.shape[-1] < 1:
+        raise ValueError("c should have at least one coefficient")
+    if order is None:
+        order = c.shape[-1] - 1
+    if order < 0 or order >= c.shape[-1]:
+        raise ValueError("order should be in [0, %d]" % (c.shape[-1] - 1))
+
+    a = np.empty(c.shape[:-1] + (order + 1,), c.dtype)
+    a[..., 0] = 1
+    for n in range(1, order + 1):
+        w = np.arange(1, n) / float(n)
+        a[..., n] = -c[..., n] - np.sum(w * c[..., 1:n] * a[..., n-1:0:-1],
+                                        axis=-1)
+    return a, np.exp(2 * c[..., 0])
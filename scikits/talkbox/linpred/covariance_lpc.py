@@ -0,0 +1,154 @@
+"""Covariance and modified covariance methods for LPC estimation."""
+
+import numpy as np
+
+from scikits.talkbox.tools.dtypes import floating_dtype
+
+__all__ = ['lpc_covariance', 'lpc_modcovariance']
+
+def lpc_covariance(signal, order, axis=-1, dtype=None):
+    """Compute the Linear Prediction Coefficients with the covariance method.
+
+    The coefficients minimize the forward prediction error over the samples
+    order, ..., n - 1 of the signal only, instead of the whole (implicitely
+    zero padded) signal as with the autocorrelation method (lpc).
+
+    Parameters
+    ----------
+    signal: array_like
+        input signal
+    order : int
+        LPC order (the output will have order + 1 items)
+    axis : int, optional
+        axis over which the LPC are computed. -1 by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32.
+
+    Returns
+    -------
+    a : array-like
+        the LPC coefficients, a[0] being 1.
+    e : array-like
+        the prediction error (mean squared error over the n - order predicted
+        samples).
+
+    Notes
+    -----
+    The covariance matrices of every frame are computed at once, in O(n *
+    order) operations per frame, and the normal equations of every frame are
+    solved with a batched Cholesky decomposition.
+
+    The covariance matrix is not Toeplitz, hence the O(order^3) solving cost
+    instead of O(order^2) for levinson. It must also be positive definite:
+    np.linalg.LinAlgError is raised otherwise (for example for a frame of
+    zeros).
+
+    The estimated filter is not guaranteed to be stable, contrary to the
+    autocorrelation or Burg methods."""
+    return _covariance_lpc(signal, order, axis, dtype, False)
+
+def lpc_modcovariance(signal, order, axis=-1, dtype=None):
+    """Compute the Linear Prediction Coefficients with the modified covariance
+    (forward-backward) method.
+
+    The coefficients minimize the sum of the forward and backward prediction
+    errors over the samples which do not need any padding.
+
+    Parameters
+    ----------
+    signal: array_like
+        input signal
+    order : int
+        LPC order (the output will have order + 1 items)
+    axis : int, optional
+        axis over which the LPC are computed. -1 by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32.
+
+    Returns
+    -------
+    a : array-like
+        the LPC coefficients, a[0] being 1.
+    e : array-like
+        the prediction error (mean of the squared forward and backward
+        errors).
+
+    Notes
+    -----
+    See lpc_covariance. The backward covariance matrix is the forward one with
+    its rows and columns reversed, so both cost the same."""
+    return _covariance_lpc(signal, order, axis, dtype, True)
+
+def _covariance_lpc(signal, order, axis, dtype, modified):
+    x = np.asarray(signal)
+    if not np.isrealobj(x):
+        raise ValueError("Complex input not supported yet")
+    n = x.shape[axis]
+    if order >= n:
+        raise ValueError("Input signal must have length > order")
+    x = x.astype(floating_dtype(dtype), copy=False)
+    axis = axis % x.ndim
+
+    # The other axes keep their order, so that e needs no transposition
+    if axis != x.ndim - 1:
+        x = np.rollaxis(x, axis, x.ndim)
+    shape = x.shape[:-1]
+    a, e = _covariance_rows(np.ascontiguousarray(x).reshape(-1, n), order,
+                            modified)
+    a = a.reshape(shape + (order + 1,))
+    e = e.reshape(shape)
+    if axis != x.ndim - 1:
+        a = np.rollaxis(a, x.ndim - 1, axis)
+    return a, e
+
+def _covariance_rows(x, order, modified):
+    """Covariance method on each row of the contiguous 2d array x."""
+    nframes, n = x.shape
+    p = order
+
+    # c[f, i, j] = sum_t x[f, t - i] x[f, t - j], for t = p ... n - 1. The
+    # first row is computed from the lagged products, and the other ones with
+    # c[i, j] = c[i-1, j-1] + x[p-i] x[p-j] - x[n-i] x[n-j]
+    c = np.empty((nframes, p + 1, p + 1), x.dtype)
+    for j in range(p + 1):
+        c[:, 0, j] = np.einsum('ij,ij->i', x[:, p:], x[:, p-j:n-j])
+    for i in range(1, p + 1):
+        head = x[:, p-i::-1]
+        tail = x[:, n-i:n-p-1:-1]
+        c[:, i, i:] = c[:, i-1, i-1:p]
+        c[:, i, i:] += head[:, :1] * head
+        c[:, i, i:] -= tail[:, :1] * tail
+        c[:, i:, i] = c[:, i, i:]
+    c[:, 1:, 0] = c[:, 0, 1:]
+    if modified:
+        # The backward errors use x[t - p + i]: reversed lags
+        c += c[:, ::-1, ::-1]
+        nerr = 2 * (n - p)
+    else:
+        nerr = n - p
+
+    a = np.empty((nframes, p + 1), x.dtype)
+    a[:, 0] = 1
+    if p > 0:
+        a[:, 1:] = _cholesky_solve(c[:, 1:, 1:], -c[:, 1:, 0])
+    # Minimal error: c00 + sum_j a[j] c0j
+    e = np.sum(a * c[:, 0, :], axis=-1) / nerr
+    return a, e
+
+def _cholesky_solve(m, b):
+    """Solve the stack of symmetric positive definite systems m[f] x[f] = b[f]
+    with a batched Cholesky decomposition."""
+    l = np.linalg.cholesky(m)
+    p = b.shape[-1]
+
+    # Forward substitution: l y = b
+    y = np.empty_like(b)
+    for i in range(p):
+        acc = b[:, i] - np.sum(l[:, i, :i] * y[:, :i], axis=-1)
+        y[:, i] = acc / l[:, i, i]
+    # Backward substitution: l^T x = y
+    x = np.empty_like(b)
+    for i in range(p - 1, -1, -1):
+        acc = y[:, i] - np.sum(l[:, i+1:, i] * x[:, i+1:], axis=-1)
+        x[:, i] = acc / l[:, i, i]
+    return x
@@ -3,15 +3,30 @@
 # Last Change: Wed Sep 24 06:00 PM 2008 J
 
 import numpy as np
-from scipy.fftpack import fft, ifft
+from scipy.signal import get_window
 
-from scikits.talkbox.tools import nextpow2
+from scikits.talkbox.tools import nextpow2, segment_axis
+from scikits.talkbox.tools.fftutils import rfft_power, irfft_power
+from scikits.talkbox.tools.dtypes import floating_dtype
+from scikits.talkbox.tools.cacorr import acorr as c_acorr
+from scikits.talkbox.tools.parallel import map_row_blocks
 
-from scikits.talkbox.linpred._lpc import levinson as c_levinson
+from scikits.talkbox.linpred._lpc import levinson as c_levinson, \
+        levinson_triangle as c_levinson_triangle, schur as c_schur
 
-__all__ = ['levinson', 'lpc']
+__all__ = ['levinson', 'schur', 'lpc', 'lpc_frames', 'lpc_order_select']
 
-def lpc(signal, order, axis=-1):
+# The direct autocorrelation of the order + 1 first lags costs ~ n * (order + 1)
+# multiply-adds per frame, and the fft one ~ nfft * log2(nfft) (nfft being the
+# fft size for n samples): method='auto' uses the direct computation when the
+# ratio of both is below this threshold (see benchmarks/bench_lpc.py).
+_DIRECT_COST_RATIO = 1.5
+
+# Number of samples windowed at once by lpc_frames: the scratch buffer should
+# stay in cache
+_FRAME_BLOCK_SIZE = 2 ** 15
+
+def lpc(signal, order, axis=-1, dtype=None, method='auto', n_jobs=1):
     """Compute the Linear Prediction Coefficients.
 
     Return the order + 1 LPC coefficients for the signal. c = lpc(x, k) will
@@ -27,6 +42,20 @@ def lpc(signal, order, axis=-1):
         input signal
     order : int
         LPC order (the output will have order + 1 items)
+    axis : int, optional
+        axis over which the LPC are computed. -1 by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32. In float32,
+        the autocorrelation and the Levinson-Durbin recursion are done in
+        single precision.
+    method : {'auto', 'fft', 'direct'}, optional
+        how the autocorrelation is computed. 'fft' computes every lag with an
+        fft, 'direct' only computes the order + 1 lags needed by the
+        Levinson-Durbin recursion, with a C loop. 'auto' (default) picks the
+        cheapest of both from the signal size and the order.
+    n_jobs : int, optional
+        number of threads for the direct autocorrelation and the
+        Levinson-Durbin recursion of the frames (see levinson).
 
     Returns
     -------
@@ -40,32 +69,133 @@ def lpc(signal, order, axis=-1):
     Notes
     -----
     This uses Levinson-Durbin recursion for the autocorrelation matrix
-    inversion, and fft for the autocorrelation computation.
+    inversion, and fft or direct computation for the autocorrelation.
 
     For small order, particularly if order << signal size, direct computation
-    of the autocorrelation is faster: use levinson and correlate in this case."""
+    of the autocorrelation is faster: for typical speech frames (n = 400,
+    order <= 20), the direct autocorrelation is 3 to 5 times faster than the
+    fft one."""
+    signal = np.asarray(signal)
     n = signal.shape[axis]
     if order > n:
         raise ValueError("Input signal must have length >= order")
+    if not method in ['auto', 'fft', 'direct']:
+        raise ValueError("method %s not understood" % method)
+    if method == 'auto':
+        method = _acorr_method(n, order)
+
+    if method == 'direct':
+        r = acorr_lpc_direct(signal, order, axis, dtype, n_jobs)
+    else:
+        r = acorr_lpc(signal, axis, dtype)
+    return levinson(r, order, axis, dtype, n_jobs)
+
+def lpc_frames(signal, nwin, hop, order, window='hamming', dtype=None,
+               n_jobs=1):
+    """Compute the Linear Prediction Coefficients of every frame of a signal.
+
+    This is equivalent to lpc(segment_axis(signal, nwin, nwin - hop) * w,
+    order), w being the analysis window, but the windowed frames are never
+    stored: they are windowed by blocks into a small scratch buffer, from which
+    only the order + 1 needed autocorrelation lags are computed.
+
+    Parameters
+    ----------
+    signal : array_like
+        input signal (rank 1).
+    nwin : int
+        size of the frames, in samples.
+    hop : int
+        number of samples between the start of consecutive frames.
+    order : int
+        LPC order (the output will have order + 1 items per frame)
+    window : str, tuple or array_like
+        analysis window: either its nwin samples, or a window specification
+        as understood by scipy.signal.get_window. Hamming by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32.
+    n_jobs : int, optional
+        number of threads for the autocorrelation and the Levinson-Durbin
+        recursion (see levinson).
+
+    Returns
+    -------
+    a : ndarray
+        the LPC coefficients of every frame, of shape (nframes, order + 1).
+    e : ndarray
+        the prediction error of every frame, of shape (nframes,).
+    k : ndarray
+        the reflection coefficients of every frame, of shape (nframes,
+        order).
+
+    Notes
+    -----
+    Only the complete frames are analysed: nframes is 1 + (n - nwin) / hop,
+    or 0 if the signal is shorter than nwin."""
+    x = np.asarray(signal)
+    if x.ndim != 1:
+        raise ValueError("Only rank 1 input supported for now.")
+    if not np.isrealobj(x):
+        raise ValueError("Complex input not supported yet")
+    if hop < 1 or hop > nwin:
+        raise ValueError("hop should be between 1 and nwin")
+    if order >= nwin:
+        raise ValueError("Frame size must be > order")
+    dtype = floating_dtype(dtype)
 
-    r = acorr_lpc(signal, axis)
-    return levinson(r, order, axis)
+    if isinstance(window, (basestring, tuple)):
+        w = get_window(window, nwin)
+    else:
+        w = np.asarray(window)
+        if w.shape != (nwin,):
+            raise ValueError("window should have nwin samples")
+    w = w.astype(dtype)
+
+    if x.size < nwin:
+        return (np.empty((0, order + 1), dtype), np.empty(0, dtype),
+                np.empty((0, order), dtype))
+    x = np.ascontiguousarray(x, dtype)
+    nframes = 1 + (x.size - nwin) / hop
+    # Strided view of the frames: no copy
+    frames = segment_axis(x[:(nframes - 1) * hop + nwin], nwin, nwin - hop)
+
+    r = np.empty((nframes, order + 1), dtype)
+    block = max(1, _FRAME_BLOCK_SIZE / nwin)
+    buf = np.empty((block, nwin), dtype)
+    for start in range(0, nframes, block):
+        m = min(block, nframes - start)
+        np.multiply(frames[start:start+m], w, buf[:m])
+        r[start:start+m] = c_acorr(buf[:m], maxlag=order, onesided=True,
+                                   n_jobs=n_jobs)
+    r /= nwin
+
+    return levinson(r, order, dtype=dtype, n_jobs=n_jobs)
+
+def _acorr_method(n, order):
+    """Return the cheapest autocorrelation method for lpc."""
+    nfft = 2 ** nextpow2(2 * n - 1)
+    if n * (order + 1) < _DIRECT_COST_RATIO * nfft * np.log2(nfft):
+        return 'direct'
+    return 'fft'
 
 def _acorr_last_axis(x, nfft, maxlag):
-    a = np.real(ifft(np.abs(fft(x, n=nfft) ** 2)))
+    a = irfft_power(rfft_power(x, nfft), nfft)
     return a[..., :maxlag+1] / x.shape[-1]
 
-def acorr_lpc(x, axis=-1):
+def acorr_lpc(x, axis=-1, dtype=None):
     """Compute autocorrelation of x along the given axis.
 
     This compute the biased autocorrelation estimator (divided by the size of
-    input signal)
+    input signal). The computation is done in the precision of x, unless dtype
+    (float32 or float64) is given.
 
     Notes
     -----
         The reason why we do not use acorr directly is for speed issue."""
     if not np.isrealobj(x):
         raise ValueError("Complex input not supported yet")
+    if dtype is not None:
+        x = np.asarray(x, floating_dtype(dtype))
 
     maxlag = x.shape[axis]
     nfft = 2 ** nextpow2(2 * maxlag - 1)
@@ -77,7 +207,27 @@ def acorr_lpc(x, axis=-1):
         a = np.swapaxes(a, -1, axis)
     return a
 
-def levinson(r, order, axis = -1):
+def acorr_lpc_direct(x, maxlag, axis=-1, dtype=None, n_jobs=1):
+    """Compute the lags 0 to maxlag of the autocorrelation of x along the given
+    axis.
+
+    Same as acorr_lpc(x, axis, dtype)[..., :maxlag+1] (for axis=-1), but only
+    the requested lags are computed, directly: this is faster than the fft
+    when maxlag is small compared to the size of x. x is not copied whatever
+    its layout, and the rows are split over n_jobs threads."""
+    x = np.asarray(x)
+    if not np.isrealobj(x):
+        raise ValueError("Complex input not supported yet")
+    if dtype is None and x.dtype == np.float32:
+        dtype = np.float32
+    x = x.astype(floating_dtype(dtype), copy=False)
+
+    a = c_acorr(x, maxlag=maxlag, onesided=True, axis=axis, n_jobs=n_jobs)
+    a /= x.shape[axis]
+    return a
+
+def levinson(r, order, axis = -1, dtype=None, n_jobs=1, all_orders=False,
+             return_triangle=False, out_a=None, out_e=None, out_k=None):
     """Levinson-Durbin recursion, to efficiently solve symmetric linear systems
     with toeplitz structure.
 
@@ -93,13 +243,35 @@ def levinson(r, order, axis = -1):
         order of the recursion. For order p, you will get p+1 coefficients.
     axis : int, optional
         axis over which the algorithm is applied. -1 by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32.
+    n_jobs : int, optional
+        number of threads over which the rows are split, for rank > 1 input.
+        1 (default) runs in the calling thread, and -1 uses one thread per
+        cpu.
+    all_orders : bool, optional
+        if True, the prediction error of every order 0, ..., order is
+        returned. They are a by-product of the recursion, so this costs
+        nothing more than the final order.
+    return_triangle : bool, optional
+        if True (requires all_orders), also return the solution of every
+        order instead of only the final one.
+    out_a, out_e, out_k : ndarray, optional
+        arrays in which a, e and k are written, instead of new arrays. They
+        must be C contiguous, of the computation precision and of the
+        shape of the corresponding output. Only for axis=-1, and not with
+        all_orders.
 
     Returns
     -------
     a : array-like
-        the solution of the inversion (see notes).
+        the solution of the inversion (see notes). With return_triangle, the
+        solutions of every order, as an array with two more axes of size
+        order + 1 (instead of one): a[..., i, :] is the solution of order i,
+        padded with zeros.
     e : array-like
-        the prediction error.
+        the prediction error. With all_orders, the errors of every order, the
+        order being on the given axis.
     k : array-like
         reflection coefficients.
 
@@ -117,14 +289,182 @@ def levinson(r, order, axis = -1):
     with respect to a. Using the special symmetry in the matrix, the inversion
     can be done in O(p^2) instead of O(p^3).
 
-    Only double argument are supported: float and long double are internally
-    converted to double, and complex input are not supported at all.
+    Only float and double argument are supported: other types are internally
+    converted to the requested precision, and complex input are not supported
+    at all.
+
+    The recursion runs without the GIL, so that levinson can also be called
+    concurrently from several python threads. It does not allocate any
+    memory but its outputs: with contiguous input of the requested precision
+    and out_a, out_e and out_k, repeated framewise calls do not allocate at
+    all.
     """
-    if axis != -1:
-        r = np.swapaxes(r, axis, -1)
-    a, e, k = c_levinson(r, order)
-    if axis != -1:
-        a = np.swapaxes(a, axis, -1)
-        e = np.swapaxes(e, axis, -1)
-        k = np.swapaxes(k, axis, -1)
+    if return_triangle and not all_orders:
+        raise ValueError("return_triangle requires all_orders")
+    r = np.asarray(r)
+    if np.isrealobj(r):
+        r = r.astype(floating_dtype(dtype), copy=False)
+    if out_a is not None or out_e is not None or out_k is not None:
+        return _levinson_out(r, order, axis, n_jobs, all_orders,
+                             (out_a, out_e, out_k))
+    if return_triangle:
+        return _solve_rows(c_levinson_triangle, r, order, axis, n_jobs)
+
+    a, e, k = _solve_rows(c_levinson, r, order, axis, n_jobs)
+    if all_orders:
+        # e[i] = r[0] * prod_{j < i} (1 - k[j] ** 2)
+        r0 = np.take(r, [0], axis=axis)
+        e = np.concatenate((r0, np.cumprod(1 - k ** 2, axis=axis) * r0),
+                           axis=axis)
     return a, e, k
+
+def _levinson_out(r, order, axis, n_jobs, all_orders, out):
+    """levinson on the last axis, writing into the given output arrays."""
+    if all_orders:
+        raise ValueError("out_a, out_e and out_k cannot be used with "
+                         "all_orders")
+    if r.ndim > 0 and axis % r.ndim != r.ndim - 1:
+        raise ValueError("out_a, out_e and out_k require axis=-1")
+    if r.ndim < 2 or n_jobs == 1:
+        return c_levinson(r, order, out_a=out[0], out_e=out[1],
+                          out_k=out[2])
+
+    # Each thread writes into the rows of the outputs of its block
+    shapes = (r.shape[:-1] + (order + 1,), r.shape[:-1],
+              r.shape[:-1] + (order,))
+    out = tuple(o if o is not None else np.empty(shape, r.dtype)
+                for o, shape in zip(out, shapes))
+    def func(x, a, e, k):
+        c_levinson(x, order, out_a=a, out_e=e, out_k=k)
+    return map_row_blocks(func, r, n_jobs, out=out)
+
+def schur(r, order, axis=-1, dtype=None, n_jobs=1):
+    """Schur algorithm: compute the reflection coefficients and the
+    prediction error of a symmetric toeplitz system, without its solution.
+
+    Parameters
+    ----------
+    r : array-like
+        input array, as for levinson (generally the autocorrelation of the
+        signal).
+    order : int
+        order of the recursion.
+    axis : int, optional
+        axis over which the algorithm is applied. -1 by default.
+    dtype : dtype, optional
+        precision of the computation, float64 (default) or float32.
+    n_jobs : int, optional
+        number of threads over which the rows are split (see levinson).
+
+    Returns
+    -------
+    k : array-like
+        reflection coefficients, as returned by levinson.
+    e : array-like
+        the prediction error, as returned by levinson.
+
+    Notes
+    -----
+    Instead of the coefficients of the solution, the Schur recursion updates
+    the correlations of the forward and backward prediction errors with r:
+    there is no inner product over the coefficients at each order, and each
+    step is a single pass over order + 1 items. This is cheaper than levinson
+    when only k is needed (lattice filters, stability checks), and as
+    accurate (see benchmarks/bench_lpc.py for timings). The coefficients can
+    still be obtained from k with rc_to_lpc."""
+    r = np.asarray(r)
+    if not np.isrealobj(r):
+        raise ValueError("Complex input not supported yet")
+    r = r.astype(floating_dtype(dtype), copy=False)
+    return _solve_rows(c_schur, r, order, axis, n_jobs)
+
+def lpc_order_select(signal, max_order, criterion='aic', axis=-1):
+    """Select the LPC order of a signal with an information criterion.
+
+    The prediction errors of every order up to max_order are computed by a
+    single Levinson-Durbin recursion, and the order minimizing the criterion
+    is returned.
+
+    Parameters
+    ----------
+    signal : array_like
+        input signal. For rank > 1 input, an order is selected for every
+        frame.
+    max_order : int
+        highest candidate order.
+    criterion : {'aic', 'mdl'}
+        information criterion: Akaike's criterion n log(e_p) + 2 p (default),
+        or Rissanen's minimum description length n log(e_p) + p log(n), which
+        penalizes high orders more.
+    axis : int, optional
+        axis over which the LPC are computed. -1 by default.
+
+    Returns
+    -------
+    order : int or ndarray
+        the selected order (of every frame).
+    crit : ndarray
+        the criterion for the orders 0, ..., max_order (on the given axis).
+    """
+    if not criterion in ['aic', 'mdl']:
+        raise ValueError("criterion %s not understood" % criterion)
+    signal = np.asarray(signal)
+    n = signal.shape[axis]
+    if max_order >= n:
+        raise ValueError("Input signal must have length > max_order")
+
+    if _acorr_method(n, max_order) == 'direct':
+        r = acorr_lpc_direct(signal, max_order, axis)
+    else:
+        r = acorr_lpc(signal, axis)
+    e = levinson(r, max_order, axis, all_orders=True)[1]
+
+    shape = [1] * e.ndim
+    shape[axis] = max_order + 1
+    p = np.arange(max_order + 1).reshape(shape)
+    if criterion == 'aic':
+        penalty = 2 * p
+    else:
+        penalty = p * np.log(n)
+    olderr = np.seterr(divide='ignore')
+    try:
+        crit = n * np.log(e) + penalty
+    finally:
+        np.seterr(**olderr)
+    order = np.argmin(crit, axis=axis)
+    if order.ndim == 0:
+        order = int(order)
+    return order, crit
+
+def _solve_rows(func, x, order, axis, n_jobs):
+    """Run a C lpc estimator func(x, order), which works on the last axis, on
+    the given axis of x, splitting the rows over n_jobs threads.
+
+    Every output of func has the frame axes of x first; the ones with extra
+    axes get their first extra axis at the position of axis."""
+    if axis != -1:
+        x = np.swapaxes(x, axis, -1)
+    if x.ndim > 1 and n_jobs != 1:
+        shape = x.shape[:-1]
+        res = map_row_blocks(lambda b: func(b, order),
+                             x.reshape(-1, x.shape[-1]), n_jobs)
+        res = tuple(y.reshape(shape + y.shape[1:]) for y in res)
+    else:
+        res = func(x, order)
+    if axis != -1 and x.ndim > 1:
+        res = tuple(_restore_axis(y, axis, x.ndim - 1) for y in res)
+    return res
+
+def _restore_axis(y, axis, nframeaxes):
+    """Undo the swap of axis with the last axis of the input on an output y,
+    whose nframeaxes first axes are the frame axes (the remaining axes of the
+    swapped input). The first of the other axes of y, if any, is put at the
+    position of axis."""
+    axis = axis % (nframeaxes + 1)
+    if axis == nframeaxes:
+        return y
+    # The last axis of the input ended up at position axis
+    y = np.moveaxis(y, axis, nframeaxes - 1)
+    if y.ndim > nframeaxes:
+        y = np.moveaxis(y, nframeaxes, axis)
+    return y
@@ -115,3 +115,55 @@ def levinson_1d(r, order):
         e *= 1 - k[i-1] * np.conj(k[i-1])
 
     return a, e, k
+
+def burg_ref(signal, order):
+    """Burg method for LPC estimation, straightforward python implementation.
+
+    Returns the same (a, e, k) triple as lpc, for a rank 1 signal. Use it as
+    educational and reference purpose only."""
+    x = np.asarray(signal, np.float64)
+    if x.ndim > 1:
+        raise ValueError("Array of rank > 1 not supported yet")
+
+    n = x.size
+    f = x.copy()
+    b = x.copy()
+    a = np.ones(1)
+    k = np.zeros(order)
+    e = np.dot(x, x) / n
+
+    for m in range(order):
+        # Forward errors f[m+1:], and backward errors b[m:-1] delayed by one
+        fm = f[m+1:].copy()
+        bm = b[m:-1].copy()
+        k[m] = -2 * np.dot(fm, bm) / (np.dot(fm, fm) + np.dot(bm, bm))
+        a = np.concatenate((a, [0])) + k[m] * np.concatenate((a, [0]))[::-1]
+        f[m+1:] = fm + k[m] * bm
+        b[m+1:] = bm + k[m] * fm
+        e *= 1 - k[m] ** 2
+
+    return a, e, k
+
+def covariance_ref(signal, order, modified=False):
+    """Covariance (or modified covariance) method for LPC estimation, solved
+    with scipy.linalg.solve. Returns the coefficients and the prediction
+    error, for a rank 1 signal. Use it as reference purpose only."""
+    x = np.asarray(signal, np.float64)
+    n = x.size
+    p = order
+
+    # Rows of the forward prediction problem: x[t] from x[t-1], ..., x[t-p]
+    past = np.array([x[t-p:t][::-1] for t in range(p, n)]).reshape(n - p, p)
+    target = x[p:]
+    if modified:
+        # Backward prediction: x[t-p] from x[t-p+1], ..., x[t]
+        bpast = np.array([x[t-p+1:t+1] for t in range(p, n)])
+        past = np.concatenate((past, bpast.reshape(n - p, p)))
+        target = np.concatenate((target, x[:n-p]))
+
+    a = np.ones(p + 1)
+    if p > 0:
+        a[1:] = sp.linalg.solve(np.dot(past.T, past),
+                                -np.dot(past.T, target))
+    err = target + np.dot(past, a[1:])
+    return a, np.dot(err, err) / target.size
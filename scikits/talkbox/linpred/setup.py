@@ -5,12 +5,14 @@ def configuration(parent_package='', top_path=None):
     from numpy.distutils.misc_util import Configuration
     config = Configuration('linpred', parent_package, top_path)
 
-    config.add_library('clpc', sources=['src/levinson.c'])
+    config.add_library('clpc', sources=['src/levinson.c', 'src/burg.c',
+                                        'src/schur.c'])
 
     config.add_extension('_lpc', sources=["src/_lpc.c"],
                          include_dirs=[np.get_include()],
                          libraries=["clpc"])
     config.add_data_dir('tests')
+    config.add_data_dir('benchmarks')
 
     return config
 
@@ -6,75 +6,110 @@
 #include <numpy/arrayobject.h>
 
 #include "levinson.h"
+#include "burg.h"
+#include "schur.h"
 
 /*
- * Levinson-Durbin recursion on one array. Output arrays are put into
- * alpccoeff, klpccoeff and elpc.
+ * Run the double or single precision levinson kernel depending on typenum.
  */
-int array_levinson_1d(PyArrayObject *arr, long order, PyArrayObject** alpccoeff,
-	              PyArrayObject **klpccoeff, PyArrayObject **elpc)
+static void levinson_typed(int typenum, const char* in, long order,
+                           char* acoeff, char* err, char* kcoeff)
 {
-	double *tmp;
-	npy_intp alpc_size = (order + 1);
-	npy_intp klpc_size = order;
-	npy_intp elpc_size = 1;
-
-	*alpccoeff = (PyArrayObject*)PyArray_SimpleNew(1, &alpc_size,
-                                                       PyArray_DOUBLE);
-        if(*alpccoeff == NULL) {
-                return -1;
-        }
-
-	*klpccoeff = (PyArrayObject*)PyArray_SimpleNew(1, &klpc_size,
-						       NPY_DOUBLE);
-        if(*klpccoeff == NULL) {
-                goto clean_alpccoeff;
-        }
-
-        *elpc = (PyArrayObject*)PyArray_SimpleNew(1, &elpc_size, NPY_DOUBLE);
-        if(*elpc == NULL) {
-                goto clean_klpccoeff;
-        }
-
-        tmp = malloc(sizeof(*tmp) * order);
-	if (tmp == NULL) {
-                goto clean_elpc;
+	if (typenum == NPY_FLOAT) {
+		levinson_float((const float*)in, order, (float*)acoeff,
+			       (float*)err, (float*)kcoeff);
+	} else {
+		levinson((const double*)in, order, (double*)acoeff,
+			 (double*)err, (double*)kcoeff);
 	}
+}
 
-        levinson((double*)(arr->data), order, 
-                 (double*)((*alpccoeff)->data), (double*)((*elpc)->data),
-                 (double*)((*klpccoeff)->data), tmp);
+/*
+ * Return a new reference to the output array given by the caller (out), after
+ * checking it can be written directly by the C loops, or a new array if out
+ * is NULL or None.
+ */
+static PyArrayObject* get_output(PyObject* out, const char* name, int rank,
+                                 npy_intp* dims, int typenum)
+{
+	int i;
+	PyArrayObject *arr;
 
-        free(tmp);
+	if (out == NULL || out == Py_None) {
+		return (PyArrayObject*)PyArray_SimpleNew(rank, dims, typenum);
+	}
 
-	return 0;
+	if (!PyArray_Check(out)) {
+		PyErr_Format(PyExc_TypeError, "%s should be an array", name);
+		return NULL;
+	}
+	arr = (PyArrayObject*)out;
+	if (PyArray_TYPE(arr) != typenum || !PyArray_ISCARRAY(arr)) {
+		PyErr_Format(PyExc_ValueError, "%s should be a writeable, C "
+			     "contiguous array of the input precision", name);
+		return NULL;
+	}
+	if (PyArray_NDIM(arr) != rank) {
+		goto bad_shape;
+	}
+	for (i = 0; i < rank; ++i) {
+		if (PyArray_DIM(arr, i) != dims[i]) {
+			goto bad_shape;
+		}
+	}
+	Py_INCREF(arr);
+	return arr;
 
-clean_elpc:
-        Py_DECREF(*elpc);
-clean_klpccoeff:
-        Py_DECREF(*klpccoeff);
-clean_alpccoeff:
-        Py_DECREF(*alpccoeff);
-        return -1;
+bad_shape:
+	PyErr_Format(PyExc_ValueError, "%s does not have the expected shape",
+		     name);
+	return NULL;
 }
 
-int array_levinson_nd(PyArrayObject *arr, long order,
-                      PyArrayObject** alpccoeff,
-                      PyArrayObject **klpccoeff, PyArrayObject **elpc)
+/*
+ * Levinson-Durbin recursion on every row (last axis) of in. The outputs are
+ * written in the arrays given by the caller if any (out_a, out_e and out_k
+ * may be NULL), so that no memory is allocated for contiguous input of the
+ * requested precision.
+ */
+PyObject* array_levinson(PyObject* in, long order, PyObject* out_a,
+                         PyObject* out_e, PyObject* out_k)
 {
-	double *acoeff, *kcoeff, *tmp;
-	double *err;
-	double *data;
-	npy_int rank;
+	int typenum, rank, i;
+	npy_intp n, nrepeat, elsize;
 	npy_intp alpc_size[NPY_MAXDIMS];
 	npy_intp klpc_size[NPY_MAXDIMS];
 	npy_intp elpc_size[NPY_MAXDIMS];
-	npy_int n, nrepeat;
-	int i;
+	char *data, *acoeff, *kcoeff, *err;
+	PyArrayObject *arr;
+	PyArrayObject *alpc = NULL, *klpc = NULL, *elpc = NULL;
+
+	/* float input is processed in single precision, anything else is
+	 * converted to double */
+	if (PyArray_Check(in) && PyArray_TYPE((PyArrayObject*)in) == NPY_FLOAT) {
+		typenum = NPY_FLOAT;
+	} else {
+		typenum = NPY_DOUBLE;
+	}
+	arr = (PyArrayObject*)PyArray_ContiguousFromObject(in, typenum, 1, 0);
+	if (arr == NULL) {
+		return NULL;
+	}
+
+	if (PyArray_SIZE(arr) < 1) {
+		PyErr_SetString(PyExc_ValueError, "Cannot operate on empty array !");
+		goto fail;
+	}
+	if (order < 0) {
+		PyErr_SetString(PyExc_ValueError, "Order should be >= 0");
+		goto fail;
+	}
 
 	rank = PyArray_NDIM(arr);
-	if (rank < 2) {
-		return -1;
+	n = PyArray_DIM(arr, rank-1);
+	if (n <= order) {
+		PyErr_SetString(PyExc_ValueError, "Order should be <= size-1");
+		goto fail;
 	}
 
 	nrepeat = 1;
@@ -86,72 +121,238 @@ int array_levinson_nd(PyArrayObject *arr, long order,
 	}
 	alpc_size[rank-1] = order + 1;
 	klpc_size[rank-1] = order;
+	/* The error of a rank 1 input is a 1 item array */
+	if (rank == 1) {
+		elpc_size[0] = 1;
+	}
+
+	alpc = get_output(out_a, "out_a", rank, alpc_size, typenum);
+	if (alpc == NULL) {
+		goto fail;
+	}
+	klpc = get_output(out_k, "out_k", rank, klpc_size, typenum);
+	if (klpc == NULL) {
+		goto fail;
+	}
+	elpc = get_output(out_e, "out_e", rank == 1 ? 1 : rank - 1, elpc_size,
+			  typenum);
+	if (elpc == NULL) {
+		goto fail;
+	}
 
-	*alpccoeff = (PyArrayObject*)PyArray_SimpleNew(rank, alpc_size,
-                                                       PyArray_DOUBLE);
-        if(*alpccoeff == NULL) {
-                return -1;
-        }
+	elsize = PyArray_ITEMSIZE(arr);
+	data = arr->data;
+	acoeff = alpc->data;
+	kcoeff = klpc->data;
+	err = elpc->data;
+	/* Only touches memory owned by the arrays above: other python threads
+	 * can run meanwhile, including other calls to levinson */
+	Py_BEGIN_ALLOW_THREADS
+	for (i = 0; i < nrepeat; ++i) {
+		levinson_typed(typenum, data, order, acoeff, err, kcoeff);
+		data += n * elsize;
+		acoeff += (order + 1) * elsize;
+		kcoeff += order * elsize;
+		err += elsize;
+	}
+	Py_END_ALLOW_THREADS
 
-	*klpccoeff = (PyArrayObject*)PyArray_SimpleNew(rank, klpc_size,
-						       NPY_DOUBLE);
-        if(*klpccoeff == NULL) {
-                goto clean_alpccoeff;
-        }
+	Py_DECREF(arr);
 
-        *elpc = (PyArrayObject*)PyArray_SimpleNew(rank-1, elpc_size, NPY_DOUBLE);
-        if(*elpc == NULL) {
-                goto clean_klpccoeff;
-        }
+	return Py_BuildValue("(NNN)", alpc, elpc, klpc);
 
-	tmp = malloc(sizeof(*tmp) * order);
-	if (tmp == NULL) {
-                goto clean_elpc;
+fail:
+	Py_XDECREF(alpc);
+	Py_XDECREF(klpc);
+	Py_XDECREF(elpc);
+	Py_DECREF(arr);
+	return NULL;
+}
+
+PyObject* PyArray_Levinson(PyObject* self, PyObject* args, PyObject* kwds)
+{
+	long order;
+	PyObject *in = NULL;
+	PyObject *out_a = NULL, *out_e = NULL, *out_k = NULL;
+	static char *kwlist[] = {"r", "order", "out_a", "out_e", "out_k",
+				 NULL};
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwds, "Ol|OOO", kwlist, &in,
+					 &order, &out_a, &out_e, &out_k)) {
+		return NULL;
+	}
+
+	return array_levinson(in, order, out_a, out_e, out_k);
+}
+
+/*
+ * Run the double or single precision levinson_triangle kernel depending on
+ * typenum.
+ */
+static void levinson_triangle_typed(int typenum, const char* in, long order,
+                                    char* tri, char* err, char* kcoeff)
+{
+	if (typenum == NPY_FLOAT) {
+		levinson_triangle_float((const float*)in, order, (float*)tri,
+					(float*)err, (float*)kcoeff);
+	} else {
+		levinson_triangle((const double*)in, order, (double*)tri,
+				  (double*)err, (double*)kcoeff);
+	}
+}
+
+/*
+ * Levinson-Durbin recursion on every row (last axis) of in, keeping every
+ * order: returns the (..., order+1, order+1) triangle of solutions, the
+ * (..., order+1) errors and the (..., order) reflection coefficients.
+ */
+PyObject* array_levinson_triangle(PyObject* in, long order)
+{
+	int typenum, rank, i;
+	npy_intp n, nrepeat, elsize;
+	npy_intp tri_size[NPY_MAXDIMS+1];
+	npy_intp err_size[NPY_MAXDIMS];
+	npy_intp k_size[NPY_MAXDIMS];
+	char *data, *tcoeff, *kcoeff, *err;
+	PyArrayObject *arr;
+	PyArrayObject *tri = NULL, *klpc = NULL, *elpc = NULL;
+
+	if (PyArray_Check(in) && PyArray_TYPE((PyArrayObject*)in) == NPY_FLOAT) {
+		typenum = NPY_FLOAT;
+	} else {
+		typenum = NPY_DOUBLE;
+	}
+	arr = (PyArrayObject*)PyArray_ContiguousFromObject(in, typenum, 1,
+							  NPY_MAXDIMS - 1);
+	if (arr == NULL) {
+		return NULL;
+	}
+
+	if (PyArray_SIZE(arr) < 1) {
+		PyErr_SetString(PyExc_ValueError, "Cannot operate on empty array !");
+		goto fail;
+	}
+	if (order < 0) {
+		PyErr_SetString(PyExc_ValueError, "Order should be >= 0");
+		goto fail;
 	}
 
-	data = (double*)arr->data;
-	acoeff = (double*)((*alpccoeff)->data);
-	kcoeff = (double*)((*klpccoeff)->data);
-	err = (double*)((*elpc)->data);
+	rank = PyArray_NDIM(arr);
 	n = PyArray_DIM(arr, rank-1);
-	for(i = 0; i < nrepeat; ++i) {
-		levinson(data, order, acoeff, err, kcoeff, tmp);
-		data += n;
-		acoeff += order + 1;
-		kcoeff += order;
-		err += 1;
-	}
-
-        free(tmp);
-        return 0;
-
-clean_elpc:
-        Py_DECREF(*elpc);
-clean_klpccoeff:
-        Py_DECREF(*klpccoeff);
-clean_alpccoeff:
-        Py_DECREF(*alpccoeff);
-	return -1;
+	if (n <= order) {
+		PyErr_SetString(PyExc_ValueError, "Order should be <= size-1");
+		goto fail;
+	}
+
+	nrepeat = 1;
+	for (i = 0; i < rank - 1; ++i) {
+		nrepeat *= PyArray_DIM(arr, i);
+		tri_size[i] = PyArray_DIM(arr, i);
+		err_size[i] = PyArray_DIM(arr, i);
+		k_size[i] = PyArray_DIM(arr, i);
+	}
+	tri_size[rank-1] = order + 1;
+	tri_size[rank] = order + 1;
+	err_size[rank-1] = order + 1;
+	k_size[rank-1] = order;
+
+	tri = (PyArrayObject*)PyArray_SimpleNew(rank + 1, tri_size, typenum);
+	elpc = (PyArrayObject*)PyArray_SimpleNew(rank, err_size, typenum);
+	klpc = (PyArrayObject*)PyArray_SimpleNew(rank, k_size, typenum);
+	if (tri == NULL || klpc == NULL || elpc == NULL) {
+		goto fail;
+	}
+
+	elsize = PyArray_ITEMSIZE(arr);
+	data = arr->data;
+	tcoeff = tri->data;
+	kcoeff = klpc->data;
+	err = elpc->data;
+	Py_BEGIN_ALLOW_THREADS
+	for (i = 0; i < nrepeat; ++i) {
+		levinson_triangle_typed(typenum, data, order, tcoeff, err,
+					kcoeff);
+		data += n * elsize;
+		tcoeff += (order + 1) * (order + 1) * elsize;
+		kcoeff += order * elsize;
+		err += (order + 1) * elsize;
+	}
+	Py_END_ALLOW_THREADS
+
+	Py_DECREF(arr);
+
+	return Py_BuildValue("(NNN)", tri, elpc, klpc);
+
+fail:
+	Py_XDECREF(tri);
+	Py_XDECREF(klpc);
+	Py_XDECREF(elpc);
+	Py_DECREF(arr);
+	return NULL;
+}
+
+PyObject* PyArray_LevinsonTriangle(PyObject* self, PyObject* args)
+{
+	long order;
+	PyObject *in = NULL;
+
+	if (!PyArg_ParseTuple(args, "Ol", &in, &order)) {
+		return NULL;
+	}
+
+	return array_levinson_triangle(in, order);
 }
 
-PyObject* array_levinson(PyObject* in, long order)
+/*
+ * Run the double or single precision burg kernel depending on typenum.
+ * tmp must have at least 2 * size + order + 1 elements of the corresponding
+ * type.
+ */
+static void burg_typed(int typenum, const char* in, npy_intp size, long order,
+                       char* acoeff, char* err, char* kcoeff, char* tmp)
 {
-	npy_intp rank, size, n;
+	if (typenum == NPY_FLOAT) {
+		burg_float((const float*)in, size, order, (float*)acoeff,
+			   (float*)err, (float*)kcoeff, (float*)tmp);
+	} else {
+		burg((const double*)in, size, order, (double*)acoeff,
+		     (double*)err, (double*)kcoeff, (double*)tmp);
+	}
+}
+
+/*
+ * Burg method on every row (last axis) of arr. The outputs have the same
+ * shapes as for levinson.
+ */
+PyObject* array_burg(PyObject* in, long order)
+{
+	int typenum, rank, i;
+	npy_intp n, nrepeat, elsize;
+	npy_intp alpc_size[NPY_MAXDIMS];
+	npy_intp klpc_size[NPY_MAXDIMS];
+	npy_intp elpc_size[NPY_MAXDIMS];
+	char *data, *acoeff, *kcoeff, *err, *tmp;
 	PyArrayObject *arr;
-	PyObject *out = NULL;
-	PyArrayObject *alpc, *klpc, *err;
+	PyArrayObject *alpc = NULL, *klpc = NULL, *elpc = NULL;
 
-	arr = (PyArrayObject*)PyArray_ContiguousFromObject(in, PyArray_DOUBLE,
-							   1, 0);
+	if (PyArray_Check(in) && PyArray_TYPE((PyArrayObject*)in) == NPY_FLOAT) {
+		typenum = NPY_FLOAT;
+	} else {
+		typenum = NPY_DOUBLE;
+	}
+	arr = (PyArrayObject*)PyArray_ContiguousFromObject(in, typenum, 1, 0);
 	if (arr == NULL) {
 		return NULL;
 	}
 
-	size = PyArray_SIZE(arr);
-	if  (size < 1) {
+	if (PyArray_SIZE(arr) < 1) {
 		PyErr_SetString(PyExc_ValueError, "Cannot operate on empty array !");
 		goto fail;
 	}
+	if (order < 0) {
+		PyErr_SetString(PyExc_ValueError, "Order should be >= 0");
+		goto fail;
+	}
 
 	rank = PyArray_NDIM(arr);
 	n = PyArray_DIM(arr, rank-1);
@@ -160,52 +361,198 @@ PyObject* array_levinson(PyObject* in, long order)
 		goto fail;
 	}
 
-	switch(rank) {
-		case 1:
-			array_levinson_1d(arr, order, &alpc, &klpc, &err);
-			break;
-		default:
-			/* Iteratively run levinson recursion on last axis */
-			array_levinson_nd(arr, order, &alpc, &klpc, &err);
-			break;
+	nrepeat = 1;
+	for (i = 0; i < rank - 1; ++i) {
+		nrepeat *= PyArray_DIM(arr, i);
+		alpc_size[i] = PyArray_DIM(arr, i);
+		klpc_size[i] = PyArray_DIM(arr, i);
+		elpc_size[i] = PyArray_DIM(arr, i);
+	}
+	alpc_size[rank-1] = order + 1;
+	klpc_size[rank-1] = order;
+	/* As for levinson, the error of a rank 1 input is a 1 item array */
+	if (rank == 1) {
+		elpc_size[0] = 1;
+	}
+
+	alpc = (PyArrayObject*)PyArray_SimpleNew(rank, alpc_size, typenum);
+	klpc = (PyArrayObject*)PyArray_SimpleNew(rank, klpc_size, typenum);
+	elpc = (PyArrayObject*)PyArray_SimpleNew(rank == 1 ? 1 : rank - 1,
+						 elpc_size, typenum);
+	if (alpc == NULL || klpc == NULL || elpc == NULL) {
+		goto fail;
+	}
+
+	elsize = PyArray_ITEMSIZE(arr);
+	tmp = malloc(elsize * (2 * n + order + 1));
+	if (tmp == NULL) {
+		PyErr_NoMemory();
+		goto fail;
 	}
-        Py_DECREF(arr);
 
-	out = PyTuple_New(3);
+	data = arr->data;
+	acoeff = alpc->data;
+	kcoeff = klpc->data;
+	err = elpc->data;
+	Py_BEGIN_ALLOW_THREADS
+	for (i = 0; i < nrepeat; ++i) {
+		burg_typed(typenum, data, n, order, acoeff, err, kcoeff, tmp);
+		data += n * elsize;
+		acoeff += (order + 1) * elsize;
+		kcoeff += order * elsize;
+		err += elsize;
+	}
+	Py_END_ALLOW_THREADS
 
-	PyTuple_SET_ITEM(out, 0, (PyObject*)alpc);
-	PyTuple_SET_ITEM(out, 1, (PyObject*)err);
-	PyTuple_SET_ITEM(out, 2, (PyObject*)klpc);
+	free(tmp);
+	Py_DECREF(arr);
 
-	return out;
+	return Py_BuildValue("(NNN)", alpc, elpc, klpc);
 
 fail:
-    Py_DECREF(arr);
-    return NULL;
+	Py_XDECREF(alpc);
+	Py_XDECREF(klpc);
+	Py_XDECREF(elpc);
+	Py_DECREF(arr);
+	return NULL;
 }
 
-PyObject* PyArray_Levinson(PyObject* self, PyObject* args)
+PyObject* PyArray_Burg(PyObject* self, PyObject* args)
 {
 	long order;
 	PyObject *in = NULL;
-	PyObject *out = NULL;
 
 	if (!PyArg_ParseTuple(args, "Ol", &in, &order)) {
 		return NULL;
 	}
 
-	out = array_levinson(in, order);
-        if (out == NULL) {
-                if (!PyErr_ExceptionMatches(PyExc_ValueError)) {
-                        return NULL;
-                }
-        }
+	return array_burg(in, order);
+}
+
+/*
+ * Run the double or single precision schur kernel depending on typenum.
+ * tmp must have at least 2 * (order + 1) elements of the corresponding type.
+ */
+static void schur_typed(int typenum, const char* in, long order, char* err,
+                        char* kcoeff, char* tmp)
+{
+	if (typenum == NPY_FLOAT) {
+		schur_float((const float*)in, order, (float*)err,
+			    (float*)kcoeff, (float*)tmp);
+	} else {
+		schur((const double*)in, order, (double*)err,
+		      (double*)kcoeff, (double*)tmp);
+	}
+}
+
+/*
+ * Schur algorithm on every row (last axis) of arr: returns the reflection
+ * coefficients and the error, with the same shapes as for levinson.
+ */
+PyObject* array_schur(PyObject* in, long order)
+{
+	int typenum, rank, i;
+	npy_intp n, nrepeat, elsize;
+	npy_intp klpc_size[NPY_MAXDIMS];
+	npy_intp elpc_size[NPY_MAXDIMS];
+	char *data, *kcoeff, *err, *tmp;
+	PyArrayObject *arr;
+	PyArrayObject *klpc = NULL, *elpc = NULL;
+
+	if (PyArray_Check(in) && PyArray_TYPE((PyArrayObject*)in) == NPY_FLOAT) {
+		typenum = NPY_FLOAT;
+	} else {
+		typenum = NPY_DOUBLE;
+	}
+	arr = (PyArrayObject*)PyArray_ContiguousFromObject(in, typenum, 1, 0);
+	if (arr == NULL) {
+		return NULL;
+	}
+
+	if (PyArray_SIZE(arr) < 1) {
+		PyErr_SetString(PyExc_ValueError, "Cannot operate on empty array !");
+		goto fail;
+	}
+	if (order < 0) {
+		PyErr_SetString(PyExc_ValueError, "Order should be >= 0");
+		goto fail;
+	}
+
+	rank = PyArray_NDIM(arr);
+	n = PyArray_DIM(arr, rank-1);
+	if (n <= order) {
+		PyErr_SetString(PyExc_ValueError, "Order should be <= size-1");
+		goto fail;
+	}
+
+	nrepeat = 1;
+	for (i = 0; i < rank - 1; ++i) {
+		nrepeat *= PyArray_DIM(arr, i);
+		klpc_size[i] = PyArray_DIM(arr, i);
+		elpc_size[i] = PyArray_DIM(arr, i);
+	}
+	klpc_size[rank-1] = order;
+	if (rank == 1) {
+		elpc_size[0] = 1;
+	}
+
+	klpc = (PyArrayObject*)PyArray_SimpleNew(rank, klpc_size, typenum);
+	elpc = (PyArrayObject*)PyArray_SimpleNew(rank == 1 ? 1 : rank - 1,
+						 elpc_size, typenum);
+	if (klpc == NULL || elpc == NULL) {
+		goto fail;
+	}
+
+	elsize = PyArray_ITEMSIZE(arr);
+	tmp = malloc(elsize * 2 * (order + 1));
+	if (tmp == NULL) {
+		PyErr_NoMemory();
+		goto fail;
+	}
+
+	data = arr->data;
+	kcoeff = klpc->data;
+	err = elpc->data;
+	Py_BEGIN_ALLOW_THREADS
+	for (i = 0; i < nrepeat; ++i) {
+		schur_typed(typenum, data, order, err, kcoeff, tmp);
+		data += n * elsize;
+		kcoeff += order * elsize;
+		err += elsize;
+	}
+	Py_END_ALLOW_THREADS
+
+	free(tmp);
+	Py_DECREF(arr);
+
+	return Py_BuildValue("(NN)", klpc, elpc);
+
+fail:
+	Py_XDECREF(klpc);
+	Py_XDECREF(elpc);
+	Py_DECREF(arr);
+	return NULL;
+}
+
+PyObject* PyArray_Schur(PyObject* self, PyObject* args)
+{
+	long order;
+	PyObject *in = NULL;
+
+	if (!PyArg_ParseTuple(args, "Ol", &in, &order)) {
+		return NULL;
+	}
 
-	return out;
+	return array_schur(in, order);
 }
 
 static PyMethodDef lpcmethods[] = {
-	{"levinson", PyArray_Levinson, METH_VARARGS, NULL}
+	{"levinson", (PyCFunction)PyArray_Levinson,
+	 METH_VARARGS | METH_KEYWORDS, NULL},
+	{"levinson_triangle", PyArray_LevinsonTriangle, METH_VARARGS, NULL},
+	{"burg", PyArray_Burg, METH_VARARGS, NULL},
+	{"schur", PyArray_Schur, METH_VARARGS, NULL},
+	{NULL, NULL, 0, NULL}
 };
 
 PyMODINIT_FUNC init_lpc(void)
@@ -0,0 +1,136 @@
+/*
+ * Burg method for the estimation of the LPC coefficients.
+ */
+#include "burg.h"
+
+/*
+ * The actual computation :
+ *      - in    : the input signal
+ *      - size  : size of in (ie number of samples)
+ *      - order : order of the LPC. order must be < size
+ *      - acoeff: ar coefficients. Size must be at last order+1
+ *      - err   : *prediction* error (scalar)
+ *      - kcoeff: reflexion coefficients. Size must be at last order.
+ *      - tmp   : cache, must have at least 2 * size + order + 1 elements
+ *
+ * At each order, the reflexion coefficient minimizes the sum of the forward
+ * and backward prediction errors, which are then updated in place:
+ *
+ *      k = -2 sum f[i] b[i-1] / sum (f[i]^2 + b[i-1]^2)
+ *      f[i] <- f[i] + k b[i-1], b[i] <- b[i-1] + k f[i]
+ *
+ * As with levinson, the error is the biased signal power times the product
+ * of the (1 - k^2), so that both methods are comparable. This function assume
+ * all arrays are allocated with the right size: no checking is done.
+ *
+ * Returns 0 on success.
+ */
+int burg(const double* in, int size, int order, double* acoeff, double* err,
+         double* kcoeff, double* tmp)
+{
+        int i, j, m;
+        double num, den, k, fi, bi;
+        double *f = tmp;
+        double *b = tmp + size;
+        double *t = tmp + 2 * size;
+
+        den = 0;
+        for (i = 0; i < size; ++i) {
+                f[i] = in[i];
+                b[i] = in[i];
+                den += in[i] * in[i];
+        }
+
+        /* order 0 */
+        acoeff[0] = 1.0;
+        *err = den / size;
+
+        /* order >= 1 */
+        for (m = 0; m < order; ++m) {
+                num = 0;
+                den = 0;
+                for (i = m + 1; i < size; ++i) {
+                        num += f[i] * b[i-1];
+                        den += f[i] * f[i] + b[i-1] * b[i-1];
+                }
+                k = den > 0 ? -2 * num / den : 0;
+                kcoeff[m] = k;
+
+                for (j = 0; j <= m; ++j) {
+                        t[j] = acoeff[j];
+                }
+                acoeff[m+1] = k;
+                for (j = 1; j <= m; ++j) {
+                        acoeff[j] += k * t[m+1-j];
+                }
+
+                /* Descending, so that b[i-1] is still the previous order
+                 * backward error when b[i] is updated */
+                for (i = size - 1; i > m; --i) {
+                        fi = f[i];
+                        bi = b[i-1];
+                        f[i] = fi + k * bi;
+                        b[i] = bi + k * fi;
+                }
+                *err *= (1 - k * k);
+        }
+
+        return 0;
+}
+
+/*
+ * Single precision version of burg, with the same arguments. The
+ * accumulations are done in double precision.
+ */
+int burg_float(const float* in, int size, int order, float* acoeff,
+               float* err, float* kcoeff, float* tmp)
+{
+        int i, j, m;
+        double num, den, e;
+        float k, fi, bi;
+        float *f = tmp;
+        float *b = tmp + size;
+        float *t = tmp + 2 * size;
+
+        den = 0;
+        for (i = 0; i < size; ++i) {
+                f[i] = in[i];
+                b[i] = in[i];
+                den += (double)in[i] * in[i];
+        }
+
+        /* order 0 */
+        acoeff[0] = 1.0f;
+        e = den / size;
+
+        /* order >= 1 */
+        for (m = 0; m < order; ++m) {
+                num = 0;
+                den = 0;
+                for (i = m + 1; i < size; ++i) {
+                        num += (double)f[i] * b[i-1];
+                        den += (double)f[i] * f[i] + (double)b[i-1] * b[i-1];
+                }
+                k = (float)(den > 0 ? -2 * num / den : 0);
+                kcoeff[m] = k;
+
+                for (j = 0; j <= m; ++j) {
+                        t[j] = acoeff[j];
+                }
+                acoeff[m+1] = k;
+                for (j = 1; j <= m; ++j) {
+                        acoeff[j] += k * t[m+1-j];
+                }
+
+                for (i = size - 1; i > m; --i) {
+                        fi = f[i];
+                        bi = b[i-1];
+                        f[i] = fi + k * bi;
+                        b[i] = bi + k * fi;
+                }
+                e *= (1 - (double)k * k);
+        }
+        *err = (float)e;
+
+        return 0;
+}
@@ -0,0 +1,9 @@
+#ifndef _TALKBOX_BURG_C_
+#define _TALKBOX_BURG_C_
+
+int burg(const double* in, int size, int order, double* acoeff, double* err,
+         double* kcoeff, double* tmp);
+int burg_float(const float* in, int size, int order, float* acoeff,
+               float* err, float* kcoeff, float* tmp);
+
+#endif
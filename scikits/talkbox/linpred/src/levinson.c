@@ -15,21 +15,24 @@
  *      - acoeff: solution (ie ar coefficients). Size must be at last order+1
  *      - err   : *prediction* error (scalar)
  *      - kcoeff: reflexion coefficients. Size must be at last equal to equal to order.
- *      - tmp   : cache, mnust have at least order elements
  *
  * this function assume all arrays are allocated with the right size, and that
  * the parameters make sense. No checking is done, must be done before calling
  * this function: in particular, in[0] must be non zero.
  *
+ * The update a[j] <- a[j] + k a[i-j] is done in place, by pairs (j, i-j):
+ * both new values only depend on the two old ones, so that no scratch space
+ * nor copy of the coefficients is needed.
+ *
  * Returns 0 on success, -1 if a compuation error happened (overflow, underflow
  * for error calculation)
  */
 
 int levinson(const double* in, int order, double* acoeff, double* err,
-             double* kcoeff, double* tmp)
+             double* kcoeff)
 {
         int i, j;
-        double  acc;
+        double acc, k, aj, ai;
         int ret = 0;
 
         /* order 0 */
@@ -42,18 +45,158 @@ int levinson(const double* in, int order, double* acoeff, double* err,
                 for ( j = 1; j <= i-1; ++j) {
                         acc += acoeff[j]*in[i-j];
                 }
-                kcoeff[i-1] = -acc/(*err);
-                acoeff[i] = kcoeff[i-1];
+                k = -acc/(*err);
+                kcoeff[i-1] = k;
 
-                for (j = 0; j < order; ++j) {
-                        tmp[j] = acoeff[j];
+                for (j = 1; 2 * j < i; ++j) {
+                        aj = acoeff[j];
+                        ai = acoeff[i-j];
+                        acoeff[j] = aj + k * ai;
+                        acoeff[i-j] = ai + k * aj;
+                }
+                if (i % 2 == 0) {
+                        acoeff[i/2] *= 1 + k;
                 }
+                acoeff[i] = k;
+                *err *= (1-k*k);
+        }
 
-                for (j = 1; j < i; ++j) {
-                        acoeff[j] += kcoeff[i-1]*tmp[i-j];
+        return ret;
+}
+
+/*
+ * Single precision version of levinson, with the same arguments. The
+ * accumulations are done in double precision.
+ */
+int levinson_float(const float* in, int order, float* acoeff, float* err,
+                   float* kcoeff)
+{
+        int i, j;
+        double acc;
+        float k, aj, ai;
+        int ret = 0;
+
+        /* order 0 */
+        acoeff[0] = (float)1.0;
+        *err = in[0];
+
+        /* order >= 1 */
+        for (i = 1; i <= order; ++i) {
+                acc = in[i];
+                for ( j = 1; j <= i-1; ++j) {
+                        acc += (double)acoeff[j]*in[i-j];
+                }
+                k = (float)(-acc/(*err));
+                kcoeff[i-1] = k;
+
+                for (j = 1; 2 * j < i; ++j) {
+                        aj = acoeff[j];
+                        ai = acoeff[i-j];
+                        acoeff[j] = aj + k * ai;
+                        acoeff[i-j] = ai + k * aj;
                 }
-                *err *= (1-kcoeff[i-1]*kcoeff[i-1]);
+                if (i % 2 == 0) {
+                        acoeff[i/2] *= 1 + k;
+                }
+                acoeff[i] = k;
+                *err *= (1-k*k);
         }
 
         return ret;
 }
+
+/*
+ * Levinson-Durbin recursion which keeps the solution of every order:
+ *      - in    : the input vector which defines the toeplitz matrix
+ *      - order : size of the system to solve. order must be < size -1
+ *      - tri   : solutions of every order, as a (order+1, order+1) C
+ *                array. Row i is the solution of order i, padded with zeros.
+ *      - err   : *prediction* error of every order. Size must be at least
+ *                order+1
+ *      - kcoeff: reflexion coefficients. Size must be at last order.
+ *
+ * Same assumptions as levinson. No scratch space is needed: the solution of
+ * order i is computed from the row of order i-1.
+ */
+int levinson_triangle(const double* in, int order, double* tri, double* err,
+                      double* kcoeff)
+{
+        int i, j;
+        double acc, k;
+        double *prev, *cur;
+        const int n = order + 1;
+
+        for (i = 0; i < n * n; ++i) {
+                tri[i] = 0;
+        }
+
+        /* order 0 */
+        tri[0] = 1.0;
+        err[0] = in[0];
+
+        /* order >= 1 */
+        for (i = 1; i <= order; ++i) {
+                prev = tri + (i - 1) * n;
+                cur = tri + i * n;
+
+                acc = in[i];
+                for (j = 1; j <= i-1; ++j) {
+                        acc += prev[j]*in[i-j];
+                }
+                k = -acc/err[i-1];
+                kcoeff[i-1] = k;
+
+                cur[0] = 1.0;
+                for (j = 1; j < i; ++j) {
+                        cur[j] = prev[j] + k*prev[i-j];
+                }
+                cur[i] = k;
+                err[i] = err[i-1] * (1-k*k);
+        }
+
+        return 0;
+}
+
+/*
+ * Single precision version of levinson_triangle, with the same arguments.
+ * The accumulations are done in double precision.
+ */
+int levinson_triangle_float(const float* in, int order, float* tri,
+                            float* err, float* kcoeff)
+{
+        int i, j;
+        double acc;
+        float k;
+        float *prev, *cur;
+        const int n = order + 1;
+
+        for (i = 0; i < n * n; ++i) {
+                tri[i] = 0;
+        }
+
+        /* order 0 */
+        tri[0] = 1.0f;
+        err[0] = in[0];
+
+        /* order >= 1 */
+        for (i = 1; i <= order; ++i) {
+                prev = tri + (i - 1) * n;
+                cur = tri + i * n;
+
+                acc = in[i];
+                for (j = 1; j <= i-1; ++j) {
+                        acc += (double)prev[j]*in[i-j];
+                }
+                k = (float)(-acc/err[i-1]);
+                kcoeff[i-1] = k;
+
+                cur[0] = 1.0f;
+                for (j = 1; j < i; ++j) {
+                        cur[j] = prev[j] + k*prev[i-j];
+                }
+                cur[i] = k;
+                err[i] = err[i-1] * (1-k*k);
+        }
+
+        return 0;
+}
@@ -2,6 +2,13 @@
 #define _TALKBOX_LEVINSON_C_
 
 int levinson(const double* in, int order, double* acoeff, double* err,
-             double* kcoeff, double* tmp);
+             double* kcoeff);
+int levinson_float(const float* in, int order, float* acoeff, float* err,
+                   float* kcoeff);
+
+int levinson_triangle(const double* in, int order, double* tri, double* err,
+                      double* kcoeff);
+int levinson_triangle_float(const float* in, int order, float* tri,
+                            float* err, float* kcoeff);
 
 #endif
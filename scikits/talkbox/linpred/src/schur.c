@@ -0,0 +1,87 @@
+/*
+ * Schur algorithm: reflection coefficients of a symmetric toeplitz system,
+ * without the coefficients of the solution.
+ */
+#include "schur.h"
+
+/*
+ * The actual computation :
+ *      - in    : the input vector which defines the toeplitz matrix
+ *      - order : size of the system to solve. order must be < size -1
+ *      - err   : *prediction* error (scalar)
+ *      - kcoeff: reflexion coefficients. Size must be at last order.
+ *      - tmp   : cache, must have at least 2 * (order + 1) elements
+ *
+ * Instead of the coefficients a of the solution, the recursion updates the
+ * correlations of the forward and backward prediction errors with the input,
+ * f[j] = sum_l a[l] in[j-l] and b[j] = sum_l a[l] in[j-i+l] at order i:
+ *
+ *      k = -f[i] / b[i-1]
+ *      f[j] <- f[j] + k b[j-1], b[j] <- b[j-1] + k f[j]
+ *
+ * so that there is no inner product nor copy of the coefficients at each
+ * order. The prediction error is b[i] at order i. Same assumptions as
+ * levinson: no checking is done.
+ *
+ * Returns 0 on success.
+ */
+int schur(const double* in, int order, double* err, double* kcoeff,
+          double* tmp)
+{
+        int i, j;
+        double k, fj, bj;
+        double *f = tmp;
+        double *b = tmp + order + 1;
+
+        for (j = 0; j <= order; ++j) {
+                f[j] = in[j];
+                b[j] = in[j];
+        }
+
+        for (i = 1; i <= order; ++i) {
+                k = -f[i] / b[i-1];
+                kcoeff[i-1] = k;
+                /* Descending, so that b[j-1] is still the previous order
+                 * value when b[j] is updated */
+                for (j = order; j >= i; --j) {
+                        fj = f[j];
+                        bj = b[j-1];
+                        f[j] = fj + k * bj;
+                        b[j] = bj + k * fj;
+                }
+        }
+        *err = b[order];
+
+        return 0;
+}
+
+/*
+ * Single precision version of schur, with the same arguments.
+ */
+int schur_float(const float* in, int order, float* err, float* kcoeff,
+                float* tmp)
+{
+        int i, j;
+        float k, fj, bj;
+        float *f = tmp;
+        float *b = tmp + order + 1;
+
+        for (j = 0; j <= order; ++j) {
+                f[j] = in[j];
+                b[j] = in[j];
+        }
+
+        for (i = 1; i <= order; ++i) {
+                k = -f[i] / b[i-1];
+                kcoeff[i-1] = k;
+                for (j = order; j >= i; --j) {
+                        fj = f[j];
+                        bj = b[j-1];
+                        f[j] = fj + k * bj;
+                        b[j] = bj + k * fj;
+                }
+        }
+        *err = b[order];
+
+        return 0;
+}
@@ -0,0 +1,9 @@
+#ifndef _TALKBOX_SCHUR_C_
+#define _TALKBOX_SCHUR_C_
+
+int schur(const double* in, int order, double* err, double* kcoeff,
+          double* tmp);
+int schur_float(const float* in, int order, float* err, float* kcoeff,
+                float* tmp);
+
+#endif
@@ -0,0 +1,83 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_almost_equal
+
+from scipy.signal import lfilter
+
+from scikits.talkbox.linpred.py_lpc import burg_ref
+from scikits.talkbox.linpred._lpc import burg as c_burg
+from scikits.talkbox.linpred.burg_lpc import lpc_burg
+from scikits.talkbox.linpred.levinson_lpc import lpc
+
+class TestBurg(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(20, 64)
+
+    def test_ref(self):
+        """Test C burg against the python reference, one frame at a time."""
+        for order in [0, 1, 5, 12]:
+            a, e, k = lpc_burg(self.x, order)
+            assert a.shape == (20, order + 1)
+            assert e.shape == (20,)
+            assert k.shape == (20, order)
+            for i in range(self.x.shape[0]):
+                ra, re, rk = burg_ref(self.x[i], order)
+                assert_array_almost_equal(a[i], ra)
+                assert_array_almost_equal(e[i], re)
+                assert_array_almost_equal(k[i], rk)
+
+    def test_rank1(self):
+        a, e, k = lpc_burg(self.x[0], 8)
+        ra, re, rk = burg_ref(self.x[0], 8)
+        assert e.shape == (1,)
+        assert_array_almost_equal(a, ra)
+        assert_array_almost_equal(e[0], re)
+        assert_array_almost_equal(k, rk)
+
+    def test_axis(self):
+        ref = lpc_burg(self.x, 8)
+        y = lpc_burg(self.x.T, 8, axis=0)
+        assert_array_almost_equal(y[0], ref[0].T)
+        assert_array_almost_equal(y[1], ref[1])
+        assert_array_almost_equal(y[2], ref[2].T)
+
+        x = self.x.reshape(4, 5, 64)
+        y = lpc_burg(x, 8)
+        assert y[0].shape == (4, 5, 9)
+        assert_array_almost_equal(y[0].reshape(20, 9), ref[0])
+
+    def test_ar(self):
+        """Test burg recovers the coefficients of an AR process, with a stable
+        filter."""
+        ar = np.array([1., -1.6, 0.9])
+        x = lfilter([1.], ar, np.random.randn(4000))
+        a, e, k = lpc_burg(x, 2)
+        assert_array_almost_equal(a, ar, 1)
+        assert np.all(np.abs(lpc_burg(self.x, 20)[2]) < 1)
+        # Close to the autocorrelation method for long signals
+        assert_array_almost_equal(a, lpc(x, 2)[0], 2)
+
+    def test_float32(self):
+        ref = lpc_burg(self.x, 12)
+        y = lpc_burg(self.x, 12, dtype=np.float32)
+        for i in range(3):
+            assert y[i].dtype == np.float32
+            assert_array_almost_equal(y[i], ref[i], 4)
+        assert c_burg(self.x.astype(np.float32), 12)[0].dtype == np.float32
+
+    def test_n_jobs(self):
+        ref = lpc_burg(self.x, 12)
+        y = lpc_burg(self.x, 12, n_jobs=3)
+        for i in range(3):
+            assert_array_almost_equal(y[i], ref[i])
+
+    def test_zeros(self):
+        a, e, k = lpc_burg(np.zeros((2, 10)), 4)
+        assert_array_almost_equal(a, [[1, 0, 0, 0, 0]] * 2)
+        assert_array_almost_equal(e, [0, 0])
+
+    def test_errors(self):
+        self.assertRaises(ValueError, lpc_burg, self.x, 64)
+        self.assertRaises(ValueError, lpc_burg, self.x, 65)
+        self.assertRaises(ValueError, lpc_burg, self.x + 1j, 2)
+        self.assertRaises(ValueError, c_burg, np.zeros(0), 2)
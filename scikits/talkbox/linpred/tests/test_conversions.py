@@ -0,0 +1,113 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_almost_equal, assert_raises
+
+from scikits.talkbox.linpred.levinson_lpc import lpc
+from scikits.talkbox.linpred.conversions import lpc_to_rc, rc_to_lpc, \
+        rc_to_lar, lar_to_rc, lpc_to_lsf, lsf_to_lpc, lpc_to_cepstrum, \
+        cepstrum_to_lpc
+
+def lsf_roots_ref(a):
+    """LSF of a single filter from the roots of P and Q (np.roots)."""
+    ext = np.r_[a, 0]
+    w = np.r_[np.angle(np.roots(ext + ext[::-1])),
+              np.angle(np.roots(ext - ext[::-1]))]
+    w = np.sort(w[w > 0])
+    # Remove the trivial root at pi
+    return w[np.abs(w - np.pi) > 1e-8]
+
+class TestConversions(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(3, 10, 256)
+
+    def test_rc(self):
+        """Test reflection coefficients <-> LPC against levinson."""
+        for order in [0, 1, 2, 7, 12]:
+            a, e, k = lpc(self.x, order)
+            assert_array_almost_equal(lpc_to_rc(a), k)
+            assert_array_almost_equal(rc_to_lpc(k), a)
+            assert lpc_to_rc(a).shape == (3, 10, order)
+
+    def test_rc_unnormalized(self):
+        a, e, k = lpc(self.x[0], 8)
+        assert_array_almost_equal(lpc_to_rc(3 * a), k)
+
+    def test_lar(self):
+        a, e, k = lpc(self.x, 10)
+        g = rc_to_lar(k)
+        assert_array_almost_equal(g, np.log((1 + k) / (1 - k)))
+        assert_array_almost_equal(lar_to_rc(g), k)
+
+    def test_lsf(self):
+        """Test LSF against the roots of P and Q, one frame at a time."""
+        for order in [1, 2, 5, 10, 11, 16]:
+            a = lpc(self.x, order)[0]
+            lsf = lpc_to_lsf(a)
+            assert lsf.shape == (3, 10, order)
+            assert np.all(lsf > 0) and np.all(lsf < np.pi)
+            assert np.all(np.diff(lsf, axis=-1) > 0)
+            for i in range(3):
+                for j in range(10):
+                    assert_array_almost_equal(lsf[i, j],
+                                              lsf_roots_ref(a[i, j]))
+
+    def test_lsf_roundtrip(self):
+        for order in [0, 1, 2, 9, 10]:
+            a = lpc(self.x, order)[0]
+            assert_array_almost_equal(lsf_to_lpc(lpc_to_lsf(a)), a)
+
+    def test_lsf_close_roots(self):
+        """Test LSF closer to each other than the search grid."""
+        lsf = np.array([0.5, 0.5005, 1.2, 1.2003, 2.5, 2.502])
+        a = lsf_to_lpc(lsf)
+        assert_array_almost_equal(lpc_to_lsf(a), lsf, 8)
+
+    def test_float32(self):
+        a = lpc(self.x, 10, dtype=np.float32)[0]
+        assert lpc_to_rc(a).dtype == np.float32
+        assert lpc_to_lsf(a).dtype == np.float32
+        assert_array_almost_equal(lsf_to_lpc(lpc_to_lsf(a)), a, 4)
+
+    def test_unstable(self):
+        a = rc_to_lpc([0.5, 1.5, -0.3])
+        assert_raises(ValueError, lpc_to_lsf, a)
+
+class TestCepstrum(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(4, 5, 256)
+
+    def test_fft(self):
+        """Test LPC cepstrum against the real cepstrum of the model
+        spectrum."""
+        nfft = 4096
+        for order, ncep in [(0, 5), (1, 5), (12, 13), (12, 20), (16, 13)]:
+            a, e, k = lpc(self.x, order)
+            c = lpc_to_cepstrum(a, e, ncep)
+            assert c.shape == (4, 5, ncep)
+            logspec = 0.5 * np.log(e)[..., np.newaxis] - \
+                      np.log(np.abs(np.fft.rfft(a, nfft)))
+            ref = np.fft.irfft(logspec, nfft)[..., :ncep]
+            # The model is minimum phase: its cepstrum is causal, and twice
+            # the even (real) cepstrum for n > 0
+            ref[..., 1:] *= 2
+            assert_array_almost_equal(c, ref)
+
+    def test_rank1(self):
+        a, e, k = lpc(self.x[0, 0], 10)
+        c = lpc_to_cepstrum(a, e, 13)
+        assert c.shape == (13,)
+        assert_array_almost_equal(c, lpc_to_cepstrum(a[np.newaxis], e, 13)[0])
+
+    def test_roundtrip(self):
+        for order, ncep in [(0, 1), (1, 5), (12, 13), (12, 20)]:
+            a, e, k = lpc(self.x, order)
+            ra, re = cepstrum_to_lpc(lpc_to_cepstrum(a, e, ncep), order)
+            assert_array_almost_equal(ra, a)
+            assert_array_almost_equal(re, e)
+
+    def test_errors(self):
+        a, e, k = lpc(self.x, 4)
+        assert_raises(ValueError, lpc_to_cepstrum, a, e, 0)
+        c = lpc_to_cepstrum(a, e, 5)
+        assert_raises(ValueError, cepstrum_to_lpc, c, 5)
@@ -0,0 +1,84 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_almost_equal
+
+from scipy.signal import lfilter
+
+from scikits.talkbox.linpred.py_lpc import covariance_ref
+from scikits.talkbox.linpred.covariance_lpc import lpc_covariance, \
+        lpc_modcovariance
+
+class TestCovariance(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(20, 64)
+        self.funcs = [(lpc_covariance, False), (lpc_modcovariance, True)]
+
+    def test_ref(self):
+        """Test batched covariance methods against the reference, one frame
+        at a time."""
+        for func, modified in self.funcs:
+            for order in [0, 1, 5, 12]:
+                a, e = func(self.x, order)
+                assert a.shape == (20, order + 1)
+                assert e.shape == (20,)
+                for i in range(self.x.shape[0]):
+                    ra, re = covariance_ref(self.x[i], order, modified)
+                    assert_array_almost_equal(a[i], ra)
+                    assert_array_almost_equal(e[i], re)
+
+    def test_axis(self):
+        for func, modified in self.funcs:
+            ref = func(self.x, 8)
+            y = func(self.x.T, 8, axis=0)
+            assert_array_almost_equal(y[0], ref[0].T)
+            assert_array_almost_equal(y[1], ref[1])
+
+            y = func(self.x.reshape(4, 5, 64), 8)
+            assert y[0].shape == (4, 5, 9)
+            assert y[1].shape == (4, 5)
+            assert_array_almost_equal(y[0].reshape(20, 9), ref[0])
+
+            # Negative axis on 3d input: the other axes keep their order
+            x = self.x.reshape(4, 5, 64)
+            for axis, t in [(-2, (0, 2, 1)), (-3, (2, 0, 1))]:
+                a, e = func(x.transpose(t), 8, axis=axis)
+                at = np.rollaxis(y[0], 2, 3 + axis)
+                assert a.shape == at.shape
+                assert_array_almost_equal(a, at)
+                assert e.shape == (4, 5)
+                assert_array_almost_equal(e, y[1])
+
+            a, e = func(self.x[0], 8)
+            assert_array_almost_equal(a, ref[0][0])
+            assert_array_almost_equal(e, ref[1][0])
+
+    def test_exact(self):
+        """Test signals without noise are exactly predicted."""
+        ar = np.array([1., -1.6, 0.9])
+        x = lfilter([1.], ar, np.r_[1., np.zeros(49)])
+        a, e = lpc_covariance(x[1:], 2)
+        assert_array_almost_equal(a, ar)
+        assert_array_almost_equal(e, 0)
+
+        # A sinusoid is predicted both forward and backward
+        w = 0.3
+        x = np.cos(w * np.arange(50) + 0.2)
+        for func, modified in self.funcs:
+            a, e = func(x, 2)
+            assert_array_almost_equal(a, [1., -2 * np.cos(w), 1.])
+            assert_array_almost_equal(e, 0)
+
+    def test_float32(self):
+        for func, modified in self.funcs:
+            ref = func(self.x, 8)
+            y = func(self.x, 8, dtype=np.float32)
+            for i in range(2):
+                assert y[i].dtype == np.float32
+                assert_array_almost_equal(y[i], ref[i], 4)
+
+    def test_errors(self):
+        for func, modified in self.funcs:
+            self.assertRaises(ValueError, func, self.x, 64)
+            self.assertRaises(ValueError, func, self.x + 1j, 2)
+            self.assertRaises(np.linalg.LinAlgError, func,
+                              np.zeros((2, 10)), 2)
@@ -4,11 +4,12 @@ from unittest import TestCase
 
 from scipy.signal import lfilter
 
-from scikits.talkbox.tools import acorr
+from scikits.talkbox.tools import acorr, segment_axis
 
 from scikits.talkbox.linpred.py_lpc import lpc_ref, levinson_1d as py_levinson
 from scikits.talkbox.linpred._lpc import levinson as c_levinson
-from scikits.talkbox.linpred.levinson_lpc import levinson, acorr_lpc, lpc
+from scikits.talkbox.linpred.levinson_lpc import levinson, acorr_lpc, lpc, \
+        acorr_lpc_direct, _acorr_method, lpc_frames, lpc_order_select, schur
 from scikits.talkbox.linpred.common import lpcres
 
 def test_acorr_lpc():
@@ -137,6 +138,359 @@ class TestLPCHighBackend(_TestLPCCommon):
             for i in range(2):
                 assert_array_almost_equal(am[:, i], re[order])
 
+class TestLPCFloat32(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(10, 400)
+
+    def test_lpc(self):
+        """Test single precision lpc against double precision."""
+        for order in [1, 12, 20]:
+            r = lpc(self.x, order)
+            y = lpc(self.x, order, dtype=np.float32)
+            for i in range(3):
+                assert y[i].dtype == np.float32
+                assert_array_almost_equal(y[i], r[i], 5)
+
+    def test_levinson(self):
+        """Test single precision C levinson against double precision."""
+        r = acorr_lpc(self.x)
+        a, e, k = c_levinson(r.astype(np.float32), 12)
+        assert a.dtype == e.dtype == k.dtype == np.float32
+        ra, re, rk = c_levinson(r, 12)
+        assert_array_almost_equal(a, ra, 5)
+        assert_array_almost_equal(e, re, 5)
+        assert_array_almost_equal(k, rk, 5)
+
+        # Default precision stays double
+        assert levinson(r.astype(np.float32), 12)[0].dtype == np.float64
+
+class TestLPCMethod(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(10, 400)
+
+    def test_acorr_direct(self):
+        """Test direct autocorrelation against fft autocorrelation."""
+        for maxlag in [0, 1, 12, 399]:
+            assert_array_almost_equal(acorr_lpc_direct(self.x, maxlag),
+                                      acorr_lpc(self.x)[:, :maxlag+1])
+        assert_array_almost_equal(acorr_lpc_direct(self.x.T, 12, axis=0),
+                                  acorr_lpc(self.x.T, axis=0)[:13])
+
+        x = self.x.reshape(2, 5, 400)
+        y = acorr_lpc_direct(x, 12)
+        assert y.shape == (2, 5, 13)
+        assert_array_almost_equal(y, acorr_lpc(x)[..., :13])
+
+    def test_acorr_direct_dtype(self):
+        assert acorr_lpc_direct(self.x, 4).dtype == np.float64
+        assert acorr_lpc_direct(np.arange(10), 4).dtype == np.float64
+        x32 = self.x.astype(np.float32)
+        assert acorr_lpc_direct(x32, 4).dtype == np.float32
+        assert acorr_lpc_direct(x32, 4, dtype=np.float64).dtype == np.float64
+        self.assertRaises(ValueError, acorr_lpc_direct, self.x + 1j, 4)
+
+    def test_methods(self):
+        """Test lpc gives the same result with every method."""
+        for order in [1, 12, 20]:
+            r = lpc(self.x, order, method='fft')
+            for method in ['direct', 'auto']:
+                y = lpc(self.x, order, method=method)
+                for i in range(3):
+                    assert_array_almost_equal(y[i], r[i])
+            y = lpc(self.x.T, order, axis=0, method='direct')
+            assert_array_almost_equal(y[0], r[0].T)
+        self.assertRaises(ValueError, lpc, self.x, 12, method='burg')
+
+    def test_auto(self):
+        """Test the direct method is used for speech frames at small order."""
+        assert _acorr_method(400, 12) == 'direct'
+        assert _acorr_method(400, 20) == 'direct'
+        assert _acorr_method(4096, 200) == 'fft'
+
+class TestLPCFrames(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(16000)
+
+    def _ref(self, x, nwin, hop, order, w):
+        frames = segment_axis(x, nwin, nwin - hop, end='cut')
+        return lpc(frames * w, order)
+
+    def test_simple(self):
+        """Test framewise lpc against lpc of the windowed frames."""
+        from scipy.signal import get_window
+        for nwin, hop in [(400, 160), (256, 256), (512, 1)]:
+            x = self.x[:5000]
+            ref = self._ref(x, nwin, hop, 12, get_window('hamming', nwin))
+            y = lpc_frames(x, nwin, hop, 12)
+            assert y[0].shape == ref[0].shape
+            for i in range(3):
+                assert_array_almost_equal(y[i], ref[i])
+
+    def test_window(self):
+        w = np.random.rand(400)
+        ref = self._ref(self.x, 400, 160, 16, w)
+        y = lpc_frames(self.x, 400, 160, 16, window=w)
+        assert_array_almost_equal(y[0], ref[0])
+        y = lpc_frames(self.x, 400, 160, 16, window='boxcar')
+        assert_array_almost_equal(y[0], self._ref(self.x, 400, 160, 16, 1)[0])
+        self.assertRaises(ValueError, lpc_frames, self.x, 400, 160, 16,
+                          window=w[:10])
+
+    def test_uneven(self):
+        """Test the samples after the last complete frame are ignored."""
+        y = lpc_frames(self.x[:1000], 400, 160, 12)
+        assert y[0].shape == (4, 13)
+        assert_array_almost_equal(y[0], lpc_frames(self.x[:880], 400, 160,
+                                                   12)[0])
+
+    def test_short(self):
+        a, e, k = lpc_frames(self.x[:100], 400, 160, 12)
+        assert a.shape == (0, 13)
+        assert e.shape == (0,)
+        assert k.shape == (0, 12)
+
+    def test_float32(self):
+        ref = lpc_frames(self.x, 400, 160, 12)
+        y = lpc_frames(self.x, 400, 160, 12, dtype=np.float32)
+        for i in range(3):
+            assert y[i].dtype == np.float32
+            assert_array_almost_equal(y[i], ref[i], 4)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, lpc_frames, self.x, 400, 0, 12)
+        self.assertRaises(ValueError, lpc_frames, self.x, 400, 401, 12)
+        self.assertRaises(ValueError, lpc_frames, self.x, 10, 5, 12)
+        self.assertRaises(ValueError, lpc_frames, self.x.reshape(2, -1), 400,
+                          160, 12)
+
+class TestLevinsonAllOrders(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.r = acorr_lpc(np.random.randn(10, 40))
+
+    def test_errors(self):
+        """Test the errors of every order against levinson at each order."""
+        a, e, k = levinson(self.r, 12, all_orders=True)
+        assert e.shape == (10, 13)
+        ra, re, rk = levinson(self.r, 12)
+        assert_array_almost_equal(a, ra)
+        assert_array_almost_equal(k, rk)
+        for order in range(13):
+            assert_array_almost_equal(e[:, order], levinson(self.r, order)[1])
+
+        a, e, k = levinson(self.r[0], 12, all_orders=True)
+        assert e.shape == (13,)
+        assert_array_almost_equal(e, levinson(self.r, 12,
+                                              all_orders=True)[1][0])
+
+    def test_triangle(self):
+        """Test the triangle of solutions against levinson at each order."""
+        tri, e, k = levinson(self.r, 12, all_orders=True,
+                             return_triangle=True)
+        assert tri.shape == (10, 13, 13)
+        assert_array_almost_equal(e, levinson(self.r, 12, all_orders=True)[1])
+        for order in range(13):
+            assert_array_almost_equal(tri[:, order, :order+1],
+                                      levinson(self.r, order)[0])
+            assert_array_almost_equal(tri[:, order, order+1:], 0)
+
+        tri, e, k = levinson(self.r[0], 4, all_orders=True,
+                             return_triangle=True)
+        assert tri.shape == (5, 5)
+        assert e.shape == (5,)
+
+    def test_triangle_float32(self):
+        ref = levinson(self.r, 12, all_orders=True, return_triangle=True)
+        y = levinson(self.r, 12, all_orders=True, return_triangle=True,
+                     dtype=np.float32)
+        for i in range(3):
+            assert y[i].dtype == np.float32
+            assert_array_almost_equal(y[i], ref[i], 4)
+
+    def test_axis(self):
+        ref = levinson(self.r, 6, all_orders=True, return_triangle=True)
+        y = levinson(self.r.T, 6, axis=0, all_orders=True,
+                     return_triangle=True)
+        assert_array_almost_equal(y[0], np.moveaxis(ref[0], 1, 0))
+        assert_array_almost_equal(y[1], ref[1].T)
+        assert_array_almost_equal(y[2], ref[2].T)
+
+        y = levinson(self.r.T, 6, axis=0, all_orders=True)
+        assert_array_almost_equal(y[1], ref[1].T)
+
+        y = levinson(self.r, 6, all_orders=True, return_triangle=True,
+                     n_jobs=3)
+        for i in range(3):
+            assert_array_almost_equal(y[i], ref[i])
+
+    def test_args(self):
+        self.assertRaises(ValueError, levinson, self.r, 6,
+                          return_triangle=True)
+
+class TestLPCOrderSelect(TestCase):
+    def test_ar(self):
+        """Test the order of an AR process is recovered."""
+        np.random.seed(0)
+        ar = [1., -1.2, 0.8, -0.3]
+        x = lfilter([1.], ar, np.random.randn(4000))
+        for criterion in ['aic', 'mdl']:
+            order, crit = lpc_order_select(x, 20, criterion)
+            assert crit.shape == (21,)
+            assert order == 3
+
+    def test_frames(self):
+        np.random.seed(0)
+        x = np.vstack((lfilter([1.], [1., -0.9], np.random.randn(2000)),
+                       lfilter([1.], [1., -1.2, 0.8, -0.3],
+                               np.random.randn(2000))))
+        order, crit = lpc_order_select(x, 10, 'mdl')
+        assert crit.shape == (2, 11)
+        assert_array_equal(order, [1, 3])
+
+        order, crit = lpc_order_select(x.T, 10, 'mdl', axis=0)
+        assert crit.shape == (11, 2)
+        assert_array_equal(order, [1, 3])
+
+    def test_criterion(self):
+        x = np.random.randn(100)
+        order, aic = lpc_order_select(x, 10, 'aic')
+        order, mdl = lpc_order_select(x, 10, 'mdl')
+        assert_array_almost_equal(mdl - aic, np.arange(11) * (np.log(100) - 2))
+        self.assertRaises(ValueError, lpc_order_select, x, 10, 'bic')
+        self.assertRaises(ValueError, lpc_order_select, x, 100)
+
+class TestLevinsonThreads(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.r = acorr_lpc(np.random.randn(2, 50, 40))
+
+    def test_n_jobs(self):
+        """Test threaded levinson against single threaded levinson."""
+        ref = levinson(self.r, 12)
+        for n_jobs in [2, 3, -1]:
+            for axis in [-1, 1]:
+                r = np.swapaxes(self.r, -1, axis)
+                y = levinson(r, 12, axis=axis, n_jobs=n_jobs)
+                for i in range(3):
+                    assert_array_almost_equal(np.swapaxes(y[i], -1, axis)
+                                              if i != 1 else y[i], ref[i])
+        y = lpc(np.random.randn(5, 100), 8, n_jobs=2)
+        assert y[0].shape == (5, 9)
+
+    def test_concurrent(self):
+        """Test levinson can be called from several threads at once."""
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(4)
+        try:
+            res = pool.map(lambda r: levinson(r, 12), [self.r] * 8)
+        finally:
+            pool.close()
+        ref = levinson(self.r, 12)
+        for y in res:
+            for i in range(3):
+                assert_array_almost_equal(y[i], ref[i])
+
+class TestLevinsonOut(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.r = acorr_lpc(np.random.randn(6, 40))
+
+    def _out(self, order, dtype=np.float64):
+        return (np.empty((6, order + 1), dtype), np.empty(6, dtype),
+                np.empty((6, order), dtype))
+
+    def test_out(self):
+        """Test levinson writes into the given output arrays."""
+        for order in [0, 1, 2, 7, 12]:
+            ref = levinson(self.r, order)
+            for n_jobs in [1, 2, 4]:
+                out = self._out(order)
+                y = levinson(self.r, order, out_a=out[0], out_e=out[1],
+                             out_k=out[2], n_jobs=n_jobs)
+                for i in range(3):
+                    assert y[i] is out[i]
+                    assert_array_almost_equal(y[i], ref[i])
+
+    def test_partial_out(self):
+        ref = levinson(self.r, 8)
+        out_k = np.empty((6, 8))
+        for n_jobs in [1, 2]:
+            y = levinson(self.r, 8, out_k=out_k, n_jobs=n_jobs)
+            assert y[2] is out_k
+            for i in range(3):
+                assert_array_almost_equal(y[i], ref[i])
+
+    def test_rank1(self):
+        ref = levinson(self.r[0], 8)
+        out = (np.empty(9), np.empty(1), np.empty(8))
+        y = levinson(self.r[0], 8, out_a=out[0], out_e=out[1], out_k=out[2])
+        for i in range(3):
+            assert_array_almost_equal(out[i], ref[i])
+
+    def test_float32(self):
+        out = self._out(8, np.float32)
+        levinson(self.r, 8, dtype=np.float32, out_a=out[0], out_e=out[1],
+                 out_k=out[2])
+        assert_array_almost_equal(out[0], levinson(self.r, 8)[0], 5)
+
+    def test_errors(self):
+        out = self._out(8)
+        # Bad shape, dtype or memory layout
+        self.assertRaises(ValueError, levinson, self.r, 7, out_a=out[0])
+        self.assertRaises(ValueError, levinson, self.r, 8,
+                          out_a=out[0].astype(np.float32))
+        self.assertRaises(ValueError, levinson, self.r, 8,
+                          out_a=np.empty((9, 6)).T)
+        self.assertRaises(TypeError, levinson, self.r, 8, out_a=[0] * 9)
+        # Not supported with other axes or all_orders
+        self.assertRaises(ValueError, levinson, self.r.T, 8, axis=0,
+                          out_a=out[0])
+        self.assertRaises(ValueError, levinson, self.r, 8, all_orders=True,
+                          out_a=out[0])
+
+class TestSchur(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.r = acorr_lpc(np.random.randn(2, 50, 40))
+
+    def test_levinson(self):
+        """Test schur against the reflection coefficients of levinson."""
+        for order in [0, 1, 2, 12, 39]:
+            a, e, k = levinson(self.r, order)
+            sk, se = schur(self.r, order)
+            assert sk.shape == k.shape
+            assert se.shape == e.shape
+            assert_array_almost_equal(sk, k)
+            assert_array_almost_equal(se, e)
+
+    def test_rank1(self):
+        a, e, k = levinson(self.r[0, 0], 10)
+        sk, se = schur(self.r[0, 0], 10)
+        assert se.shape == e.shape
+        assert_array_almost_equal(sk, k)
+        assert_array_almost_equal(se, e)
+
+    def test_axis(self):
+        ref = schur(self.r, 12)
+        for n_jobs in [1, 2]:
+            k, e = schur(np.swapaxes(self.r, -1, 1), 12, axis=1,
+                         n_jobs=n_jobs)
+            assert_array_almost_equal(np.swapaxes(k, -1, 1), ref[0])
+            assert_array_almost_equal(e, ref[1])
+
+    def test_float32(self):
+        k, e = schur(self.r, 12, dtype=np.float32)
+        assert k.dtype == np.float32 and e.dtype == np.float32
+        assert_array_almost_equal(k, levinson(self.r, 12)[2], 5)
+
+    def test_args(self):
+        self.assertRaises(ValueError, schur, self.r, self.r.shape[-1])
+        self.assertRaises(ValueError, schur, self.r, -1)
+        self.assertRaises(ValueError, schur, self.r + 1j, 2)
+
 class _LevinsonCommon(TestCase):
     X = np.linspace(1, 11, 11)
     X0 = np.array([1.])
@@ -328,5 +682,30 @@ class TestLPCResidual(TestCase):
         res = lpcres(x, order, usefft=False)
         assert_array_almost_equal(res, r_res)
 
+    def test_burg(self):
+        """Testing LPC residual with Burg's method."""
+        from scikits.talkbox.linpred.burg_lpc import lpc_burg
+        x = np.random.randn(10, 24)
+        res = lpcres(x, 8, method='burg')
+        for i in range(10):
+            r_res = lfilter(lpc_burg(x[i], 8)[0], 1., x[i])
+            assert_array_almost_equal(res[i], r_res)
+            assert_array_almost_equal(lpcres(x[i], 8, method='burg'), r_res)
+        self.assertRaises(ValueError, lpcres, x, 8, method='covariance')
+
+    def test_filter_method(self):
+        """Testing LPC residual with the direct and FFT filters."""
+        x = np.random.randn(3, 3000)
+        for order in [12, 60]:
+            ref = lpcres(x, order, filter_method='direct')
+            for method in ['fft', 'auto']:
+                assert_array_almost_equal(lpcres(x, order,
+                                                 filter_method=method), ref)
+                assert_array_almost_equal(lpcres(x[0], order,
+                                                 filter_method=method),
+                                          lfilter(lpc(x[0], order)[0], 1.,
+                                                  x[0]))
+        self.assertRaises(ValueError, lpcres, x, 8, filter_method='foo')
+
 if __name__ == "__main__":
     run_module_suite()
@@ -10,6 +10,7 @@ def configuration(parent_package='', top_path=None):
     config.add_subpackage('transforms')
     config.add_subpackage('tools')
     config.add_subpackage('misc')
+    config.add_subpackage('corpus')
     return config
 
 if __name__ == "__main__":
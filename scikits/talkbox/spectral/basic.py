@@ -1,9 +1,9 @@
 import numpy as np
-from scipy.fftpack import fft, ifft
+from scikits.talkbox.linpred import lpc, lpc_burg
+from scikits.talkbox.tools.fftutils import rfft_power, rfft_onesided
+from scikits.talkbox.tools.dtypes import floating_dtype
 
-from scikits.talkbox.linpred import lpc
-
-def periodogram(x, nfft=None, fs=1):
+def periodogram(x, nfft=None, fs=1, dtype=None):
     """Compute the periodogram of the given signal, with the given fft size.
 
     Parameters
@@ -16,6 +16,9 @@ def periodogram(x, nfft=None, fs=1):
     fs : float
         Sampling rate. By default, is 1 (normalized frequency. e.g. 0.5 is the
         Nyquist limit).
+    dtype : dtype
+        precision of the computation (float32 or float64). By default, the
+        precision of x is used (float64 for integer input).
 
     Returns
     -------
@@ -61,21 +64,21 @@ def periodogram(x, nfft=None, fs=1):
     if nfft < n:
         raise ValueError("nfft < signal size not supported yet")
 
-    pxx = np.abs(fft(x, nfft)) ** 2
-    if nfft % 2 == 0:
-        pn = nfft / 2 + 1
-    else:
-        pn = (nfft + 1 )/ 2
+    if dtype is not None:
+        x = np.asarray(x, floating_dtype(dtype))
 
-    fgrid = np.linspace(0, fs * 0.5, pn)
-    return pxx[:pn] / (n * fs), fgrid
+    pxx = rfft_power(x, nfft)
+    pxx /= n * fs
 
-def arspec(x, order, nfft=None, fs=1):
+    fgrid = np.linspace(0, fs * 0.5, pxx.size)
+    return pxx, fgrid
+
+def arspec(x, order, nfft=None, fs=1, method='autocorr'):
     """Compute the spectral density using an AR model.
 
-    An AR model of the signal is estimated through the Yule-Walker equations;
-    the estimated AR coefficient are then used to compute the spectrum, which
-    can be computed explicitely for AR models.
+    An AR model of the signal is estimated through the Yule-Walker equations
+    (or Burg's method); the estimated AR coefficient are then used to compute
+    the spectrum, which can be computed explicitely for AR models.
 
     Parameters
     ----------
@@ -89,6 +92,9 @@ def arspec(x, order, nfft=None, fs=1):
     fs : float
         Sampling rate. By default, is 1 (normalized frequency. e.g. 0.5 is the
         Nyquist limit).
+    method : {'autocorr', 'burg'}
+        AR estimation method: autocorrelation method (lpc, default), or
+        Burg's method (lpc_burg), which gives sharper peaks for short signals.
 
     Returns
     -------
@@ -110,15 +116,14 @@ def arspec(x, order, nfft=None, fs=1):
     if nfft < n:
         raise ValueError("nfft < signal size not supported yet")
 
-    a, e, k = lpc(x, order)
-
-    # This is not enough to deal correctly with even/odd size
-    if nfft % 2 == 0:
-        pn = nfft / 2 + 1
+    if method == 'autocorr':
+        a, e, k = lpc(x, order)
+    elif method == 'burg':
+        a, e, k = lpc_burg(x, order)
     else:
-        pn = (nfft + 1 )/ 2
+        raise ValueError("method %s not understood" % method)
 
-    px = 1 / np.fft.fft(a, nfft)[:pn]
+    px = 1 / rfft_onesided(a, nfft)
     pxx = np.real(np.conj(px) * px)
     pxx /= fs / e
     fx = np.linspace(0, fs * 0.5, pxx.size)
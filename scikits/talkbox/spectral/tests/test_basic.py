@@ -3,7 +3,7 @@ from unittest import TestCase
 import numpy as np
 from numpy.testing import assert_array_almost_equal
 
-from scikits.talkbox.spectral.basic import periodogram
+from scikits.talkbox.spectral.basic import periodogram, arspec
 
 lh = np.array([2.4, 2.4, 2.4, 2.2, 2.1, 1.5, 2.3, 2.3, 2.5, 2.0, 1.9, 1.7,
 2.2, 1.8, 3.2, 3.2, 2.7, 2.2, 2.2, 1.9, 1.9, 1.8, 2.7, 3.0, 2.3, 2.0, 2.0, 2.9,
@@ -22,3 +22,22 @@ class TestSpecgram(TestCase):
     def test_raw(self):
         sp = periodogram(lh)[0]
         assert_array_almost_equal(sp[1:], lh_spec_raw)
+
+    def test_float32(self):
+        """Test single precision periodogram against double precision."""
+        sp = periodogram(lh, dtype=np.float32)[0]
+        assert sp.dtype == np.float32
+        assert_array_almost_equal(sp[1:], lh_spec_raw)
+
+class TestArspec(TestCase):
+    def test_burg(self):
+        """Test Burg AR spectrum peaks at the resonance of an AR process."""
+        from scipy.signal import lfilter
+        np.random.seed(0)
+        x = lfilter([1.], [1., -1.6, 0.9], np.random.randn(256))
+        for method in ['autocorr', 'burg']:
+            pxx, fx = arspec(x, 2, nfft=1024, method=method)
+            # Resonance of the AR process at angle arccos(0.8 / sqrt(0.9))
+            f0 = np.arccos(0.8 / np.sqrt(0.9)) / (2 * np.pi)
+            assert abs(fx[np.argmax(pxx)] - f0) < 0.01
+        self.assertRaises(ValueError, arspec, x, 2, method='foo')
@@ -5,8 +5,10 @@ from correlations import *
 __all__ += correlations.__all__
 
 import cffilter
-from cffilter import cslfilter as slfilter
-__all__ += ['slfilter']
+
+import filtering
+from filtering import *
+__all__ += filtering.__all__
 
 from segmentaxis import segment_axis
 __all__ += ['segment_axis']
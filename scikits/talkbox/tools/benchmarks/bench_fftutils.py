@@ -0,0 +1,42 @@
+"""Benchmark the real input fft helpers against the complex fft.
+
+Typical results (1000 frames of 400 samples, nfft = 512): the one-sided
+magnitude spectrum is ~3x faster than np.abs(fft(x, nfft)), and the fft-based
+autocorrelation ~3x faster than real(ifft(abs(fft(x)) ** 2)). The one-sided
+real spectrum (nfft/2 + 1 reals) is also 4x smaller than the complex spectrum
+(nfft complex values) returned by fft."""
+import numpy as np
+from numpy.testing import TestCase, measure
+
+from scipy.fftpack import fft, ifft
+
+from scikits.talkbox.tools.fftutils import rfft_magnitude, rfft_power, \
+                                           irfft_power
+
+class BenchRealFFT(TestCase):
+    def bench_magnitude(self):
+        print
+        print "        Magnitude spectrum (1000 x 400 frames)"
+        print "=============================================================="
+        print "  nfft | complex fft (s) | real fft (s) | speedup | mem ratio"
+        print "--------------------------------------------------------------"
+        x = np.random.randn(1000, 400)
+        for nfft in [512, 1024, 4096]:
+            tc = measure("np.abs(fft(x, nfft))", 20)
+            tr = measure("rfft_magnitude(x, nfft)", 20)
+            mc = fft(x, nfft).nbytes
+            mr = rfft_magnitude(x, nfft).nbytes
+            print " %5d | %15.3f | %12.3f | %6.1fx | %8.1fx" % \
+                  (nfft, tc, tr, tc / tr, mc / float(mr))
+
+    def bench_autocorrelation(self):
+        print
+        print "        FFT autocorrelation (1000 x 400 frames)"
+        print "=============================================================="
+        print "  nfft | complex fft (s) | real fft (s) | speedup"
+        print "--------------------------------------------------------------"
+        x = np.random.randn(1000, 400)
+        for nfft in [1024, 2048]:
+            tc = measure("np.real(ifft(np.abs(fft(x, n=nfft)) ** 2))", 20)
+            tr = measure("irfft_power(rfft_power(x, nfft), nfft)", 20)
+            print " %5d | %15.3f | %12.3f | %6.1fx" % (nfft, tc, tr, tc / tr)
@@ -0,0 +1,56 @@
+"""Benchmark the direct and FFT (overlap-save) methods of slfilter for FIR
+filters.
+
+The direct filter costs nx * nb multiply-adds per row, and the FFT one ~ nfft
+* log2(nfft) per transform (two per block, plus the one of the filter).
+bench_crossover prints the ratio of both costs next to the timings: both
+methods take about the same time for a ratio of ~3, hence the _FFT_COST_RATIO
+threshold used by method='auto'. Typically, the FFT is ~2x faster for 100
+taps on frames of a few thousand samples, and ~3x faster for 200 taps on long
+frames; it never wins on 400 samples frames.
+
+bench_long compares fftfilt with lfilter for the inverse LPC filter of a long
+signal: they are on par at order 50, and fftfilt is ~2x faster at order 100."""
+import numpy as np
+from numpy.testing import TestCase, measure
+
+from scipy.signal import lfilter
+
+from scikits.talkbox.tools.filtering import slfilter, fftfilt, \
+        _fft_is_faster, _block_size
+
+def _cost_ratio(nb, nx):
+    nfft = _block_size(nb, nx)
+    nblocks = -(-nx // (nfft - nb + 1))
+    return nx * nb / ((2 * nblocks + 1) * nfft * np.log2(nfft))
+
+class BenchFiltering(TestCase):
+    def bench_crossover(self):
+        print
+        print "    FIR slfilter (2 ** 21 samples total)"
+        print "=============================================================="
+        print "      nx |  nb | direct (s) | fft (s) | cost ratio | auto"
+        print "--------------------------------------------------------------"
+        for nx in [400, 4096, 65536]:
+            x = np.random.randn(2 ** 21 / nx, nx)
+            a = np.ones((x.shape[0], 1))
+            for nb in [13, 25, 51, 101, 201]:
+                b = np.random.randn(x.shape[0], nb)
+                td = measure("slfilter(b, a, x, method='direct')", 3)
+                tf = measure("slfilter(b, a, x, method='fft')", 3)
+                print " %7d | %3d | %10.3f | %7.3f | %10.2f | %s" % \
+                      (nx, nb, td, tf, _cost_ratio(nb, nx),
+                       _fft_is_faster(nb, nx, True) and 'fft' or 'direct')
+
+    def bench_long(self):
+        print
+        print "    LPC inverse filtering of 10 minutes at 16 kHz"
+        print "=============================================================="
+        print " order | lfilter (s) | fftfilt (s)"
+        print "--------------------------------------------------------------"
+        x = np.random.randn(16000 * 600)
+        for order in [12, 50, 100]:
+            b = np.r_[1, 0.01 * np.random.randn(order)]
+            tl = measure("lfilter(b, 1., x)", 1)
+            tf = measure("fftfilt(b, x)", 1)
+            print " %5d | %11.3f | %11.3f" % (order, tl, tf)
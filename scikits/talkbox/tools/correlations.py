@@ -1,5 +1,7 @@
 import numpy as np
-from scipy.fftpack import fft, ifft
+
+from fftutils import rfft_power, irfft_power
+from dtypes import floating_dtype
 
 __all__ = ['nextpow2', 'acorr']
 
@@ -30,7 +32,7 @@ def nextpow2(n):
         return res
 
 def _acorr_last_axis(x, nfft, maxlag, onesided=False, scale='none'):
-    a = np.real(ifft(np.abs(fft(x, n=nfft) ** 2)))
+    a = irfft_power(rfft_power(x, nfft), nfft)
     if onesided:
         b = a[..., :maxlag]
     else:
@@ -42,7 +44,7 @@ def _acorr_last_axis(x, nfft, maxlag, onesided=False, scale='none'):
     else:
         return b
 
-def acorr(x, axis=-1, onesided=False, scale='none'):
+def acorr(x, axis=-1, onesided=False, scale='none', dtype=None):
     """Compute autocorrelation of x along given axis.
 
     Parameters
@@ -56,6 +58,9 @@ def acorr(x, axis=-1, onesided=False, scale='none'):
     scale: {'none', 'coeff'}
         scaling mode. If 'coeff', the correlation is normalized such as the
         0-lag is equal to 1.
+    dtype: dtype, optional
+        precision of the computation (float32 or float64). By default, the
+        precision of x is used (float64 for integer input).
 
     Notes
     -----
@@ -66,6 +71,8 @@ def acorr(x, axis=-1, onesided=False, scale='none'):
         raise ValueError("Complex input not supported yet")
     if not scale in ['none', 'coeff']:
         raise ValueError("scale mode %s not understood" % scale)
+    if dtype is not None:
+        x = np.asarray(x, floating_dtype(dtype))
 
     maxlag = x.shape[axis]
     nfft = 2 ** nextpow2(2 * maxlag - 1)
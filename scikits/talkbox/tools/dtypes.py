@@ -0,0 +1,27 @@
+"""Internal helpers to handle the floating point precision of computations."""
+
+import numpy as np
+
+__all__ = ['floating_dtype']
+
+def floating_dtype(dtype=None, default=np.float64):
+    """Return the floating point dtype to use for computation.
+
+    Parameters
+    ----------
+    dtype : dtype or None
+        requested dtype. Only float32 and float64 are supported.
+    default : dtype
+        dtype returned when dtype is None.
+
+    Returns
+    -------
+    dtype : np.dtype
+        the dtype to use."""
+    if dtype is None:
+        dtype = default
+    dtype = np.dtype(dtype)
+    if not dtype in (np.float32, np.float64):
+        raise ValueError("dtype %s not supported (only float32 and float64 "
+                         "are)" % dtype)
+    return dtype
@@ -1,7 +1,7 @@
 import numpy as np
 from scipy.signal import lfilter
 
-def slfilter(b, a, x):
+def slfilter(b, a, x, zi=None):
     """Filter a set of frames and filter coefficients. More precisely, given
     rank 2 arrays for coefficients and input, this computes:
 
@@ -20,12 +20,15 @@ def slfilter(b, a, x):
             non-recursive coefficients
         x: array
             signal to filter
+        zi: array, optional
+            initial conditions of every row. If given, the final conditions
+            are returned as well (see cslfilter).
 
     Note
     ----
 
-    This is a specialized function, and does not handle initial conditions,
-    rank > 2 nor  arbitrary axis handling."""
+    This is a specialized function, and does not handle rank > 2 nor
+    arbitrary axis handling."""
 
     if not x.ndim == 2:
         raise ValueError("Only input of rank 2 support")
@@ -46,6 +49,12 @@ def slfilter(b, a, x):
 
     y = np.empty((x.shape[0], x.shape[1]), x.dtype)
 
+    if zi is not None:
+        zf = np.empty(np.shape(zi), y.dtype)
+        for i in range(nfr):
+            y[i], zf[i] = lfilter(b[i], a[i], x[i], zi=zi[i])
+        return y, zf
+
     for i in range(nfr):
         y[i] = lfilter(b[i], a[i], x[i])
 
@@ -0,0 +1,88 @@
+"""Internal helpers for the FFT of real signals.
+
+All the functions work on the last axis, and only compute/return the one-sided
+spectrum (nfft/2 + 1 bins), which is all that is needed for real input. They
+use the real transforms of scipy.fftpack, which work on half-size complex
+transforms internally: compared to the complex fft of the same real input,
+this is roughly twice as fast and needs half the memory."""
+
+import numpy as np
+from scipy.fftpack import rfft, irfft
+
+__all__ = ['onesided_size', 'rfft_onesided', 'rfft_power', 'rfft_magnitude',
+           'irfft_power', 'rfft_multiply']
+
+def onesided_size(nfft):
+    """Number of bins of the one-sided spectrum of a nfft points fft."""
+    return nfft / 2 + 1
+
+def rfft_onesided(x, nfft):
+    """Compute the one-sided complex spectrum of x on the last axis.
+
+    Equivalent to fft(x, nfft)[..., :nfft/2+1] for real x."""
+    y = rfft(x, nfft, axis=-1)
+    n = onesided_size(nfft)
+
+    # fftpack packs the spectrum as [y(0), Re(y(1)), Im(y(1)), ...]
+    c = np.zeros(y.shape[:-1] + (n,), np.result_type(y.dtype, np.complex64))
+    c.real[..., 0] = y[..., 0]
+    c.real[..., 1:] = y[..., 1::2]
+    c.imag[..., 1:(nfft+1)/2] = y[..., 2::2]
+    return c
+
+def rfft_power(x, nfft):
+    """Compute the one-sided power spectrum |fft(x, nfft)| ** 2 of x on the
+    last axis."""
+    y = rfft(x, nfft, axis=-1)
+    n = onesided_size(nfft)
+
+    p = np.empty(y.shape[:-1] + (n,), y.dtype)
+    p[..., 0] = y[..., 0] ** 2
+    if nfft % 2 == 0:
+        np.add(y[..., 1:-1:2] ** 2, y[..., 2:-1:2] ** 2, p[..., 1:-1])
+        p[..., -1] = y[..., -1] ** 2
+    else:
+        np.add(y[..., 1::2] ** 2, y[..., 2::2] ** 2, p[..., 1:])
+    return p
+
+def rfft_magnitude(x, nfft):
+    """Compute the one-sided magnitude spectrum |fft(x, nfft)| of x on the
+    last axis."""
+    p = rfft_power(x, nfft)
+    return np.sqrt(p, p)
+
+def irfft_power(p, nfft):
+    """Inverse fft of a one-sided, real and even spectrum (typically a power
+    spectrum as returned by rfft_power), on the last axis.
+
+    Equivalent to np.real(ifft(P)) where P is the two-sided version of p: the
+    inverse of a power spectrum is the (circular) autocorrelation."""
+    y = np.zeros(p.shape[:-1] + (nfft,), p.dtype)
+    y[..., 0] = p[..., 0]
+    y[..., 1::2] = p[..., 1:(nfft+2)/2]
+    return irfft(y, nfft, axis=-1, overwrite_x=True)
+
+def rfft_multiply(x, h, nfft, out=None):
+    """Multiply two spectra in the packed format of scipy.fftpack.rfft (as
+    complex numbers), on the last axis, with broadcasting.
+
+    irfft(rfft_multiply(rfft(x, nfft), rfft(h, nfft), nfft)) is the circular
+    convolution of x and h, without any conversion to complex arrays. out may
+    be x itself, to multiply in place."""
+    if out is None:
+        shape = np.broadcast(x[..., :1], h[..., :1]).shape[:-1] + (nfft,)
+        out = np.empty(shape, np.result_type(x.dtype, h.dtype))
+    m = nfft - 1 if nfft % 2 == 0 else nfft
+    xr, xi = x[..., 1:m:2], x[..., 2:m:2]
+    hr, hi = h[..., 1:m:2], h[..., 2:m:2]
+    # xi * hi and xr * hi are computed before out (possibly x) is written
+    t1 = xi * hi
+    t2 = xr * hi
+    np.multiply(xr, hr, out[..., 1:m:2])
+    out[..., 1:m:2] -= t1
+    np.multiply(xi, hr, out[..., 2:m:2])
+    out[..., 2:m:2] += t2
+    np.multiply(x[..., 0], h[..., 0], out[..., 0])
+    if nfft % 2 == 0:
+        np.multiply(x[..., -1], h[..., -1], out[..., -1])
+    return out
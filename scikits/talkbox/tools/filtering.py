@@ -0,0 +1,270 @@
+"""Filtering of many frames or parallel channels: direct or FFT based
+filtering of a set of frames, and filtering of channels by blocks."""
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from scipy.fftpack import rfft, irfft
+
+from cffilter import cslfilter
+from correlations import nextpow2
+from fftutils import rfft_multiply
+
+__all__ = ['slfilter', 'fftfilt', 'BlockFilter']
+
+# method='auto' of slfilter uses the FFT when the cost of the direct filter
+# (nx * nb multiply-adds per row) is above this ratio times the cost of the
+# overlap-save FFTs (~ nfft * log2(nfft) per transform): see
+# benchmarks/bench_filtering.py.
+_FFT_COST_RATIO = 3.
+
+# Number of input samples transformed at once by fftfilt, to bound the
+# memory of the spectra for long signals
+_FFT_CHUNK_SIZE = 2 ** 18
+
+# FFT size of the overlap-save blocks, for each filter length
+_FFT_SIZES = {}
+
+def _fft_size(nb):
+    """Return the FFT size of the overlap-save blocks for a filter of nb
+    taps: the power of 2 minimizing the cost per output sample,
+    nfft * log2(nfft) / (nfft - nb + 1). The result is cached."""
+    try:
+        return _FFT_SIZES[nb]
+    except KeyError:
+        p = nextpow2(nb)
+        sizes = 2. ** np.arange(p + 1, p + 10)
+        cost = sizes * np.log2(sizes) / (sizes - nb + 1)
+        nfft = _FFT_SIZES[nb] = int(sizes[np.argmin(cost)])
+        return nfft
+
+def _block_size(nb, nx):
+    """FFT size used by fftfilt for nx samples and a filter of nb taps: a
+    single block is enough for short signals."""
+    return min(_fft_size(nb), 2 ** nextpow2(nx + nb - 1))
+
+def _fft_is_faster(nb, nx, per_row):
+    """Whether filtering nx samples by a nb taps FIR filter is expected to be
+    faster with fftfilt than with the direct filter."""
+    nfft = _block_size(nb, nx)
+    nblocks = -(-nx // (nfft - nb + 1))
+    # One forward and one inverse FFT per block, and the FFT of the filter if
+    # every row has its own one
+    ntransforms = 2 * nblocks + (1 if per_row else 0)
+    return nx * nb > _FFT_COST_RATIO * ntransforms * nfft * np.log2(nfft)
+
+def fftfilt(b, x, nfft=None):
+    """Filter the rows of x by FIR filters, using FFT block convolution
+    (overlap-save).
+
+    Parameters
+    ----------
+    b : array
+        FIR filter coefficients, either of rank 1 (the same filter for every
+        row), or of rank 2 (one filter per row).
+    x : array
+        signal to filter, of rank 1 or 2 (one signal per row).
+    nfft : int, optional
+        FFT size of the blocks, at least the filter length. By default, the
+        size minimizing the cost for the filter length (cached) is used.
+
+    Returns
+    -------
+    y : array
+        filtered signal, the same as lfilter(b, 1, x) on every row, in the
+        precision of the input.
+
+    Notes
+    -----
+    The cost is O(log(nfft)) per sample instead of O(nb) for the direct
+    filter, which is much cheaper for long filters on long signals. The
+    blocks of every row are transformed together, by chunks of a bounded
+    size."""
+    x = np.asarray(x)
+    b = np.asarray(b)
+    if not (np.isrealobj(x) and np.isrealobj(b)):
+        raise ValueError("Complex input not supported")
+    if x.ndim > 2 or b.ndim > 2:
+        raise ValueError("Only input and filters of rank <= 2 supported")
+    dt = np.result_type(x.dtype, b.dtype, np.float32)
+    x2 = np.atleast_2d(x)
+    b2 = np.atleast_2d(b)
+    nrows, nx = x2.shape
+    nb = b2.shape[1]
+    if not b2.shape[0] in (1, nrows):
+        raise ValueError("Number of filters and number of rows should be "
+                         "the same")
+    if nb < 1:
+        raise ValueError("b should have at least one coefficient")
+
+    if nfft is None:
+        nfft = _block_size(nb, nx)
+    elif nfft < nb:
+        raise ValueError("nfft should be >= the filter length")
+    step = nfft - nb + 1
+    nblocks = -(-nx // step)
+
+    # Zero initial state: nb - 1 zeros before the signal
+    xp = np.zeros((nrows, (nblocks - 1) * step + nfft), dt)
+    xp[:, nb-1:nb-1+nx] = x2
+    h = rfft(b2.astype(dt, copy=False), nfft, axis=-1)[:, np.newaxis, :]
+
+    y = np.empty((nrows, nblocks * step), dt)
+    chunk = max(_FFT_CHUNK_SIZE // (nrows * nfft), 1)
+    for k in range(0, nblocks, chunk):
+        nk = min(chunk, nblocks - k)
+        blocks = as_strided(xp[:, k*step:], shape=(nrows, nk, nfft),
+                            strides=(xp.strides[0], step * xp.strides[1],
+                                     xp.strides[1]))
+        xb = rfft(blocks, nfft, axis=-1)
+        yb = irfft(rfft_multiply(xb, h, nfft, out=xb), nfft, axis=-1,
+                   overwrite_x=True)
+        # The nb - 1 first samples of every block are circular aliases
+        y[:, k*step:(k+nk)*step] = yb[..., nb-1:].reshape(nrows, nk * step)
+
+    y = y[:, :nx]
+    if x.ndim == 1:
+        return y[0]
+    return y
+
+def slfilter(b, a, x, dtype=None, zi=None, out=None, method='auto',
+             n_jobs=1):
+    """Filter a set of frames by a set of filters. More precisely, given
+    rank 2 arrays for coefficients and input, this computes:
+
+    for i in range(x.shape[0]):
+        y[i] = lfilter(b[i], a[i], x[i])
+
+    Parameters
+    ----------
+        b, a, x, dtype, zi, out, n_jobs:
+            see cslfilter. n_jobs is only used by the direct filter.
+        method: {'auto', 'direct', 'fft'}
+            'direct' uses the direct filter (cslfilter), and 'fft' FFT block
+            convolution (fftfilt), which is only possible for FIR filters (a
+            with one column) without zi. 'auto' (default) uses the FFT for
+            FIR filters when it is expected to be faster, i.e. for long
+            filters on long frames.
+
+    Returns
+    -------
+        y: array
+            filtered signal.
+        zf: array
+            final conditions of every row, only returned if zi is given."""
+    if not method in ('auto', 'direct', 'fft'):
+        raise ValueError("method %s not understood" % method)
+    b = np.asarray(b)
+    a = np.asarray(a)
+    x = np.asarray(x)
+
+    fir = a.ndim == 2 and a.shape[1] == 1 and zi is None
+    if method == 'fft' and not fir:
+        raise ValueError("method 'fft' only supports FIR filters without "
+                         "initial conditions")
+    if method == 'auto':
+        use_fft = fir and x.ndim == 2 and b.ndim == 2 and \
+                  _fft_is_faster(b.shape[1], x.shape[1], True)
+    else:
+        use_fft = method == 'fft'
+    if not use_fft:
+        return cslfilter(b, a, x, dtype=dtype, zi=zi, out=out, n_jobs=n_jobs)
+
+    if not (x.ndim == 2 and b.ndim == 2):
+        raise ValueError("Only input and b of rank 2 support")
+    if out is not None and np.may_share_memory(out, x):
+        raise ValueError("out should not overlap with the input")
+    if not a.shape[0] == b.shape[0] == x.shape[0]:
+        raise ValueError("Number of filters and number of frames should be "
+                         "the same")
+    if np.any(a[:, 0] == 0):
+        raise ValueError("a[:, 0] should be non zero")
+    if dtype is None:
+        dt = np.common_type(a, b, x)
+    else:
+        dt = np.dtype(dtype)
+    if not dt in (np.float32, np.float64):
+        raise ValueError("Only float32 and float64 supported for now")
+
+    if not np.all(a == 1):
+        b = b / a
+    y = fftfilt(b.astype(dt, copy=False), x.astype(dt, copy=False))
+    if out is not None:
+        if not (isinstance(out, np.ndarray) and out.dtype == dt and
+                out.shape == y.shape):
+            raise ValueError("out should be an array of the same shape as "
+                             "x, of the computation precision")
+        out[...] = y
+        return out
+    return y
+
+class BlockFilter(object):
+    """Filter many parallel channels received by blocks of samples.
+
+    The state of every channel is kept between calls to push: filtering a
+    signal block by block gives exactly the same result as filtering it at
+    once, without any overlap between the blocks.
+
+    Parameters
+    ----------
+    b : array
+        numerator coefficients, either of rank 1 (the same filter for every
+        channel) or of rank 2 (one filter per channel).
+    a : array
+        denominator coefficients, of rank 1 or 2 as b.
+    nchannels : int
+        number of channels.
+    dtype : dtype, optional
+        precision of the computation, float32 or float64 (default).
+    n_jobs : int, optional
+        number of threads over which the channels are split (see
+        cslfilter).
+
+    Examples
+    --------
+    >>> filt = BlockFilter([1, -0.97], [1], nchannels=1000)
+    >>> for block in blocks:
+    ...     y = filt.push(block)"""
+    def __init__(self, b, a, nchannels, dtype=np.float64, n_jobs=1):
+        self.dtype = np.dtype(dtype)
+        if not self.dtype in (np.float32, np.float64):
+            raise ValueError("Only float32 and float64 supported for now")
+        self.nchannels = nchannels
+        self.n_jobs = n_jobs
+        self.b = self._coefficients(b, "b")
+        self.a = self._coefficients(a, "a")
+        self.reset()
+
+    def _coefficients(self, c, name):
+        c = np.asarray(c, self.dtype)
+        if c.ndim == 1:
+            c = np.tile(c, (self.nchannels, 1))
+        if not (c.ndim == 2 and c.shape[0] == self.nchannels):
+            raise ValueError("%s should be of rank 1 or of shape (%d, n)" %
+                             (name, self.nchannels))
+        return np.ascontiguousarray(c)
+
+    def reset(self):
+        """Reset the state of every channel to zero, to start processing new
+        signals."""
+        n = max(self.a.shape[1], self.b.shape[1]) - 1
+        self.zi = np.zeros((self.nchannels, n), self.dtype)
+
+    def push(self, x):
+        """Filter the next block of samples.
+
+        Parameters
+        ----------
+        x : array
+            the next samples, of shape (nchannels, nsamples).
+
+        Returns
+        -------
+        y : array
+            the filtered samples, of the same shape as x."""
+        x = np.asarray(x)
+        if not (x.ndim == 2 and x.shape[0] == self.nchannels):
+            raise ValueError("x should be of shape (%d, nsamples)" %
+                             self.nchannels)
+        y, self.zi = cslfilter(self.b, self.a, x, dtype=self.dtype,
+                               zi=self.zi, n_jobs=self.n_jobs)
+        return y
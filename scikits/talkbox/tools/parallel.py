@@ -0,0 +1,130 @@
+"""Internal helpers to split row-wise computations across threads.
+
+This is only useful for functions which release the GIL while processing
+their rows (the compiled kernels of talkbox): the rows are split into one
+contiguous block per thread, each block being processed by a separate call,
+with its own scratch space."""
+
+import os
+import threading
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+__all__ = ['effective_n_jobs', 'map_row_blocks']
+
+_pool = None
+_pool_size = 0
+_pool_pid = None
+# Number of map_row_blocks calls using each pool
+_pool_users = {}
+_pool_lock = threading.Lock()
+
+def _acquire_pool(n):
+    """Return the thread pool shared by every parallel function of talkbox,
+    with at least n threads. It must be given back with _release_pool once
+    the tasks are submitted and completed.
+
+    The pool is created on first use, with at least one thread per cpu, and
+    replaced by a larger one if more threads are requested: the previous pool
+    is only closed once no caller uses it anymore. It is also recreated in a
+    forked process (e.g. a multiprocessing worker), which inherits the pool
+    object but not its threads."""
+    global _pool, _pool_size, _pool_pid, _pool_users
+    _pool_lock.acquire()
+    try:
+        pid = os.getpid()
+        if _pool_pid != pid:
+            # The inherited pools cannot be used (nor closed)
+            _pool = None
+            _pool_users = {}
+        if _pool is None or _pool_size < n:
+            if _pool is not None and not _pool in _pool_users:
+                _pool.close()
+            _pool_size = max(n, multiprocessing.cpu_count())
+            _pool = ThreadPool(_pool_size)
+            _pool_pid = pid
+        _pool_users[_pool] = _pool_users.get(_pool, 0) + 1
+        return _pool
+    finally:
+        _pool_lock.release()
+
+def _release_pool(pool):
+    """Give back a pool obtained from _acquire_pool, closing it if it has
+    been replaced and is not used anymore."""
+    _pool_lock.acquire()
+    try:
+        if not pool in _pool_users:
+            return
+        _pool_users[pool] -= 1
+        if _pool_users[pool] == 0:
+            del _pool_users[pool]
+            if pool is not _pool:
+                pool.close()
+    finally:
+        _pool_lock.release()
+
+def effective_n_jobs(n_jobs):
+    """Return the actual number of threads for a n_jobs argument: n_jobs
+    itself if > 0, and cpu_count() + 1 + n_jobs if < 0 (-1 meaning one thread
+    per cpu)."""
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs == 0 has no meaning")
+    if n_jobs < 0:
+        return max(multiprocessing.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+def map_row_blocks(func, x, n_jobs, out=None):
+    """Apply func to blocks of rows of x in parallel, and concatenate the
+    results.
+
+    Parameters
+    ----------
+    func : callable
+        function of a (nrows, ...) array, returning an array or a tuple of
+        arrays whose first axis corresponds to the rows.
+    x : ndarray
+        input, of rank >= 1. It is split on its first axis.
+    n_jobs : int
+        number of threads (see effective_n_jobs).
+    out : tuple of ndarrays, optional
+        preallocated outputs, whose first axis corresponds to the rows of x.
+        If given, func is called as func(block, *out_blocks) and must write
+        its results into the out blocks (views of out), and out is returned
+        instead of a concatenation.
+
+    Returns
+    -------
+    y : ndarray or tuple
+        same as func(x)."""
+    n = min(effective_n_jobs(n_jobs), x.shape[0])
+    if n <= 1:
+        if out is not None:
+            func(x, *out)
+            return out
+        return func(x)
+
+    bounds = np.linspace(0, x.shape[0], n + 1).astype(np.intp)
+    if out is not None:
+        blocks = [(x[bounds[i]:bounds[i+1]],) +
+                  tuple(o[bounds[i]:bounds[i+1]] for o in out)
+                  for i in range(n)]
+        pool = _acquire_pool(n)
+        try:
+            pool.map(lambda b: func(*b), blocks, chunksize=1)
+        finally:
+            _release_pool(pool)
+        return out
+
+    blocks = [x[bounds[i]:bounds[i+1]] for i in range(n)]
+    pool = _acquire_pool(n)
+    try:
+        res = pool.map(func, blocks, chunksize=1)
+    finally:
+        _release_pool(pool)
+    if isinstance(res[0], tuple):
+        return tuple(np.concatenate(r) for r in zip(*res))
+    return np.concatenate(res)
@@ -5,6 +5,7 @@ def configuration(parent_package='', top_path=None):
     from numpy.distutils.misc_util import Configuration
     config = Configuration('tools', parent_package, top_path)
     config.add_data_dir('tests')
+    config.add_data_dir('benchmarks')
     config.add_extension('cffilter', ['src/cffilter.c'])
     config.add_extension('cacorr', ['src/cacorr.c'])
 
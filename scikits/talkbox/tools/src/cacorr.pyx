@@ -1,66 +1,138 @@
 import numpy as np
 cimport numpy as c_np
-cimport stdlib
+from numpy cimport npy_intp
+from cython cimport floating
 
-def acorr(c_np.ndarray x, maxlag=None, onesided=False, axis=-1):
+from scikits.talkbox.tools.parallel import map_row_blocks
+
+def acorr(c_np.ndarray x, maxlag=None, onesided=False, axis=-1, n_jobs=1):
     """Cython version of autocorrelation, direct implementation. This can be
-    faster than FFT for small size or for maxlag << x.shape[axis]."""
-    cdef double *raw_x, *raw_y
-    cdef int raw_maxlag, nfr, raw_onesided, nx, ny, i
-    cdef c_np.ndarray[double, ndim=2] tx
-    cdef c_np.ndarray[double, ndim=2] ty
+    faster than FFT for small size or for maxlag << x.shape[axis].
 
-    if not x.dtype == np.float64:
-        raise ValueError("Only float64 supported for now")
+    The autocorrelation is computed along axis, for input of any rank: the
+    output has the shape of x, with ny = maxlag + 1 (onesided) or 2 * maxlag
+    + 1 items on axis.
 
-    if not x.ndim == 2:
-        raise ValueError("Rank != 2 not supported yet")
+    float32 and float64 input are supported; float32 input is processed in
+    single precision (with double precision accumulation).
 
-    axis = axis % x.ndim
-    if not axis == 1:
-        raise ValueError("Axis != 1 not supported yet")
+    The input is read in place with its strides, whatever its memory layout:
+    non contiguous views (e.g. overlapping frames from segment_axis, or
+    another axis than the last one) are never copied as a whole. Only one row
+    at a time is gathered into a scratch buffer when the samples of a row are
+    not contiguous.
+
+    The rows are processed without the GIL: acorr can run concurrently from
+    several python threads, and n_jobs splits the rows over that many threads
+    (-1 for one thread per cpu, see tools.parallel)."""
+    cdef int raw_maxlag, raw_onesided, nx, ny
+    cdef c_np.ndarray ty
 
-    tx = np.ascontiguousarray(x)
+    if not x.dtype in (np.float32, np.float64):
+        raise ValueError("Only float32 and float64 supported for now")
 
+    if x.ndim < 1:
+        raise ValueError("Rank 0 not supported")
+
+    axis = axis % x.ndim
+    if not (x.flags.aligned and x.strides[axis] % x.itemsize == 0):
+        x = np.ascontiguousarray(x)
+    # View with the rows on the last axis: no copy
+    xv = np.rollaxis(x, axis, x.ndim)
+
+    nx = xv.shape[-1]
     if maxlag is None:
-        raw_maxlag = x.shape[axis] - 1
+        raw_maxlag = nx - 1
     else:
         raw_maxlag = maxlag
 
-    nfr = tx.shape[0]
-    nx = tx.shape[axis]
     if onesided:
         ny = raw_maxlag+1
-        ty = np.zeros((nfr, ny), x.dtype)
         raw_onesided = 1
     else:
         ny = 2*raw_maxlag+1
-        ty = np.zeros((nfr, ny), x.dtype)
         raw_onesided = 0
+    ty = np.empty(xv.shape[:-1] + (ny,), x.dtype)
 
-    raw_x = <double*>tx.data
-    raw_y = <double*>ty.data
+    map_row_blocks(lambda boff, by: _acorr_block(xv, boff, by, raw_maxlag,
+                                                 raw_onesided),
+                   _row_offsets(xv), n_jobs, out=(ty.reshape(-1, ny),))
 
-    for i in range(nfr):
-        acorr_double(raw_x, nx, raw_maxlag, raw_onesided, raw_y)
-        raw_x += nx
-        raw_y += ny
+    if axis == x.ndim - 1:
+        return ty
+    return np.rollaxis(ty, x.ndim - 1, axis)
+
+def _row_offsets(x):
+    """Offsets in bytes of the start of every row (last axis) of x from its
+    first item, the other axes being in C order."""
+    off = np.zeros(1, np.intp)
+    for n, stride in zip(x.shape[:-1], x.strides[:-1]):
+        off = (off[:, np.newaxis] +
+               np.arange(n, dtype=np.intp) * stride).ravel()
+    return off
+
+def _acorr_block(c_np.ndarray x, c_np.ndarray offsets, c_np.ndarray y,
+                 int maxlag, int onesided):
+    """Autocorrelation of the rows of x starting at the given offsets into
+    the contiguous y, without the GIL."""
+    cdef int nfr = offsets.shape[0]
+    cdef int nx = x.shape[x.ndim - 1]
+    cdef npy_intp stride = x.strides[x.ndim - 1] / x.itemsize
+    cdef char* data = x.data
+    cdef npy_intp* off = <npy_intp*>offsets.data
+    cdef c_np.ndarray tmp = np.empty(nx if stride != 1 else 0, x.dtype)
+    cdef char* ptmp = tmp.data
+    cdef char* py = y.data
 
-    return ty
+    if x.dtype == np.float32:
+        with nogil:
+            acorr_rows(data, off, nfr, nx, stride, maxlag, onesided,
+                       <float*>py, <float*>ptmp)
+    else:
+        with nogil:
+            acorr_rows(data, off, nfr, nx, stride, maxlag, onesided,
+                       <double*>py, <double*>ptmp)
 
-# y values are assumed to be set to 0
-cdef int acorr_double(double* x, int nx, int maxlag, int onesided, double* y):
-    cdef int i, j, ni, nf
-    cdef double gain, acc
+cdef void acorr_rows(char* data, npy_intp* off, int nfr, int nx,
+                     npy_intp stride, int maxlag, int onesided, floating* y,
+                     floating* tmp) nogil:
+    cdef int i, j, ny
+    cdef floating* x
 
     if onesided:
-        for i in range(maxlag+1):
-            for j in range(nx-i):
-                y[i] += x[j] * x[i+j]
+        ny = maxlag+1
     else:
-        for i in range(maxlag+1):
-            for j in range(nx-i):
-                y[i+maxlag] += x[j] * x[i+j]
+        ny = 2*maxlag+1
+
+    for i in range(nfr):
+        x = <floating*>(data + off[i])
+        if stride != 1:
+            # Gather the row, so that the kernel reads contiguous samples
+            for j in range(nx):
+                tmp[j] = x[j * stride]
+            x = tmp
+        acorr_kernel(x, nx, maxlag, onesided, y)
+        y += ny
+
+# Write the ny lags of the contiguous x into y (every item of y is
+# overwritten: y need not be initialised)
+cdef int acorr_kernel(floating* x, int nx, int maxlag, int onesided,
+                      floating* y) nogil:
+    cdef int i, j, offset
+    cdef double acc
+
+    if onesided:
+        offset = 0
+    else:
+        offset = maxlag
+
+    for i in range(maxlag+1):
+        acc = 0
+        for j in range(nx-i):
+            acc += x[j] * x[i+j]
+        y[i+offset] = acc
+
+    if not onesided:
         for i in range(maxlag):
             y[i] = y[2*maxlag-i]
 
@@ -1,8 +1,11 @@
 import numpy as np
 cimport numpy as c_np
-cimport stdlib
+from cython cimport floating
 
-def cslfilter(c_np.ndarray b, c_np.ndarray a, c_np.ndarray x):
+from scikits.talkbox.tools.parallel import map_row_blocks
+
+def cslfilter(c_np.ndarray b, c_np.ndarray a, c_np.ndarray x, dtype=None,
+              zi=None, out=None, n_jobs=1):
     """Fast version of slfilter for a set of frames and filter coefficients.
     More precisely, given rank 2 arrays for coefficients and input, this
     computes:
@@ -22,24 +25,58 @@ def cslfilter(c_np.ndarray b, c_np.ndarray a, c_np.ndarray x):
             non-recursive coefficients
         x: array
             signal to filter
+        dtype: dtype, optional
+            precision of the computation, float32 or float64. By default, the
+            common type of a, b and x is used.
+        zi: array, optional
+            initial conditions of every row, of shape (x.shape[0],
+            max(a.shape[1], b.shape[1]) - 1), with the same convention as
+            scipy.signal.lfilter (transposed direct form II).
+        out: array, optional
+            array in which the filtered signal is written, instead of a new
+            array. It must be C contiguous, of the computation precision and
+            of the same shape as x, and must not overlap with x, a or b
+            (in place filtering is not supported).
+        n_jobs: int, optional
+            number of threads over which the rows are split (-1 for one
+            thread per cpu, see tools.parallel).
+
+    Returns
+    -------
+        y: array
+            filtered signal.
+        zf: array
+            final conditions of every row, only returned if zi is given.
+            Passing them as zi of the next call continues the filtering, so
+            that a long signal can be filtered by blocks.
 
     Note
     ----
 
     This is a specialized function, and does not handle other types than
-    double, nor initial conditions."""
+    float and double.
+
+    Without zi, the coefficients are used in place when they are contiguous,
+    of the computation precision and already normalized (a[:, 0] == 1):
+    nothing is allocated but the output, or nothing at all with out. When a
+    has a single column (e.g. LPC residual), a dedicated FIR loop is used.
 
-    cdef int na, nb, nfr, i, nx
-    cdef double *raw_x, *raw_a, *raw_b, *raw_y
-    cdef c_np.ndarray[double, ndim=2] tb
-    cdef c_np.ndarray[double, ndim=2] ta
-    cdef c_np.ndarray[double, ndim=2] tx
-    cdef c_np.ndarray[double, ndim=2] ty
+    The rows are filtered without the GIL, so that cslfilter can also run
+    concurrently from several python threads."""
 
-    dt = np.common_type(a, b, x)
+    cdef int na, nb, nfr, nx
+    cdef c_np.ndarray tb
+    cdef c_np.ndarray ta
+    cdef c_np.ndarray tx
+    cdef c_np.ndarray ty
 
-    if not dt == np.float64:
-        raise ValueError("Only float64 supported for now")
+    if dtype is None:
+        dt = np.common_type(a, b, x)
+    else:
+        dt = np.dtype(dtype)
+
+    if not dt in (np.float32, np.float64):
+        raise ValueError("Only float32 and float64 supported for now")
 
     if not x.ndim == 2:
         raise ValueError("Only input of rank 2 support")
@@ -58,50 +95,207 @@ def cslfilter(c_np.ndarray b, c_np.ndarray a, c_np.ndarray x):
         raise ValueError, \
               "Number of filters and number of frames should be the same"
 
+    if zi is not None:
+        y, zf = _filter_state(b, a, x, dt, zi, n_jobs)
+        if out is not None:
+            _check_out(out, x, dt, (x, a, b))[...] = y
+            y = out
+        return y, zf
+
     tx = np.ascontiguousarray(x, dtype=dt)
-    ty = np.ones((x.shape[0], x.shape[1]), dt)
+    if out is None:
+        ty = np.empty((x.shape[0], x.shape[1]), dt)
+    else:
+        ty = _check_out(out, x, dt, (x, a, b))
 
     na = a.shape[1]
     nb = b.shape[1]
     nx = x.shape[1]
 
-    ta = np.ascontiguousarray(np.copy(a), dtype=dt)
-    tb = np.ascontiguousarray(np.copy(b), dtype=dt)
+    ta = np.ascontiguousarray(a, dtype=dt)
+    tb = np.ascontiguousarray(b, dtype=dt)
+    # Only normalized coefficients are used by the kernels: new normalized
+    # arrays are only created if needed, a and b are never modified
+    if not np.all(ta[:, 0] == 1):
+        if np.any(ta[:, 0] == 0):
+            raise ValueError("a[:, 0] should be non zero")
+        tb = tb / ta[:, :1]
+        ta = ta / ta[:, :1]
+
+    _run_rows(lambda i, j: _filter_block(tb[i:j], ta[i:j], tx[i:j],
+                                         ty[i:j]),
+              nfr, n_jobs)
+
+    return ty
+
+def _run_rows(func, nfr, n_jobs):
+    """Call func(start, stop) on contiguous blocks of the nfr rows, split over
+    n_jobs threads."""
+    def run(rows):
+        if rows.size > 0:
+            func(rows[0], rows[-1] + 1)
+    map_row_blocks(run, np.arange(nfr), n_jobs, out=())
+
+def _filter_block(c_np.ndarray tb, c_np.ndarray ta, c_np.ndarray tx,
+                  c_np.ndarray ty):
+    """Filter the rows of the contiguous tx into ty, without the GIL: the
+    FIR kernel is used if ta has a single column."""
+    cdef int nfr = tx.shape[0]
+    cdef int nx = tx.shape[1]
+    cdef int nb = tb.shape[1]
+    cdef int na = ta.shape[1]
+    cdef bint single = tx.dtype == np.float32
+    cdef char* pb = tb.data
+    cdef char* pa = ta.data
+    cdef char* px = tx.data
+    cdef char* py = ty.data
+
+    with nogil:
+        if na == 1:
+            if single:
+                fir_rows(<float*>pb, nb, <float*>px, nx, <float*>py, nfr)
+            else:
+                fir_rows(<double*>pb, nb, <double*>px, nx, <double*>py, nfr)
+        elif single:
+            filter_rows(<float*>pb, nb, <float*>pa, na, <float*>px, nx,
+                        <float*>py, nfr)
+        else:
+            filter_rows(<double*>pb, nb, <double*>pa, na, <double*>px, nx,
+                        <double*>py, nfr)
+
+def _check_out(out, x, dt, inputs):
+    """Check out can be written directly by the kernels, which read the
+    inputs while writing out: they must not overlap."""
+    if not isinstance(out, np.ndarray):
+        raise TypeError("out should be an array")
+    if not (out.dtype == dt and out.flags.c_contiguous and
+            out.flags.writeable):
+        raise ValueError("out should be a writeable, C contiguous array of "
+                         "the computation precision")
+    if not out.shape == (x.shape[0], x.shape[1]):
+        raise ValueError("out should be of the same shape as x")
+    for arr in inputs:
+        if np.may_share_memory(out, arr):
+            raise ValueError("out should not overlap with the input or the "
+                             "coefficients")
+    return out
+
+def _filter_state(b, a, x, dt, zi, n_jobs):
+    """cslfilter with initial conditions: returns y and the final
+    conditions."""
+    cdef int nfr, nf, nx
+    cdef c_np.ndarray tb
+    cdef c_np.ndarray ta
+    cdef c_np.ndarray tx
+    cdef c_np.ndarray ty
+    cdef c_np.ndarray zf
+
+    nfr = x.shape[0]
+    nx = x.shape[1]
+    nf = max(a.shape[1], b.shape[1])
+
+    zf = np.array(zi, dtype=dt, order='C', copy=True)
+    if not (zf.ndim == 2 and zf.shape[0] == nfr and zf.shape[1] == nf - 1):
+        raise ValueError("zi should be of shape (%d, %d)" % (nfr, nf - 1))
+
+    # Normalized coefficients, padded with zeros to the same length
+    ta = np.zeros((nfr, nf), dt)
+    tb = np.zeros((nfr, nf), dt)
+    ta[:, :a.shape[1]] = a
+    tb[:, :b.shape[1]] = b
+    if np.any(ta[:, 0] == 0):
+        raise ValueError("a[:, 0] should be non zero")
+    tb /= ta[:, :1]
+    ta /= ta[:, :1]
+
+    tx = np.ascontiguousarray(x, dtype=dt)
+    ty = np.empty((nfr, nx), dt)
+
+    _run_rows(lambda i, j: _filter_state_block(tb[i:j], ta[i:j], tx[i:j],
+                                               ty[i:j], zf[i:j]),
+              nfr, n_jobs)
+
+    return ty, zf
+
+def _filter_state_block(c_np.ndarray tb, c_np.ndarray ta, c_np.ndarray tx,
+                        c_np.ndarray ty, c_np.ndarray zf):
+    """Filter the rows of the contiguous tx into ty from the states zf,
+    updated in place, without the GIL."""
+    cdef int nfr = tx.shape[0]
+    cdef int nx = tx.shape[1]
+    cdef int nf = ta.shape[1]
+    cdef bint single = tx.dtype == np.float32
+    cdef char* pb = tb.data
+    cdef char* pa = ta.data
+    cdef char* px = tx.data
+    cdef char* py = ty.data
+    cdef char* pz = zf.data
+
+    with nogil:
+        if single:
+            filter_rows_state(<float*>pb, <float*>pa, nf, <float*>px, nx,
+                              <float*>py, <float*>pz, nfr)
+        else:
+            filter_rows_state(<double*>pb, <double*>pa, nf, <double*>px, nx,
+                              <double*>py, <double*>pz, nfr)
 
-    raw_x = <double*>tx.data
-    raw_b = <double*>tb.data
-    raw_a = <double*>ta.data
-    raw_y = <double*>ty.data
+cdef void filter_rows_state(floating* b, floating* a, int nf, floating* x,
+                            int nx, floating* y, floating* z, int nfr) nogil:
+    cdef int i
 
     for i in range(nfr):
-        filter_double(raw_b, nb, raw_a, na, raw_x, nx, raw_y)
-        raw_b += nb
-        raw_a += na
-        raw_x += nx
-        raw_y += nx
+        filter_kernel_state(b, a, nf, x, nx, y, z)
+        b += nf
+        a += nf
+        x += nx
+        y += nx
+        z += nf - 1
 
-    return ty
+# Transposed direct form II, as scipy.signal.lfilter: a and b are normalized,
+# and have the same size nf. The state z (nf - 1 items) is updated in place.
+cdef void filter_kernel_state(floating* b, floating* a, int nf, floating* x,
+                              int nx, floating* y, floating* z) nogil:
+
+    cdef int i, j
+    cdef int nz = nf - 1
+    cdef double xi, yi
 
-# a and b are modified in place
-cdef int filter_double(double* b, int nb, double* a, int na, double* x, int nx, double* y):
+    for i in range(nx):
+        xi = x[i]
+        if nz > 0:
+            yi = z[0] + b[0] * xi
+            for j in range(nz - 1):
+                z[j] = z[j+1] + b[j+1] * xi - a[j+1] * yi
+            z[nz-1] = b[nz] * xi - a[nz] * yi
+        else:
+            yi = b[0] * xi
+        y[i] = yi
+
+cdef void filter_rows(floating* b, int nb, floating* a, int na, floating* x,
+                      int nx, floating* y, int nfr) nogil:
+    cdef int i
+
+    for i in range(nfr):
+        filter_kernel(b, nb, a, na, x, nx, y)
+        b += nb
+        a += na
+        x += nx
+        y += nx
+
+# a and b must be normalized (a[0] == 1)
+cdef void filter_kernel(floating* b, int nb, floating* a, int na, floating* x,
+                        int nx, floating* y) nogil:
 
     cdef int i, j, ni, nf
-    cdef double gain, acc
+    cdef double acc
 
     if na > nb:
         nf = na
     else:
         nf = nb
-
-    gain = a[0]
-    if gain == 0:
-        return -1
-
-    if gain != 1:
-        for i in range(na):
-            a[i] /= gain
-        for i in range(nb):
-            b[i] /= gain
+    # The first samples only depend on the samples of the current frame
+    if nf > nx:
+        nf = nx
 
     for i in range(nf):
         acc = 0
@@ -132,4 +326,33 @@ cdef int filter_double(double* b, int nb, double* a, int na, double* x, int nx,
 
         y[i] = acc
 
-    return 0
+cdef void fir_rows(floating* b, int nb, floating* x, int nx, floating* y,
+                   int nfr) nogil:
+    cdef int i
+
+    for i in range(nfr):
+        fir_kernel(b, nb, x, nx, y)
+        b += nb
+        x += nx
+        y += nx
+
+# Filter without recursive part: y[i] = sum_j b[j] x[i-j], accumulated one
+# tap at a time over the whole frame. The inner loop has no dependency between
+# iterations (contrary to a sum over the taps for each sample), and is much
+# faster.
+cdef void fir_kernel(floating* b, int nb, floating* x, int nx,
+                     floating* y) nogil:
+
+    cdef int i, j
+    cdef floating bj
+    cdef floating* yj
+
+    bj = b[0]
+    for i in range(nx):
+        y[i] = bj * x[i]
+
+    for j in range(1, nb):
+        bj = b[j]
+        yj = y + j
+        for i in range(nx - j):
+            yj[i] += bj * x[i]
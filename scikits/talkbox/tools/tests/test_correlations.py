@@ -111,3 +111,103 @@ class TestAcorr(_TestCorrCommon):
 #    @dec.skipif(True, "Arbitrary axis not suppported yet in cython version")
 #    def test_axis1(self):
 #        pass
+
+class TestAcorrFloat32(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(5, 100)
+
+    def test_acorr(self):
+        """Test single precision acorr against double precision."""
+        y = acorr(self.x, dtype=np.float32)
+        assert y.dtype == np.float32
+        assert_array_almost_equal(y / 100., acorr(self.x) / 100., 5)
+        assert acorr(self.x.astype(np.float32)).dtype == np.float32
+
+    def test_cacorr(self):
+        """Test single precision cython acorr against double precision."""
+        for onesided in [True, False]:
+            y = cacorr(self.x.astype(np.float32), 10, onesided)
+            assert y.dtype == np.float32
+            assert_array_almost_equal(y / 100., cacorr(self.x, 10, onesided)
+                                      / 100., 5)
+
+class TestCythonAcorrThreads(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(37, 100)
+
+    def test_n_jobs(self):
+        """Test threaded cython acorr against single threaded acorr."""
+        for onesided in [True, False]:
+            ref = cacorr(self.x, 10, onesided)
+            for n_jobs in [2, 3, -1, 100]:
+                y = cacorr(self.x, 10, onesided, n_jobs=n_jobs)
+                assert_array_almost_equal(y, ref)
+            y = cacorr(self.x.astype(np.float32), 10, onesided, n_jobs=2)
+            assert_array_almost_equal(y / 100., ref / 100., 5)
+
+    def test_concurrent(self):
+        """Test cython acorr can be called from several threads at once."""
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(4)
+        try:
+            res = pool.map(lambda x: cacorr(x, 10, True), [self.x] * 8)
+        finally:
+            pool.close()
+        ref = cacorr(self.x, 10, True)
+        for y in res:
+            assert_array_almost_equal(y, ref)
+
+class TestCythonAcorrStrided(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(5, 6, 40)
+
+    def _ref(self, x, maxlag, onesided, axis):
+        # Reference computed on a contiguous copy, row by row
+        x = np.ascontiguousarray(np.rollaxis(x, axis, x.ndim))
+        y = cacorr(x.reshape(-1, x.shape[-1]), maxlag, onesided)
+        y = y.reshape(x.shape[:-1] + (y.shape[-1],))
+        return np.rollaxis(y, x.ndim - 1, axis)
+
+    def test_rank1(self):
+        """Test cython acorr on rank 1 input."""
+        x = self.x[0, 0]
+        for onesided in [True, False]:
+            y = cacorr(x, 10, onesided)
+            assert_array_almost_equal(y, cacorr(x[np.newaxis], 10,
+                                                onesided)[0])
+        assert_array_almost_equal(cacorr(x, onesided=True),
+                                  np.correlate(x, x, 'full')[39:])
+
+    def test_axis(self):
+        """Test cython acorr along every axis of rank 3 input."""
+        for axis in range(-3, 3):
+            for onesided in [True, False]:
+                y = cacorr(self.x, 4, onesided, axis=axis)
+                ref = self._ref(self.x, 4, onesided, axis % 3)
+                assert_array_almost_equal(y, ref)
+                y = cacorr(self.x, 4, onesided, axis=axis, n_jobs=2)
+                assert_array_almost_equal(y, ref)
+
+    def test_views(self):
+        """Test cython acorr on non contiguous views."""
+        for x in [self.x[:, ::-1, ::3], self.x[::2, :, ::-1],
+                  self.x.transpose(2, 0, 1), np.asfortranarray(self.x)]:
+            for axis in range(3):
+                y = cacorr(x, 3, True, axis=axis)
+                assert_array_almost_equal(y, self._ref(x, 3, True, axis))
+            y = cacorr(x.astype(np.float32), 3, True)
+            assert_array_almost_equal(y, self._ref(x, 3, True, 2), 4)
+
+    def test_overlapping_frames(self):
+        """Test cython acorr on overlapping frames."""
+        from scikits.talkbox.tools.segmentaxis import segment_axis
+        x = self.x.ravel()
+        for frames in [segment_axis(x, 20, 10), segment_axis(x, 20, 15),
+                       segment_axis(x[::2], 20, 10)]:
+            y = cacorr(frames, 5, True)
+            assert_array_almost_equal(y, self._ref(frames, 5, True, 1))
+            y = cacorr(frames, 5, False, axis=0, n_jobs=3)
+            assert_array_almost_equal(y, self._ref(frames, 5, False, 0))
@@ -4,6 +4,7 @@ from numpy.testing import TestCase, assert_array_almost_equal
 from scipy.signal import lfilter
 
 from scikits.talkbox.tools.ffilter import slfilter
+from scikits.talkbox.tools.cffilter import cslfilter
 
 class TestFfilter(TestCase):
     def setUp(self):
@@ -18,3 +19,145 @@ class TestFfilter(TestCase):
         for i in range(x.shape[0]):
             yr = lfilter(b[i], a[i], x[i])
             assert_array_almost_equal(y[i], yr)
+
+    def test_zi(self):
+        """Test initial and final conditions against lfilter."""
+        x = np.random.randn(3, 20)
+        for nb, na in [(1, 1), (2, 3), (4, 2), (3, 3)]:
+            b = np.random.randn(3, nb)
+            a = np.hstack((np.random.randn(3, 1) + 3,
+                           0.1 * np.random.randn(3, na - 1)))
+            zi = np.random.randn(3, max(na, nb) - 1)
+            y, zf = self.func(b, a, x, zi=zi)
+            for i in range(x.shape[0]):
+                yr, zr = lfilter(b[i], a[i], x[i], zi=zi[i])
+                assert_array_almost_equal(y[i], yr)
+                assert_array_almost_equal(zf[i], zr)
+
+    def test_blocks(self):
+        """Test filtering by blocks with the final conditions is the same as
+        filtering at once."""
+        x = np.random.randn(3, 50)
+        b = np.random.randn(3, 4)
+        a = np.hstack((np.ones((3, 1)), 0.1 * np.random.randn(3, 2)))
+        zi = np.zeros((3, 3))
+        y1, zi = self.func(b, a, x[:, :7], zi=zi)
+        y2, zi = self.func(b, a, x[:, 7:], zi=zi)
+        assert_array_almost_equal(np.hstack((y1, y2)), self.func(b, a, x))
+
+class TestCFfilter(TestFfilter):
+    def setUp(self):
+        self.func = cslfilter
+
+    def test_float32(self):
+        """Test single precision cslfilter against double precision."""
+        x = np.random.randn(4, 50)
+        b = np.random.randn(4, 5)
+        a = np.hstack((np.ones((4, 1)), 0.1 * np.random.randn(4, 2)))
+
+        y = self.func(b.astype(np.float32), a.astype(np.float32),
+                      x.astype(np.float32))
+        assert y.dtype == np.float32
+        assert_array_almost_equal(y, self.func(b, a, x), 5)
+
+        y = self.func(b, a, x, dtype=np.float32)
+        assert y.dtype == np.float32
+        assert_array_almost_equal(y, self.func(b, a, x), 5)
+
+    def test_zi_float32(self):
+        x = np.random.randn(4, 50)
+        b = np.random.randn(4, 5)
+        a = np.hstack((np.ones((4, 1)), 0.1 * np.random.randn(4, 2)))
+        zi = np.random.randn(4, 4)
+        y, zf = self.func(b, a, x, dtype=np.float32, zi=zi)
+        assert y.dtype == np.float32 and zf.dtype == np.float32
+        yr, zr = self.func(b, a, x, zi=zi)
+        assert_array_almost_equal(y, yr, 4)
+        assert_array_almost_equal(zf, zr, 4)
+
+    def test_zi_errors(self):
+        x = np.random.randn(2, 10)
+        b = np.random.randn(2, 2)
+        a = np.random.randn(2, 3)
+        self.assertRaises(ValueError, self.func, b, a, x, zi=np.zeros((2, 1)))
+        self.assertRaises(ValueError, self.func, b, np.zeros((2, 3)), x,
+                          zi=np.zeros((2, 2)))
+
+    def test_fir(self):
+        """Test the FIR path (a with one column), normalized or not."""
+        x = np.random.randn(3, 40)
+        b = np.random.randn(3, 6)
+        for a in [np.ones((3, 1)), 2 * np.ones((3, 1))]:
+            y = self.func(b, a, x)
+            for i in range(x.shape[0]):
+                assert_array_almost_equal(y[i], lfilter(b[i], a[i], x[i]))
+
+    def test_short_frames(self):
+        """Test frames shorter than the filters."""
+        x = np.random.randn(3, 4)
+        b = np.random.randn(3, 9)
+        for a in [np.ones((3, 1)),
+                  np.hstack((np.ones((3, 1)), 0.1 * np.random.randn(3, 7)))]:
+            y = self.func(b, a, x)
+            for i in range(x.shape[0]):
+                assert_array_almost_equal(y[i], lfilter(b[i], a[i], x[i]))
+
+    def test_no_side_effect(self):
+        x = np.random.randn(3, 20)
+        b = np.random.randn(3, 4)
+        a = 2 + np.random.randn(3, 3)
+        b0, a0 = b.copy(), a.copy()
+        self.func(b, a, x)
+        assert np.all(a == a0) and np.all(b == b0)
+
+    def test_out(self):
+        x = np.random.randn(3, 20)
+        b = np.random.randn(3, 4)
+        a = np.hstack((np.ones((3, 1)), 0.1 * np.random.randn(3, 2)))
+        for aa in [a, a[:, :1]]:
+            out = np.empty((3, 20))
+            y = self.func(b, aa, x, out=out)
+            assert y is out
+            assert_array_almost_equal(y, self.func(b, aa, x))
+
+        out = np.empty((3, 20))
+        y, zf = self.func(b, a, x, zi=np.zeros((3, 3)), out=out)
+        assert y is out
+        assert_array_almost_equal(y, self.func(b, a, x))
+
+        self.assertRaises(ValueError, self.func, b, a, x,
+                          out=np.empty((3, 20), np.float32))
+        self.assertRaises(ValueError, self.func, b, a, x,
+                          out=np.empty((20, 3)).T)
+        self.assertRaises(ValueError, self.func, b, a, x,
+                          out=np.empty((3, 21)))
+
+        # In place filtering is not supported: the kernels read x after
+        # writing out
+        for aa in [a, a[:, :1]]:
+            self.assertRaises(ValueError, self.func, b, aa, x, out=x)
+        self.assertRaises(ValueError, self.func, b, a, x, zi=np.zeros((3, 3)),
+                          out=x)
+        xb = np.random.randn(3, 20)
+        self.assertRaises(ValueError, self.func, xb[:, :4], a, xb, out=xb)
+
+    def test_zero_gain(self):
+        x = np.random.randn(2, 10)
+        b = np.random.randn(2, 2)
+        self.assertRaises(ValueError, self.func, b, np.zeros((2, 3)), x)
+
+    def test_n_jobs(self):
+        """Test the rows split over several threads, with every kernel."""
+        x = np.random.randn(13, 40)
+        b = np.random.randn(13, 5)
+        for a in [np.ones((13, 1)),
+                  np.hstack((np.ones((13, 1)), 0.1 * np.random.randn(13, 2)))]:
+            ref = self.func(b, a, x)
+            zi = np.random.randn(13, 4)
+            yz, zf = self.func(b, a, x, zi=zi)
+            for n_jobs in [2, 3, -1, 20]:
+                assert_array_almost_equal(self.func(b, a, x, n_jobs=n_jobs),
+                                          ref)
+                y, z = self.func(b, a, x, zi=zi, n_jobs=n_jobs)
+                assert_array_almost_equal(y, yz)
+                assert_array_almost_equal(z, zf)
@@ -0,0 +1,49 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_almost_equal
+
+from scipy.fftpack import fft, ifft, rfft, irfft
+
+from scikits.talkbox.tools.fftutils import rfft_onesided, rfft_power, \
+                                           rfft_magnitude, irfft_power, \
+                                           rfft_multiply
+
+class TestRealFFT(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(3, 20)
+
+    def _check(self, nfft):
+        y = fft(self.x, nfft)[:, :nfft / 2 + 1]
+        assert_array_almost_equal(rfft_onesided(self.x, nfft), y)
+        assert_array_almost_equal(rfft_power(self.x, nfft), np.abs(y) ** 2)
+        assert_array_almost_equal(rfft_magnitude(self.x, nfft), np.abs(y))
+
+    def test_even(self):
+        self._check(32)
+
+    def test_odd(self):
+        self._check(33)
+
+    def test_rank1(self):
+        x = self.x[0]
+        assert_array_almost_equal(rfft_power(x, 64),
+                                  np.abs(fft(x, 64)[:33]) ** 2)
+
+    def test_irfft_power(self):
+        for nfft in [64, 63]:
+            ref = np.real(ifft(np.abs(fft(self.x, nfft)) ** 2))
+            assert_array_almost_equal(irfft_power(rfft_power(self.x, nfft),
+                                                  nfft), ref)
+
+    def test_rfft_multiply(self):
+        """Test the product of packed spectra against a circular
+        convolution."""
+        h = np.random.randn(5)
+        for nfft in [32, 33]:
+            ref = np.real(ifft(fft(self.x, nfft) * fft(h, nfft)))
+            y = rfft_multiply(rfft(self.x, nfft), rfft(h, nfft), nfft)
+            assert_array_almost_equal(irfft(y), ref)
+            # In place
+            y = rfft(self.x, nfft)
+            rfft_multiply(y, rfft(h, nfft), nfft, out=y)
+            assert_array_almost_equal(irfft(y), ref)
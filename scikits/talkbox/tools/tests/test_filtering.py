@@ -0,0 +1,142 @@
+import numpy as np
+from numpy.testing import TestCase, assert_array_almost_equal
+
+from scipy.signal import lfilter
+
+from scikits.talkbox.tools.filtering import BlockFilter, fftfilt, slfilter
+
+class TestFftfilt(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(4, 3000)
+        self.b = np.random.randn(4, 60)
+
+    def _ref(self, b, x):
+        return np.array([lfilter(b[i], 1., x[i]) for i in range(x.shape[0])])
+
+    def test_per_row(self):
+        assert_array_almost_equal(fftfilt(self.b, self.x),
+                                  self._ref(self.b, self.x))
+
+    def test_shared(self):
+        y = fftfilt(self.b[0], self.x)
+        assert_array_almost_equal(y, lfilter(self.b[0], 1., self.x))
+
+    def test_rank1(self):
+        y = fftfilt(self.b[0], self.x[0])
+        assert y.shape == (3000,)
+        assert_array_almost_equal(y, lfilter(self.b[0], 1., self.x[0]))
+
+    def test_nfft(self):
+        """Test every block size, including odd ones and a single tap per
+        block, and signals shorter than the filter."""
+        ref = self._ref(self.b, self.x)
+        for nfft in [60, 61, 64, 127, 4096, 8192]:
+            assert_array_almost_equal(fftfilt(self.b, self.x, nfft), ref)
+        x = self.x[:, :10]
+        assert_array_almost_equal(fftfilt(self.b, x), self._ref(self.b, x))
+
+    def test_chunks(self):
+        """Test signals longer than one chunk of blocks."""
+        x = np.random.randn(2 ** 19 + 17)
+        assert_array_almost_equal(fftfilt(self.b[0], x),
+                                  lfilter(self.b[0], 1., x))
+
+    def test_float32(self):
+        y = fftfilt(self.b.astype(np.float32), self.x.astype(np.float32))
+        assert y.dtype == np.float32
+        assert_array_almost_equal(y, self._ref(self.b, self.x), 4)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, fftfilt, self.b[:3], self.x)
+        self.assertRaises(ValueError, fftfilt, self.b, self.x, 32)
+        self.assertRaises(ValueError, fftfilt, self.b, self.x + 1j)
+
+class TestSlfilterMethod(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(4, 3000)
+        self.b = np.random.randn(4, 101)
+        self.a = 2 * np.ones((4, 1))
+
+    def test_methods(self):
+        ref = slfilter(self.b, self.a, self.x, method='direct')
+        for method in ['fft', 'auto']:
+            y = slfilter(self.b, self.a, self.x, method=method)
+            assert_array_almost_equal(y, ref)
+            out = np.empty_like(self.x)
+            assert slfilter(self.b, self.a, self.x, method=method,
+                            out=out) is out
+            assert_array_almost_equal(out, ref)
+            x = self.x.copy()
+            self.assertRaises(ValueError, slfilter, self.b, self.a, x,
+                              method=method, out=x)
+
+    def test_iir(self):
+        """Test 'auto' falls back on the direct filter for IIR filters."""
+        a = np.hstack((np.ones((4, 1)), 0.1 * np.random.randn(4, 2)))
+        y = slfilter(self.b, a, self.x)
+        for i in range(4):
+            assert_array_almost_equal(y[i], lfilter(self.b[i], a[i],
+                                                    self.x[i]))
+        self.assertRaises(ValueError, slfilter, self.b, a, self.x,
+                          method='fft')
+        self.assertRaises(ValueError, slfilter, self.b, self.a, self.x,
+                          zi=np.zeros((4, 100)), method='fft')
+
+    def test_dtype(self):
+        y = slfilter(self.b, self.a, self.x, dtype=np.float32, method='fft')
+        assert y.dtype == np.float32
+        self.assertRaises(ValueError, slfilter, self.b, self.a, self.x,
+                          method='foo')
+
+class TestBlockFilter(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(100, 300)
+
+    def _push_blocks(self, filt, sizes):
+        bounds = np.cumsum([0] + sizes)
+        return np.hstack([filt.push(self.x[:, bounds[i]:bounds[i+1]])
+                          for i in range(len(sizes))])
+
+    def test_shared(self):
+        """Test a filter shared by every channel against lfilter."""
+        b = [1, -0.97]
+        a = [1, -0.5, 0.2]
+        filt = BlockFilter(b, a, 100)
+        y = self._push_blocks(filt, [1, 50, 0, 128, 121])
+        assert_array_almost_equal(y, lfilter(b, a, self.x, axis=-1))
+
+    def test_per_channel(self):
+        b = np.random.randn(100, 4)
+        a = np.hstack((np.ones((100, 1)), 0.1 * np.random.randn(100, 2)))
+        filt = BlockFilter(b, a, 100)
+        y = self._push_blocks(filt, [30, 70, 200])
+        for i in range(100):
+            assert_array_almost_equal(y[i], lfilter(b[i], a[i], self.x[i]))
+
+    def test_n_jobs(self):
+        b = [1, -0.97]
+        a = [1, -0.5, 0.2]
+        filt = BlockFilter(b, a, 100, n_jobs=3)
+        y = self._push_blocks(filt, [100, 200])
+        assert_array_almost_equal(y, lfilter(b, a, self.x, axis=-1))
+
+    def test_reset(self):
+        filt = BlockFilter([1, 0.5], [1], 100)
+        y = filt.push(self.x)
+        filt.reset()
+        assert_array_almost_equal(filt.push(self.x), y)
+
+    def test_float32(self):
+        filt = BlockFilter([1, -0.97], [1, -0.5], 100, dtype=np.float32)
+        y = filt.push(self.x)
+        assert y.dtype == np.float32
+        assert_array_almost_equal(y, lfilter([1, -0.97], [1, -0.5], self.x),
+                                  5)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, BlockFilter, np.ones((3, 2)), [1], 100)
+        filt = BlockFilter([1, 0.5], [1], 100)
+        self.assertRaises(ValueError, filt.push, self.x[:10])
@@ -0,0 +1,109 @@
+import threading
+import multiprocessing
+
+import numpy as np
+from numpy.testing import TestCase, assert_array_equal
+
+from scikits.talkbox.tools import parallel
+from scikits.talkbox.tools.parallel import effective_n_jobs, map_row_blocks
+
+def _double_rows(x):
+    return map_row_blocks(lambda b: b * 2, x, 2)
+
+class TestParallel(TestCase):
+    def test_effective_n_jobs(self):
+        ncpu = multiprocessing.cpu_count()
+        assert effective_n_jobs(1) == 1
+        assert effective_n_jobs(3) == 3
+        assert effective_n_jobs(-1) == ncpu
+        assert effective_n_jobs(-ncpu - 10) == 1
+        self.assertRaises(ValueError, effective_n_jobs, 0)
+
+    def test_map_row_blocks(self):
+        x = np.random.randn(10, 3)
+        for n_jobs in [1, 2, 3, 4, 20, -1]:
+            y = map_row_blocks(lambda b: b * 2, x, n_jobs)
+            assert_array_equal(y, x * 2)
+
+            y = map_row_blocks(lambda b: (b.sum(-1), b[:, :2]), x, n_jobs)
+            assert_array_equal(y[0], x.sum(-1))
+            assert_array_equal(y[1], x[:, :2])
+
+    def test_blocks(self):
+        """Test every row is processed exactly once, in contiguous blocks."""
+        x = np.arange(10)
+        sizes = map_row_blocks(lambda b: np.array([b.size]), x, 3)
+        assert_array_equal(sizes, [3, 3, 4])
+
+    def test_out(self):
+        x = np.random.randn(10, 3)
+        for n_jobs in [1, 2, 3, 20]:
+            out = (np.empty((10, 3)), np.empty(10))
+            def func(b, y, s):
+                y[:] = 2 * b
+                s[:] = b.sum(-1)
+            y = map_row_blocks(func, x, n_jobs, out=out)
+            assert y[0] is out[0] and y[1] is out[1]
+            assert_array_equal(y[0], x * 2)
+            assert_array_equal(y[1], x.sum(-1))
+
+    def test_more_threads_than_cpus(self):
+        """Test n_jobs > cpu_count() runs n_jobs threads at once."""
+        n = multiprocessing.cpu_count() + 2
+        lock = threading.Lock()
+        started = [0]
+        all_started = threading.Event()
+        def func(b):
+            # Every block waits for the others: this only completes if the n
+            # blocks run concurrently
+            lock.acquire()
+            started[0] += 1
+            if started[0] == n:
+                all_started.set()
+            lock.release()
+            all_started.wait(10)
+            return np.array([all_started.is_set()])
+        assert map_row_blocks(func, np.arange(n), n).all()
+
+    def test_growth(self):
+        """Test a pool in use is not closed when a larger one is needed."""
+        pool = parallel._acquire_pool(1)
+        try:
+            n = parallel._pool_size + 1
+            x = np.arange(n)
+            assert_array_equal(map_row_blocks(lambda b: b * 2, x, n), x * 2)
+            assert parallel._pool is not pool
+            assert_array_equal(pool.map(lambda b: b * 2, x), x * 2)
+        finally:
+            parallel._release_pool(pool)
+
+    def test_concurrent_growth(self):
+        """Test concurrent calls while the pool grows."""
+        x = np.random.randn(40, 3)
+        errors = []
+        def run(n_jobs):
+            try:
+                for i in range(20):
+                    y = map_row_blocks(lambda b: b * 2, x, n_jobs + i)
+                    assert_array_equal(y, x * 2)
+            except Exception, e:
+                errors.append(e)
+        threads = [threading.Thread(target=run, args=(n_jobs,))
+                   for n_jobs in range(2, 10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+
+    def test_fork(self):
+        """Test threaded functions work in a forked worker once the pool
+        exists in the parent."""
+        x = np.random.randn(10, 3)
+        _double_rows(x)
+        pool = multiprocessing.Pool(1)
+        try:
+            y = pool.apply_async(_double_rows, (x,)).get(10)
+        finally:
+            pool.terminate()
+        assert_array_equal(y, x * 2)